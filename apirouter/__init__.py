@@ -1,6 +1,14 @@
 from .decorators import route, view
 from .request import Request
-from .response import JsonResponse, Response
+from .response import JsonResponse, Response, StreamingJsonResponse
 from .routing import APIRouter
 
-__all__ = ["route", "view", "Request", "JsonResponse", "Response", "APIRouter"]
+__all__ = [
+    "route",
+    "view",
+    "Request",
+    "JsonResponse",
+    "Response",
+    "StreamingJsonResponse",
+    "APIRouter",
+]
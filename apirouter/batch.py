@@ -0,0 +1,220 @@
+import asyncio
+import logging
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.http import Http404, HttpRequest, QueryDict
+from django.http.response import HttpResponseBase
+from django.urls.resolvers import Resolver404, ResolverMatch, RoutePattern, URLResolver
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+
+from apirouter.exceptions import APIException
+from apirouter.json_backends import get_json_backend
+from apirouter.request import Request
+from apirouter.sse import EventStreamResponse
+
+if TYPE_CHECKING:
+    from apirouter.routing import APIRouter  # pragma: no cover
+
+logger = logging.getLogger("apirouter")
+
+BATCH_METHODS = ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE")
+
+# Attributes set on request by middleware, shared with sub-requests
+SHARED_REQUEST_ATTRIBUTES = ("user", "auth", "session", "csrf_processing_done")
+
+# Parent request META not passed to sub-requests, sub-responses are embedded
+# in the batch response, so they must be uncompressed JSON
+SUB_REQUEST_EXCLUDED_META = (
+    "CONTENT_TYPE",
+    "CONTENT_LENGTH",
+    "QUERY_STRING",
+    "HTTP_ACCEPT",
+    "HTTP_ACCEPT_ENCODING",
+)
+
+SubRequest = Tuple[HttpRequest, Optional[ResolverMatch]]
+
+
+class Batch:
+    """
+    Batch endpoint, executing router sub-requests in one HTTP request.
+
+    Sub-requests `{"method": ..., "path": ..., "body": ...}` are resolved against
+    router URL patterns, with paths relative to the router mount point, and
+    dispatched to route handlers in-process, without running middleware.
+    Each sub-request errors are handled separately by router exception handler.
+    """
+
+    def __init__(
+        self,
+        router: "APIRouter",
+        path: str,
+        max_requests: int = 20,
+        concurrent: bool = False,
+    ):
+        self.router = router
+        self.path = path
+        self.max_requests = max_requests
+        self.concurrent = concurrent
+
+    @cached_property
+    def resolver(self) -> URLResolver:
+        return URLResolver(RoutePattern(""), self.router.urls)
+
+    def view(self) -> Callable:
+        """
+        Make batch view, async when sub-requests are executed concurrently.
+        """
+        if self.concurrent:
+
+            async def async_batch(request: Any) -> List[dict]:
+                sub_requests = self.parse(request)
+                return list(
+                    await asyncio.gather(
+                        *(self.async_call(sub, match) for sub, match in sub_requests)
+                    )
+                )
+
+            return async_batch
+
+        def batch(request: Any) -> List[dict]:
+            return [self.call(sub, match) for sub, match in self.parse(request)]
+
+        return batch
+
+    def parse(self, request: Any) -> List[SubRequest]:
+        if isinstance(request, Request):
+            payload = request.json()
+        else:
+            try:
+                payload = get_json_backend().loads(request.body)
+            except ValueError:
+                raise APIException(
+                    status_code=HTTPStatus.BAD_REQUEST, detail=_("Invalid JSON body.")
+                )
+        if not isinstance(payload, list) or not all(
+            isinstance(item, dict) for item in payload
+        ):
+            raise APIException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail=_("Batch body must be a list of request objects."),
+            )
+        if len(payload) > self.max_requests:
+            raise APIException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail=_("Batch is limited to %d requests.") % self.max_requests,
+            )
+        parent = getattr(request, "_request", request)
+        return [self.make_request(parent, item) for item in payload]
+
+    def make_request(self, parent: HttpRequest, item: dict) -> SubRequest:
+        method = str(item.get("method", "GET")).upper()
+        path, separator, query_string = str(item.get("path", "")).partition("?")
+
+        request = HttpRequest()
+        request.method = method
+        request.path = request.path_info = "/" + path.lstrip("/")
+        request.META = {
+            key: value
+            for key, value in parent.META.items()
+            if key not in SUB_REQUEST_EXCLUDED_META
+        }
+        request.META.update(REQUEST_METHOD=method, QUERY_STRING=query_string)
+        request.GET = QueryDict(query_string)
+        request.COOKIES = parent.COOKIES
+        for name in SHARED_REQUEST_ATTRIBUTES:
+            if hasattr(parent, name):
+                setattr(request, name, getattr(parent, name))
+        body = b""
+        if item.get("body") is not None:
+            body = get_json_backend().dumps(item["body"])
+            request.META.update(
+                CONTENT_TYPE="application/json", CONTENT_LENGTH=str(len(body))
+            )
+        # Sub-requests without body read an empty one, like parsed requests
+        request._body = body  # type: ignore
+        request._read_started = False  # type: ignore
+
+        if method not in BATCH_METHODS:
+            return request, None
+        try:
+            match = self.resolver.resolve(request.path_info.lstrip("/"))
+        except Resolver404:
+            return request, None
+        if match.route == self.path:
+            # Nested batches are not allowed
+            return request, None
+        request.resolver_match = match
+        return request, match
+
+    def call(self, request: HttpRequest, match: Optional[ResolverMatch]) -> dict:
+        if match is None:
+            return self.render(self.not_found(request))
+        view = match.func
+        if asyncio.iscoroutinefunction(view):
+            view = async_to_sync(view)
+        try:
+            response = view(request, *match.args, **match.kwargs)
+        except Exception:
+            return self.server_error(request)
+        return self.render(response)
+
+    async def async_call(
+        self, request: HttpRequest, match: Optional[ResolverMatch]
+    ) -> dict:
+        if match is None:
+            response = self.router.exception_handler(request, Http404())
+            if asyncio.iscoroutine(response):
+                response = await response
+            return self.render(response)
+        try:
+            if asyncio.iscoroutinefunction(match.func):
+                response = await match.func(request, *match.args, **match.kwargs)
+            else:
+                response = await sync_to_async(match.func)(
+                    request, *match.args, **match.kwargs
+                )
+        except Exception:
+            return self.server_error(request)
+        return self.render(response)
+
+    def not_found(self, request: HttpRequest) -> HttpResponseBase:
+        exception_handler = self.router.exception_handler
+        if asyncio.iscoroutinefunction(exception_handler):
+            exception_handler = async_to_sync(exception_handler)
+        return exception_handler(request, Http404())
+
+    def server_error(self, request: HttpRequest) -> dict:
+        logger.exception("Batch sub-request error: %s %s", request.method, request.path)
+        return {
+            "status": int(HTTPStatus.INTERNAL_SERVER_ERROR),
+            "headers": {},
+            "body": {"detail": HTTPStatus.INTERNAL_SERVER_ERROR.phrase},
+        }
+
+    def render(self, response: HttpResponseBase) -> dict:
+        if isinstance(response, EventStreamResponse):
+            # Event streams are endless, they can't be collected to a result
+            return {
+                "status": int(HTTPStatus.BAD_REQUEST),
+                "headers": {},
+                "body": {"detail": _("Event stream routes can't be batched.")},
+            }
+        if response.streaming:
+            content = b"".join(response.streaming_content)  # type: ignore
+        else:
+            content = response.content  # type: ignore
+        body: Any = None
+        if content:
+            if response.get("Content-Type", "").startswith("application/json"):
+                body = get_json_backend().loads(content)
+            else:
+                body = content.decode(response.charset)
+        return {
+            "status": response.status_code,
+            "headers": dict(response.items()),
+            "body": body,
+        }
@@ -0,0 +1,119 @@
+import codecs
+import json
+from http import HTTPStatus
+from typing import Any, Callable, Iterator, Optional
+
+from django.http import HttpRequest
+from django.utils.translation import gettext_lazy as _
+
+from apirouter.exceptions import APIException
+from apirouter.utils import check_request
+
+_decoder = json.JSONDecoder()
+
+_WHITESPACE = " \t\n\r"
+
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+def invalid_json() -> APIException:
+    return APIException(
+        status_code=HTTPStatus.BAD_REQUEST, detail=_("Invalid JSON body.")
+    )
+
+
+def iter_json_items(
+    read: Callable[[int], bytes], chunk_size: int = 65536
+) -> Iterator[Any]:
+    """
+    Parse top-level JSON array items incrementally from `read(size)` callable.
+
+    Only the current item is kept in memory, read size grows while an item
+    doesn't fit the buffer, so large items are not re-parsed too often.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def fill(size: int) -> bool:
+        nonlocal buffer, position, eof
+        if eof:
+            return False
+        chunk = read(size)
+        if not chunk:
+            eof = True
+            buffer = buffer[position:] + decoder.decode(b"", final=True)
+        else:
+            buffer = buffer[position:] + decoder.decode(chunk)
+        position = 0
+        return True
+
+    def next_char() -> str:
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not fill(chunk_size):
+                raise invalid_json()
+
+    try:
+        if next_char() != "[":
+            raise invalid_json()
+        position += 1
+        if next_char() == "]":
+            position += 1
+        else:
+            while True:
+                next_char()
+                while True:
+                    try:
+                        item, end = _decoder.raw_decode(buffer, position)
+                    except ValueError:
+                        item, end = None, -1
+                    # Item must be followed by a delimiter, numbers may be cut
+                    if end >= 0 and (
+                        eof or (end < len(buffer) and buffer[end] in _DELIMITERS)
+                    ):
+                        break
+                    if not fill(max(chunk_size, len(buffer))):
+                        raise invalid_json()
+                position = end
+                yield item
+                delimiter = next_char()
+                position += 1
+                if delimiter == "]":
+                    break
+                if delimiter != ",":
+                    raise invalid_json()
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position < len(buffer):
+                raise invalid_json()
+            if not fill(chunk_size):
+                break
+    except UnicodeDecodeError:
+        raise invalid_json()
+
+
+def limit_body_size(
+    view: Callable, max_body_size: int, exception_handler: Callable
+) -> Callable:
+    """
+    Wrap view rejecting requests with `Content-Length` over `max_body_size`
+    bytes with 413 response, before the body is read.
+    """
+
+    def check(request: HttpRequest) -> Optional[APIException]:
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > max_body_size:
+            return APIException(status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        return None
+
+    return check_request(view, check=check, exception_handler=exception_handler)
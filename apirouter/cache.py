@@ -0,0 +1,227 @@
+import asyncio
+import hashlib
+import time
+from functools import wraps
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import attr
+from asgiref.sync import sync_to_async
+from django.core.cache import DEFAULT_CACHE_ALIAS, BaseCache, caches
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.cache import has_vary_header
+
+from apirouter.conditional import check_not_modified
+
+CachedResponse = Tuple[int, List[Tuple[str, str]], bytes]
+
+# Responses varying by credentials aren't shared by clients, lower cased
+UNCACHEABLE_VARY_HEADERS = ("*", "cookie", "authorization")
+
+
+@attr.dataclass(frozen=True)
+class ResponseCache:
+    """
+    Route response cache options.
+
+    Responses are cached as encoded bytes in Django cache framework, keyed by
+    request path, resolved view kwargs, selected query parameters and vary headers.
+    `query_params=None` keys on all query parameters.
+
+    Responses of authenticated requests are cached per user, or per
+    `Authorization` header, unless `shared=True`. Responses varying by
+    `Cookie`, `Authorization` or `*` are not cached, unless the header is one
+    of `vary_headers`.
+    """
+
+    timeout: Optional[int] = 60
+    query_params: Optional[Sequence[str]] = None
+    vary_headers: Sequence[str] = ()
+    methods: Sequence[str] = ("GET", "HEAD")
+    cache_alias: str = DEFAULT_CACHE_ALIAS
+    key_prefix: str = "apirouter"
+    lock_timeout: float = 10
+    lock_poll_interval: float = 0.01
+    shared: bool = False
+
+    @property
+    def cache(self) -> BaseCache:
+        return caches[self.cache_alias]
+
+    def version_key(self, route_id: str) -> str:
+        return f"{self.key_prefix}:version:{route_id}"
+
+    def make_key(
+        self, request: HttpRequest, route_id: str, kwargs: dict, variant: str = ""
+    ) -> str:
+        """
+        Make response cache key, including current route version and response
+        variant, e.g. content encoding.
+        """
+        version = self.cache.get(self.version_key(route_id), 0)
+        query = request.GET
+        if self.query_params is None:
+            params = sorted(query.lists())
+        else:
+            params = [(name, query.getlist(name)) for name in self.query_params]
+        headers = [request.headers.get(name) for name in self.vary_headers]
+        parts: Tuple[Any, ...] = (
+            request.method,
+            request.path,
+            sorted(kwargs.items()),
+            params,
+            headers,
+            None if self.shared else self.credentials(request),
+        )
+        if variant:
+            parts += (variant,)
+        digest = hashlib.sha256(repr(parts).encode()).hexdigest()
+        return f"{self.key_prefix}:{route_id}:{version}:{digest}"
+
+    def credentials(self, request: HttpRequest) -> Optional[str]:
+        """
+        Get requesting user cache key part, `None` for anonymous requests.
+        """
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return f"user:{user.pk}"
+        authorization = request.headers.get("Authorization")
+        if authorization:
+            return "authorization:" + hashlib.sha256(authorization.encode()).hexdigest()
+        return None
+
+    def is_cacheable(self, response: HttpResponseBase) -> bool:
+        if (
+            response.status_code != 200
+            or response.streaming
+            or response.cookies
+            or "private" in response.get("Cache-Control", "")
+        ):
+            return False
+        vary_headers = {header.lower() for header in self.vary_headers}
+        return not any(
+            has_vary_header(response, header)
+            for header in UNCACHEABLE_VARY_HEADERS
+            if header not in vary_headers
+        )
+
+    def evict(self, route_id: str) -> None:
+        """
+        Evict all cached responses of the route by bumping route version.
+        """
+        key = self.version_key(route_id)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.set(key, 1, None)
+
+    def get(self, key: str) -> Optional[HttpResponse]:
+        cached: Optional[CachedResponse] = self.cache.get(key)
+        if cached is None:
+            return None
+        status, headers, content = cached
+        response = HttpResponse(content, status=status)
+        for name, value in headers:
+            response[name] = value
+        return response
+
+    def set(self, key: str, response: HttpResponseBase) -> None:
+        if not self.is_cacheable(response):
+            return
+        cached: CachedResponse = (
+            response.status_code,
+            list(response.items()),
+            response.content,  # type: ignore
+        )
+        self.cache.set(key, cached, self.timeout)
+
+    def lock(self, key: str) -> bool:
+        """
+        Acquire response recompute lock, only one client recomputes expired key.
+        """
+        return self.cache.add(f"{key}:lock", 1, self.lock_timeout)
+
+    def locked(self, key: str) -> bool:
+        return self.cache.get(f"{key}:lock") is not None
+
+    def unlock(self, key: str) -> None:
+        self.cache.delete(f"{key}:lock")
+
+
+def cache_response(
+    view: Callable,
+    cache: ResponseCache,
+    route_id: str,
+    variants: Sequence[Callable[[HttpRequest], str]] = (),
+) -> Callable:
+    """
+    Wrap view with response cache.
+
+    Concurrent misses of the same key wait for the first client to recompute
+    the response instead of running the view in parallel. `variants` functions
+    select separately cached response variant, e.g. content encoding. Cached
+    responses with ETag matching `If-None-Match` respond 304.
+    """
+
+    def make_key(request: HttpRequest, kwargs: dict) -> str:
+        variant = ":".join(get_variant(request) for get_variant in variants)
+        return cache.make_key(request, route_id, kwargs, variant=variant)
+
+    if asyncio.iscoroutinefunction(view):
+
+        def lookup(request: HttpRequest, kwargs: dict) -> Tuple[str, Any]:
+            key = make_key(request, kwargs)
+            return key, cache.get(key)
+
+        # Django cache API is blocking, it's called in worker threads
+        async_lookup = sync_to_async(lookup, thread_sensitive=False)
+        get = sync_to_async(cache.get, thread_sensitive=False)
+        lock = sync_to_async(cache.lock, thread_sensitive=False)
+        locked = sync_to_async(cache.locked, thread_sensitive=False)
+        set_response = sync_to_async(cache.set, thread_sensitive=False)
+        unlock = sync_to_async(cache.unlock, thread_sensitive=False)
+
+        @wraps(view)
+        async def async_cached_view(request: HttpRequest, *args, **kwargs) -> Any:
+            if request.method not in cache.methods:
+                return await view(request, *args, **kwargs)
+            key, response = await async_lookup(request, kwargs)
+            deadline = time.monotonic() + cache.lock_timeout
+            while response is None and not await lock(key):
+                if time.monotonic() > deadline or not await locked(key):
+                    return await view(request, *args, **kwargs)
+                await asyncio.sleep(cache.lock_poll_interval)
+                response = await get(key)
+            if response is not None:
+                return check_not_modified(request, response)
+            try:
+                response = await view(request, *args, **kwargs)
+                await set_response(key, response)
+            finally:
+                await unlock(key)
+            return response
+
+        return async_cached_view
+
+    @wraps(view)
+    def cached_view(request: HttpRequest, *args, **kwargs) -> Any:
+        if request.method not in cache.methods:
+            return view(request, *args, **kwargs)
+        key = make_key(request, kwargs)
+        response = cache.get(key)
+        deadline = time.monotonic() + cache.lock_timeout
+        while response is None and not cache.lock(key):
+            if time.monotonic() > deadline or not cache.locked(key):
+                return view(request, *args, **kwargs)
+            time.sleep(cache.lock_poll_interval)
+            response = cache.get(key)
+        if response is not None:
+            return check_not_modified(request, response)
+        try:
+            response = view(request, *args, **kwargs)
+            cache.set(key, response)
+        finally:
+            cache.unlock(key)
+        return response
+
+    return cached_view
@@ -0,0 +1,166 @@
+import asyncio
+import zlib
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence
+
+import attr
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+class _BrotliCompressor:
+    def __init__(self):
+        self._compressor = brotli.Compressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _gzip_compressor() -> Any:
+    return zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+
+# Compressor factories by content coding, compressors provide
+# `compress(data)` and `flush()` methods
+COMPRESSORS: Dict[str, Callable[[], Any]] = {"gzip": _gzip_compressor}
+if brotli is not None:  # pragma: no cover
+    COMPRESSORS["br"] = _BrotliCompressor
+if zstandard is not None:  # pragma: no cover
+    COMPRESSORS["zstd"] = lambda: zstandard.ZstdCompressor().compressobj()
+
+
+@lru_cache(maxsize=256)
+def negotiate_encoding(accept_encoding: str, encodings: Sequence[str]) -> Optional[str]:
+    """
+    Select the first server preferred encoding accepted by `Accept-Encoding`.
+    """
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    for encoding in encodings:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+def compress_sequence(compressor: Any, sequence: Iterable[bytes]) -> Iterator[bytes]:
+    for chunk in sequence:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+@attr.dataclass(frozen=True)
+class Compression:
+    """
+    Route response compression options.
+
+    `encodings` are content codings in server preference order, unavailable
+    codings (`br` needs `brotli`, `zstd` needs `zstandard`) are skipped.
+    Responses smaller than `min_size` bytes are not compressed.
+    """
+
+    encodings: Sequence[str] = ("br", "zstd", "gzip")
+    min_size: int = 500
+    exclude_content_types: Sequence[str] = ("text/event-stream",)
+
+    def __attrs_post_init__(self):
+        encodings = tuple(
+            encoding for encoding in self.encodings if encoding in COMPRESSORS
+        )
+        object.__setattr__(self, "encodings", encodings)
+
+    def negotiate(self, request: HttpRequest) -> Optional[str]:
+        accept_encoding = request.META.get("HTTP_ACCEPT_ENCODING")
+        if not accept_encoding:
+            return None
+        return negotiate_encoding(accept_encoding, self.encodings)  # type: ignore
+
+    def cache_variant(self, request: HttpRequest) -> str:
+        """
+        Get response cache variant, compressed responses are cached per encoding.
+        """
+        return self.negotiate(request) or ""
+
+    def compress(
+        self, request: HttpRequest, response: HttpResponseBase
+    ) -> HttpResponseBase:
+        """
+        Compress response with negotiated encoding.
+        """
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if response.has_header("Content-Encoding") or response.get(
+            "Content-Type", ""
+        ).startswith(tuple(self.exclude_content_types)):
+            return response
+        encoding = self.negotiate(request)
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = compress_sequence(  # type: ignore
+                COMPRESSORS[encoding](), response.streaming_content  # type: ignore
+            )
+            if response.has_header("Content-Length"):
+                del response["Content-Length"]
+        else:
+            content = response.content  # type: ignore
+            if len(content) < self.min_size:
+                return response
+            compressor = COMPRESSORS[encoding]()
+            compressed = compressor.compress(content) + compressor.flush()
+            if len(compressed) >= len(content):
+                return response
+            response.content = compressed  # type: ignore
+            response["Content-Length"] = str(len(compressed))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            # Compressed content isn't byte equal, like `GZipMiddleware`
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = encoding
+        return response
+
+
+def compress_view(view: Callable, compression: Compression) -> Callable:
+    """
+    Wrap view with response compression.
+    """
+    if asyncio.iscoroutinefunction(view):
+
+        @wraps(view)
+        async def async_compressed_view(request: HttpRequest, *args, **kwargs):
+            response = await view(request, *args, **kwargs)
+            return compression.compress(request, response)
+
+        return async_compressed_view
+
+    @wraps(view)
+    def compressed_view(request: HttpRequest, *args, **kwargs) -> Any:
+        return compression.compress(request, view(request, *args, **kwargs))
+
+    return compressed_view
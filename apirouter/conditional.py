@@ -0,0 +1,121 @@
+import asyncio
+import hashlib
+from functools import wraps
+from typing import Any, Callable, Optional, Sequence
+
+from django.http import HttpRequest, HttpResponseNotModified
+from django.http.response import HttpResponseBase
+from django.utils.http import parse_etags, quote_etag
+
+from apirouter.utils import removeprefix
+
+CONDITIONAL_METHODS = ("GET", "HEAD")
+
+
+def make_etag(content: bytes) -> str:
+    """
+    Make strong ETag from response content.
+    """
+    return quote_etag(hashlib.blake2b(content, digest_size=16).hexdigest())
+
+
+def etag_matches(request: HttpRequest, etag: str) -> bool:
+    """
+    Check `If-None-Match` request header against ETag using weak comparison.
+    """
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    etag = removeprefix(etag, prefix="W/")
+    return "*" in etags or any(removeprefix(tag, prefix="W/") == etag for tag in etags)
+
+
+def not_modified(etag: str) -> HttpResponseNotModified:
+    response = HttpResponseNotModified()
+    response["ETag"] = etag
+    return response
+
+
+def check_not_modified(
+    request: HttpRequest, response: HttpResponseBase
+) -> HttpResponseBase:
+    """
+    Respond 304 if client has ETag of the ready response, e.g. a cached one.
+    """
+    etag = response.get("ETag")
+    if (
+        etag
+        and request.method in CONDITIONAL_METHODS
+        and response.status_code == 200
+        and etag_matches(request, etag)
+    ):
+        return not_modified(etag)
+    return response
+
+
+def set_etag(request: HttpRequest, response: HttpResponseBase) -> HttpResponseBase:
+    """
+    Set content based ETag on response, responding 304 if client has it.
+    """
+    if (
+        request.method not in CONDITIONAL_METHODS
+        or response.status_code != 200
+        or response.streaming
+        or response.has_header("ETag")
+    ):
+        return response
+    etag = make_etag(response.content)  # type: ignore
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response["ETag"] = etag
+    return response
+
+
+def condition_etag_key(
+    view: Callable,
+    etag_key: Callable,
+    variants: Sequence[Callable[[HttpRequest], str]] = (),
+) -> Callable:
+    """
+    Wrap view with version key based ETag.
+
+    `etag_key(request, *args, **kwargs)` returns cheap resource version key,
+    matching `If-None-Match` responds 304 without running the view. `variants`
+    functions select response representation, e.g. content encoding, so each
+    representation gets its own strong ETag.
+    """
+
+    def get_etag(request: HttpRequest, *args, **kwargs) -> Optional[str]:
+        if request.method not in CONDITIONAL_METHODS:
+            return None
+        key = etag_key(request, *args, **kwargs)
+        if key is None:
+            return None
+        version = ":".join([str(key), *(variant(request) for variant in variants)])
+        return make_etag(version.encode())
+
+    def finalize(response: HttpResponseBase, etag: Optional[str]) -> Any:
+        if etag and response.status_code == 200:
+            response["ETag"] = etag
+        return response
+
+    if asyncio.iscoroutinefunction(view):
+
+        @wraps(view)
+        async def async_conditional_view(request: HttpRequest, *args, **kwargs):
+            etag = get_etag(request, *args, **kwargs)
+            if etag and etag_matches(request, etag):
+                return not_modified(etag)
+            return finalize(await view(request, *args, **kwargs), etag)
+
+        return async_conditional_view
+
+    @wraps(view)
+    def conditional_view(request: HttpRequest, *args, **kwargs):
+        etag = get_etag(request, *args, **kwargs)
+        if etag and etag_matches(request, etag):
+            return not_modified(etag)
+        return finalize(view(request, *args, **kwargs), etag)
+
+    return conditional_view
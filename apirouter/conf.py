@@ -1,13 +1,12 @@
-from typing import Any, Type
+from typing import TYPE_CHECKING, Any, Type
 
 from django.conf import settings
 from django.http import HttpResponse
 from django.utils.module_loading import import_string
 
-from apirouter.exception_handler import exception_handler as default_exception_handler
-from apirouter.request import Request
-from apirouter.response import JsonResponse
-from apirouter.types import ExceptionHandlerType, RequestType
+if TYPE_CHECKING:
+    from apirouter.json_backends import JSONBackend  # pragma: no cover
+    from apirouter.types import ExceptionHandlerType, RequestType  # pragma: no cover
 
 
 def import_setting(setting_name: str, default: Any) -> Any:
@@ -17,20 +16,36 @@ def import_setting(setting_name: str, default: Any) -> Any:
     return target
 
 
-def get_default_exception_handler() -> ExceptionHandlerType:
+def get_default_exception_handler() -> "ExceptionHandlerType":
     return import_setting(
         setting_name="APIROUTER_DEFAULT_EXCEPTION_HANDLER",
-        default=default_exception_handler,
+        default="apirouter.exception_handler.exception_handler",
     )
 
 
-def get_default_request_class() -> Type[RequestType]:
+def get_default_request_class() -> Type["RequestType"]:
     return import_setting(
-        setting_name="APIROUTER_DEFAULT_REQUEST_CLASS", default=Request
+        setting_name="APIROUTER_DEFAULT_REQUEST_CLASS",
+        default="apirouter.request.Request",
     )
 
 
 def get_default_response_class() -> Type[HttpResponse]:
     return import_setting(
-        setting_name="APIROUTER_DEFAULT_RESPONSE_CLASS", default=JsonResponse
+        setting_name="APIROUTER_DEFAULT_RESPONSE_CLASS",
+        default="apirouter.response.JsonResponse",
+    )
+
+
+def get_default_streaming_response_class() -> Type[HttpResponse]:
+    return import_setting(
+        setting_name="APIROUTER_DEFAULT_STREAMING_RESPONSE_CLASS",
+        default="apirouter.response.StreamingJsonResponse",
+    )
+
+
+def get_json_backend_class() -> Type["JSONBackend"]:
+    return import_setting(
+        setting_name="APIROUTER_JSON_BACKEND",
+        default="apirouter.json_backends.StdlibJSONBackend",
     )
@@ -1,21 +1,59 @@
+from functools import lru_cache
 from http import HTTPStatus
+from typing import Any, Optional
 
 from django.core.exceptions import PermissionDenied
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.http import Http404, HttpResponse
 
-from apirouter.exceptions import APIException
-from apirouter.response import JsonResponse
+from apirouter.exceptions import STATUS_PHRASES, APIException
+from apirouter.json_backends import get_json_backend
 from apirouter.types import RequestType
+from apirouter.utils import set_response_headers
 
 
-def exception_handler(request: RequestType, exc: Exception) -> HttpResponse:
-    if isinstance(exc, Http404):
-        exc = APIException(status_code=HTTPStatus.NOT_FOUND)
-    elif isinstance(exc, PermissionDenied):
-        exc = APIException(status_code=HTTPStatus.FORBIDDEN)
+@lru_cache(maxsize=1024)
+def encode_error(status_code: int, detail: str) -> bytes:
+    """
+    Encode error body, cached for string details.
+    """
+    return get_json_backend().dumps({"detail": detail})
+
+
+def error_response(
+    status_code: int, detail: Any = None, headers: Optional[dict] = None
+) -> HttpResponse:
+    """
+    Make JSON error response.
+
+    Bodies with default or other string details are encoded once, so common
+    errors only cost response construction.
+    """
+    if detail is None:
+        detail = STATUS_PHRASES[status_code]
+    if type(detail) is str:
+        content = encode_error(status_code, detail)
+    else:
+        content = get_json_backend().dumps({"detail": detail})
+    response = HttpResponse(
+        content, status=status_code, content_type="application/json"
+    )
+    set_response_headers(response, headers)
+    return response
 
+
+def exception_handler(request: RequestType, exc: Exception) -> HttpResponse:
     if isinstance(exc, APIException):
-        return JsonResponse(
-            {"detail": exc.detail}, status=exc.status_code, headers=exc.headers
-        )
+        return error_response(exc.status_code, exc.detail, exc.headers)
+    if isinstance(exc, Http404):
+        return error_response(HTTPStatus.NOT_FOUND)
+    if isinstance(exc, PermissionDenied):
+        return error_response(HTTPStatus.FORBIDDEN)
     raise exc
+
+
+@receiver(setting_changed)
+def _reset_error_bodies(*, setting: str, **kwargs) -> None:
+    if setting == "APIROUTER_JSON_BACKEND":
+        encode_error.cache_clear()
@@ -1,5 +1,7 @@
 import http
-from typing import Any, Optional
+from typing import Any, Dict, Optional
+
+STATUS_PHRASES: Dict[int, str] = {status: status.phrase for status in http.HTTPStatus}
 
 
 class APIException(Exception):
@@ -7,10 +9,13 @@ class APIException(Exception):
         self, status_code: int, detail: Any = None, headers: Optional[dict] = None
     ):
         if detail is None:
-            detail = http.HTTPStatus.__call__(status_code).phrase
+            try:
+                detail = STATUS_PHRASES[status_code]
+            except KeyError:
+                detail = http.HTTPStatus(status_code).phrase
         self.status_code = status_code
         self.detail = detail
         self.headers = headers
 
     def __str__(self):
-        return self.detail
+        return str(self.detail)
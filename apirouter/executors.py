@@ -0,0 +1,193 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Callable, Optional, Union
+
+import attr
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ImproperlyConfigured
+from django.db import close_old_connections
+from django.http import HttpRequest
+
+from apirouter.exceptions import APIException
+from apirouter.utils import check_request
+
+EXECUTORS = ("thread", "thread_sensitive")
+
+
+@attr.dataclass(frozen=True)
+class ThreadPoolStats:
+    """
+    Thread pool metrics snapshot.
+
+    `queued` calls wait for a free worker, `max_queued` is the queue depth
+    high watermark since the pool was created.
+    """
+
+    max_workers: int
+    max_queue: Optional[int]
+    active: int
+    queued: int
+    max_queued: int
+    completed: int
+    rejected: int
+
+
+class ThreadPool:
+    """
+    Bounded thread pool running sync views off the event loop under ASGI.
+
+    Worker threads are started on first use. With `max_queue` set, requests
+    arriving while all workers are busy and `max_queue` calls are already
+    waiting for a worker are rejected with 503 response.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 16,
+        max_queue: Optional[int] = None,
+        thread_name_prefix: str = "apirouter",
+    ):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._active = 0
+        self._queued = 0
+        self._max_queued = 0
+        self._completed = 0
+        self._rejected = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=self.thread_name_prefix,
+                    )
+        return self._executor
+
+    def stats(self) -> ThreadPoolStats:
+        with self._lock:
+            return ThreadPoolStats(
+                max_workers=self.max_workers,
+                max_queue=self.max_queue,
+                active=self._active,
+                queued=self._queued,
+                max_queued=self._max_queued,
+                completed=self._completed,
+                rejected=self._rejected,
+            )
+
+    def check(self, request: HttpRequest) -> Optional[APIException]:
+        """
+        Reject request if the pool queue is full.
+        """
+        if self.max_queue is None:
+            return None
+        if self._active + self._queued < self.max_workers + self.max_queue:
+            return None
+        with self._lock:
+            self._rejected += 1
+        return APIException(
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE, headers={"Retry-After": "1"}
+        )
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run `func` in a worker thread with the caller context variables.
+
+        Worker thread database connections are closed before and after the call
+        if they are unusable or older than `CONN_MAX_AGE`.
+        """
+        context = contextvars.copy_context()
+        dequeued = False
+
+        def dequeue() -> None:
+            nonlocal dequeued
+            if not dequeued:
+                dequeued = True
+                self._queued -= 1
+
+        def call() -> Any:
+            with self._lock:
+                dequeue()
+                self._active += 1
+            # Worker threads outlive requests, recycle their database
+            # connections like Django does around requests
+            close_old_connections()
+            try:
+                return context.run(func, *args, **kwargs)
+            finally:
+                close_old_connections()
+                with self._lock:
+                    self._active -= 1
+                    self._completed += 1
+
+        with self._lock:
+            self._queued += 1
+            self._max_queued = max(self._max_queued, self._queued)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, call)
+        finally:
+            # Call may be cancelled before a worker picks it up
+            with self._lock:
+                dequeue()
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+def offload_view(
+    view: Callable,
+    executor: Union[str, ThreadPool],
+    thread_pool: ThreadPool,
+    exception_handler: Callable,
+) -> Callable:
+    """
+    Make coroutine view running sync `view` in the given executor.
+
+    `"thread"` runs the view in router `thread_pool`, `"thread_sensitive"` in
+    the single thread shared with other thread sensitive code, like Django
+    does for sync views by default.
+    """
+    if executor == "thread_sensitive":
+        run = sync_to_async(view, thread_sensitive=True)
+
+        @functools.wraps(view)
+        async def thread_sensitive_view(request: HttpRequest, *args, **kwargs):
+            return await run(request, *args, **kwargs)
+
+        return thread_sensitive_view
+
+    if executor == "thread":
+        pool = thread_pool
+    elif isinstance(executor, ThreadPool):
+        pool = executor
+    elif executor == "process":
+        raise ImproperlyConfigured(
+            "Process executor is not supported, requests can't be passed to "
+            "other processes. Offload CPU bound work from the view instead."
+        )
+    else:
+        raise ImproperlyConfigured(
+            f"Invalid executor {executor!r}, expected one of {EXECUTORS} "
+            "or ThreadPool instance."
+        )
+
+    @functools.wraps(view)
+    async def offloaded_view(request: HttpRequest, *args, **kwargs):
+        return await pool.run(view, request, *args, **kwargs)
+
+    return check_request(
+        offloaded_view, check=pool.check, exception_handler=exception_handler
+    )
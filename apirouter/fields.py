@@ -0,0 +1,187 @@
+import asyncio
+from collections.abc import Iterator
+from functools import wraps
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import attr
+from django.db.models import QuerySet
+from django.db.models.query import ValuesIterable
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.utils.translation import gettext_lazy as _
+
+from apirouter.exceptions import APIException
+
+# Nested field names, `{"author": {"name": {}}}`, empty dictionary selects
+# the whole field
+FieldTree = Dict[str, Any]
+
+
+def parse_fields(value: str, separator: str = ",") -> FieldTree:
+    """
+    Parse fields list like `id,name,author.name` to fields tree.
+    """
+    tree: FieldTree = {}
+    for field in value.split(separator):
+        path = [name.strip() for name in field.split(".")]
+        if not all(path):
+            continue
+        node = tree
+        for index, name in enumerate(path):
+            if name in node and not node[name]:
+                # Whole field is already selected
+                break
+            if index == len(path) - 1:
+                node[name] = {}
+            else:
+                node = node.setdefault(name, {})
+    return tree
+
+
+def _lookup(tree: FieldTree, path: Sequence[str]) -> Optional[FieldTree]:
+    """
+    Find path node in the tree, return empty node if a path prefix is a leaf.
+    """
+    node = tree
+    for name in path:
+        if name not in node:
+            return None
+        node = node[name]
+        if not node:
+            return node
+    return node
+
+
+def is_selected(path: Sequence[str], include: FieldTree, exclude: FieldTree) -> bool:
+    """
+    Check whether `__` separated QuerySet field path is selected.
+    """
+    if include and _lookup(include, path) is None:
+        return False
+    excluded = _lookup(exclude, path)
+    return excluded is None or bool(excluded)
+
+
+def values_fields(queryset: QuerySet) -> Optional[List[str]]:
+    """
+    Get `values()` QuerySet field names, `None` for other QuerySets.
+    """
+    if not issubclass(queryset._iterable_class, ValuesIterable):
+        return None
+    if queryset._fields:
+        return list(queryset._fields)
+    return [
+        *(field.attname for field in queryset.model._meta.concrete_fields),
+        *queryset.query.annotation_select,
+    ]
+
+
+def select_data(data: Any, include: FieldTree, exclude: FieldTree) -> Any:
+    """
+    Select fields of dictionaries in the data, recursively.
+    """
+    if isinstance(data, dict):
+        selected = {}
+        for key, value in data.items():
+            sub_include = include.get(key) if include else {}
+            if sub_include is None:
+                continue
+            sub_exclude = exclude.get(key, None)
+            if sub_exclude is not None and not sub_exclude:
+                continue
+            if sub_include or sub_exclude:
+                value = select_data(value, sub_include, sub_exclude or {})
+            selected[key] = value
+        return selected
+    if isinstance(data, (list, tuple)):
+        return [select_data(item, include, exclude) for item in data]
+    return data
+
+
+@attr.dataclass(frozen=True)
+class FieldSelection:
+    """
+    Sparse fieldsets selected with query parameters.
+
+    `?fields=id,author.name` selects fields, `?exclude=body,author.bio` removes
+    fields, nested fields are dot separated. Unknown fields are ignored.
+    """
+
+    query_param: str = "fields"
+    exclude_query_param: Optional[str] = "exclude"
+    separator: str = ","
+
+    def parse(self, request: HttpRequest) -> Optional[tuple]:
+        include = parse_fields(request.GET.get(self.query_param, ""), self.separator)
+        exclude = (
+            parse_fields(request.GET.get(self.exclude_query_param, ""), self.separator)
+            if self.exclude_query_param
+            else {}
+        )
+        if not include and not exclude:
+            return None
+        return include, exclude
+
+    def select(self, request: HttpRequest, data: Any) -> Any:
+        """
+        Select fields of the view result.
+        """
+        selection = self.parse(request)
+        if selection is None:
+            return data
+        include, exclude = selection
+        if isinstance(data, QuerySet):
+            return self.select_queryset(data, include, exclude)
+        if isinstance(data, Iterator):
+            # Iterators are selected lazily, so they are still streamed
+            return (select_data(item, include, exclude) for item in data)
+        return select_data(data, include, exclude)
+
+    def select_queryset(
+        self, queryset: QuerySet, include: FieldTree, exclude: FieldTree
+    ) -> QuerySet:
+        """
+        Push fields selection down to QuerySet, so unused columns aren't fetched.
+
+        `values()` QuerySets are narrowed to selected fields of the originally
+        selected ones. Other QuerySets are returned as is, deferring fields of
+        model instances would query each deferred field accessed by rendering.
+        """
+        fields = values_fields(queryset)
+        if fields is None:
+            return queryset
+        selected = [
+            name for name in fields if is_selected(name.split("__"), include, exclude)
+        ]
+        if not selected:
+            raise APIException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail=_("No valid fields selected."),
+            )
+        return queryset.values(*selected)
+
+
+def select_fields_view(view: Callable, selection: FieldSelection) -> Callable:
+    """
+    Wrap view to select fields of the result before it's rendered.
+    """
+    if asyncio.iscoroutinefunction(view):
+
+        @wraps(view)
+        async def async_selected_view(request: HttpRequest, *args, **kwargs) -> Any:
+            data = await view(request, *args, **kwargs)
+            if isinstance(data, HttpResponseBase):
+                return data
+            return selection.select(request, data)
+
+        return async_selected_view
+
+    @wraps(view)
+    def selected_view(request: HttpRequest, *args, **kwargs) -> Any:
+        data = view(request, *args, **kwargs)
+        if isinstance(data, HttpResponseBase):
+            return data
+        return selection.select(request, data)
+
+    return selected_view
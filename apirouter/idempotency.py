@@ -0,0 +1,295 @@
+import asyncio
+import hashlib
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import attr
+from asgiref.sync import async_to_sync
+from django.core.cache import DEFAULT_CACHE_ALIAS, BaseCache, caches
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.translation import gettext_lazy as _
+
+from apirouter.exceptions import APIException
+from apirouter.ratelimit import KEY_FUNCTIONS
+
+# Request fingerprint, status code, headers and content
+StoredResponse = Tuple[str, int, List[Tuple[str, str]], bytes]
+
+
+class IdempotencyStore:
+    """
+    Idempotent responses store.
+
+    The key lock marks the request in-flight, so concurrent duplicates wait for
+    the stored response instead of executing the view.
+    """
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        raise NotImplementedError  # pragma: no cover
+
+    def set(self, key: str, value: StoredResponse, ttl: int) -> None:
+        raise NotImplementedError  # pragma: no cover
+
+    def lock(self, key: str, timeout: float) -> bool:
+        raise NotImplementedError  # pragma: no cover
+
+    def unlock(self, key: str) -> None:
+        raise NotImplementedError  # pragma: no cover
+
+
+class MemoryStore(IdempotencyStore):
+    """
+    In-process LRU store with expiration, for single process deployments.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._responses: "OrderedDict[str, Tuple[float, StoredResponse]]" = (
+            OrderedDict()
+        )
+        self._locks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        with self._lock:
+            item = self._responses.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires <= time.monotonic():
+                del self._responses[key]
+                return None
+            self._responses.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: StoredResponse, ttl: int) -> None:
+        with self._lock:
+            self._responses[key] = (time.monotonic() + ttl, value)
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.max_keys:
+                self._responses.popitem(last=False)
+
+    def lock(self, key: str, timeout: float) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if self._locks.get(key, 0) > now:
+                return False
+            self._locks[key] = now + timeout
+            return True
+
+    def unlock(self, key: str) -> None:
+        with self._lock:
+            self._locks.pop(key, None)
+
+
+@attr.dataclass(frozen=True)
+class CacheStore(IdempotencyStore):
+    """
+    Idempotent responses store over Django cache framework, shared by processes
+    and nodes. Key lock uses atomic `cache.add()`.
+    """
+
+    cache_alias: str = DEFAULT_CACHE_ALIAS
+    key_prefix: str = "apirouter:idempotency"
+
+    @property
+    def cache(self) -> BaseCache:
+        return caches[self.cache_alias]
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        return self.cache.get(f"{self.key_prefix}:{key}")
+
+    def set(self, key: str, value: StoredResponse, ttl: int) -> None:
+        self.cache.set(f"{self.key_prefix}:{key}", value, ttl)
+
+    def lock(self, key: str, timeout: float) -> bool:
+        return self.cache.add(f"{self.key_prefix}:{key}:lock", 1, timeout)
+
+    def unlock(self, key: str) -> None:
+        self.cache.delete(f"{self.key_prefix}:{key}:lock")
+
+
+@attr.dataclass(frozen=True)
+class Idempotency:
+    """
+    Idempotent requests options.
+
+    Responses of unsafe requests with `Idempotency-Key` header are stored for
+    `ttl` seconds and replayed for retries with the same key, without calling
+    the view. Keys are scoped by route and `key` (`"ip"`, `"user"` or callable),
+    reusing a key with a different request body is rejected. Server errors
+    are not stored, so failed requests can be retried.
+    """
+
+    store: IdempotencyStore = attr.Factory(MemoryStore)
+    header: str = "Idempotency-Key"
+    key: Union[str, Callable[[HttpRequest], str]] = "user"
+    ttl: int = 86400
+    methods: Sequence[str] = ("POST", "PUT", "PATCH", "DELETE")
+    required: bool = False
+    max_key_length: int = 255
+    lock_timeout: float = 60
+    wait_timeout: float = 10
+    lock_poll_interval: float = 0.01
+    key_func: Callable[[HttpRequest], str] = attr.ib(init=False)
+
+    def __attrs_post_init__(self):
+        if callable(self.key):
+            key_func = self.key
+        elif self.key in KEY_FUNCTIONS:
+            key_func = KEY_FUNCTIONS[self.key]
+        else:
+            raise ImproperlyConfigured(f"Invalid idempotency key {self.key!r}.")
+        object.__setattr__(self, "key_func", key_func)
+
+    def get_key(self, request: HttpRequest, scope: str) -> Optional[str]:
+        """
+        Get request store key, `None` if the request isn't idempotent.
+        """
+        if request.method not in self.methods:
+            return None
+        idempotency_key = request.headers.get(self.header)
+        if not idempotency_key:
+            if self.required:
+                raise APIException(
+                    status_code=HTTPStatus.BAD_REQUEST,
+                    detail=_("%s header is required.") % self.header,
+                )
+            return None
+        if len(idempotency_key) > self.max_key_length:
+            raise APIException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail=_("%s header is too long.") % self.header,
+            )
+        parts = (scope, self.key_func(request), idempotency_key)
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def fingerprint(self, request: HttpRequest) -> str:
+        digest = hashlib.sha256(f"{request.method} {request.path}\n".encode())
+        digest.update(request.body)
+        return digest.hexdigest()
+
+    def replay(self, stored: StoredResponse, fingerprint: str) -> HttpResponse:
+        stored_fingerprint, status, headers, content = stored
+        if stored_fingerprint != fingerprint:
+            raise APIException(
+                status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+                detail=_("Idempotency key was used with a different request."),
+            )
+        response = HttpResponse(content, status=status)
+        for name, value in headers:
+            response[name] = value
+        response["Idempotent-Replayed"] = "true"
+        return response
+
+    def save(self, key: str, fingerprint: str, response: HttpResponseBase) -> None:
+        if response.streaming or response.status_code >= 500:
+            return
+        stored: StoredResponse = (
+            fingerprint,
+            response.status_code,
+            list(response.items()),
+            response.content,  # type: ignore
+        )
+        self.store.set(key, stored, self.ttl)
+
+    def in_progress(self) -> APIException:
+        return APIException(
+            status_code=HTTPStatus.CONFLICT,
+            detail=_("A request with the same idempotency key is in progress."),
+        )
+
+
+def idempotent_view(
+    view: Callable, idempotency: Idempotency, scope: str, exception_handler: Callable
+) -> Callable:
+    """
+    Wrap view to replay stored responses of requests with idempotency key.
+
+    Concurrent duplicates wait for the first request response up to
+    `wait_timeout` seconds, then get 409 response. In-flight lock expires after
+    `lock_timeout` seconds, in case the first request process died.
+    """
+    store = idempotency.store
+
+    if asyncio.iscoroutinefunction(view):
+
+        async def async_handle_exception(request: HttpRequest, exc: Exception) -> Any:
+            response = exception_handler(request, exc)
+            if inspect.isawaitable(response):
+                response = await response
+            return response
+
+        @wraps(view)
+        async def async_replaying_view(request: HttpRequest, *args, **kwargs) -> Any:
+            try:
+                key = idempotency.get_key(request, scope)
+                if key is None:
+                    return await view(request, *args, **kwargs)
+                fingerprint = idempotency.fingerprint(request)
+                stored = store.get(key)
+                deadline = time.monotonic() + idempotency.wait_timeout
+                while stored is None and not store.lock(key, idempotency.lock_timeout):
+                    if time.monotonic() > deadline:
+                        raise idempotency.in_progress()
+                    await asyncio.sleep(idempotency.lock_poll_interval)
+                    stored = store.get(key)
+                if stored is None:
+                    # Response may be stored between the first check and the lock
+                    stored = store.get(key)
+                    if stored is not None:
+                        store.unlock(key)
+                if stored is not None:
+                    return idempotency.replay(stored, fingerprint)
+            except APIException as exc:
+                return await async_handle_exception(request, exc)
+            try:
+                response = await view(request, *args, **kwargs)
+                idempotency.save(key, fingerprint, response)
+            finally:
+                store.unlock(key)
+            return response
+
+        return async_replaying_view
+
+    if asyncio.iscoroutinefunction(exception_handler):
+        exception_handler = async_to_sync(exception_handler)
+
+    @wraps(view)
+    def replaying_view(request: HttpRequest, *args, **kwargs) -> Any:
+        try:
+            key = idempotency.get_key(request, scope)
+            if key is None:
+                return view(request, *args, **kwargs)
+            fingerprint = idempotency.fingerprint(request)
+            stored = store.get(key)
+            deadline = time.monotonic() + idempotency.wait_timeout
+            while stored is None and not store.lock(key, idempotency.lock_timeout):
+                if time.monotonic() > deadline:
+                    raise idempotency.in_progress()
+                time.sleep(idempotency.lock_poll_interval)
+                stored = store.get(key)
+            if stored is None:
+                # Response may be stored between the first check and the lock
+                stored = store.get(key)
+                if stored is not None:
+                    store.unlock(key)
+            if stored is not None:
+                return idempotency.replay(stored, fingerprint)
+        except APIException as exc:
+            return exception_handler(request, exc)
+        try:
+            response = view(request, *args, **kwargs)
+            idempotency.save(key, fingerprint, response)
+        finally:
+            store.unlock(key)
+        return response
+
+    return replaying_view
@@ -0,0 +1,377 @@
+import cProfile
+import inspect
+import os
+import pstats
+import random
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from functools import wraps
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import attr
+from django.http import HttpRequest, HttpResponse
+
+if TYPE_CHECKING:
+    from apirouter.routing import APIRoute  # pragma: no cover
+
+PHASES = ("wrap_request", "decorators", "view", "serialize", "exception_handler")
+
+_current_timings: ContextVar[Optional["RequestTimings"]] = ContextVar(
+    "apirouter_request_timings", default=None
+)
+
+
+@attr.dataclass
+class RequestTimings:
+    """
+    Request handling timings in seconds, measured with monotonic clock.
+    """
+
+    route: str
+    name: Optional[str]
+    path: str
+    method: str
+    wrap_request: float = 0.0
+    decorators: float = 0.0
+    view: float = 0.0
+    serialize: float = 0.0
+    exception_handler: float = 0.0
+    context: Dict[str, Any] = attr.Factory(dict)
+
+    @property
+    def total(self) -> float:
+        return sum(getattr(self, phase) for phase in PHASES)
+
+    def phases(self) -> Dict[str, float]:
+        return {phase: getattr(self, phase) for phase in PHASES}
+
+
+class Instrument:
+    """
+    Request instrumentation hooks base class.
+    """
+
+    def on_request_start(self, timings: RequestTimings) -> None:
+        pass
+
+    def on_view_done(self, timings: RequestTimings) -> None:
+        pass
+
+    def on_serialize_done(self, timings: RequestTimings) -> None:
+        pass
+
+    def on_exception(self, timings: RequestTimings, exc: Exception) -> None:
+        pass
+
+
+class ViewTimer:
+    """
+    Wraps request handling steps of a route to measure timings and call hooks.
+
+    Only used by routers with registered instruments.
+    """
+
+    def __init__(
+        self,
+        instruments: Sequence[Instrument],
+        route: Optional["APIRoute"] = None,
+        is_async: bool = False,
+    ):
+        self.instruments = list(instruments)
+        self.route = route.path if route else ""
+        self.name = route.name if route else None
+        self.is_async = is_async
+
+    def time_request(self, view: Callable) -> Callable:
+        def start(request: HttpRequest) -> Any:
+            timings = RequestTimings(
+                route=self.route,
+                name=self.name,
+                path=request.path,
+                method=request.method,  # type: ignore
+            )
+            for instrument in self.instruments:
+                instrument.on_request_start(timings)
+            return _current_timings.set(timings)
+
+        if self.is_async:
+
+            @wraps(view)
+            async def async_timed_request(request: HttpRequest, *args, **kwargs):
+                token = start(request)
+                try:
+                    return await view(request, *args, **kwargs)
+                finally:
+                    _current_timings.reset(token)
+
+            return async_timed_request
+
+        @wraps(view)
+        def timed_request(request: HttpRequest, *args, **kwargs):
+            token = start(request)
+            try:
+                return view(request, *args, **kwargs)
+            finally:
+                _current_timings.reset(token)
+
+        return timed_request
+
+    def time_make_request(self, make_request: Optional[Callable]) -> Optional[Callable]:
+        if make_request is None:
+            return None
+
+        def timed_make_request(request: HttpRequest) -> Any:
+            started = time.perf_counter()
+            try:
+                return make_request(request)
+            finally:
+                _timings().wrap_request = time.perf_counter() - started
+
+        return timed_make_request
+
+    def time_view(self, view: Callable) -> Callable:
+        if self.is_async:
+
+            @wraps(view)
+            async def async_timed_view(request, *args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    response = view(request, *args, **kwargs)
+                    if inspect.isawaitable(response):
+                        response = await response
+                    return response
+                finally:
+                    _timings().view = time.perf_counter() - started
+
+            return async_timed_view
+
+        @wraps(view)
+        def timed_view(request, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return view(request, *args, **kwargs)
+            finally:
+                _timings().view = time.perf_counter() - started
+
+        return timed_view
+
+    def time_get_response(self, get_response: Callable) -> Callable:
+        def done(started: float) -> None:
+            timings = _timings()
+            timings.decorators = max(time.perf_counter() - started - timings.view, 0.0)
+
+        if self.is_async:
+
+            async def async_timed_get_response(request, *args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    response = get_response(request, *args, **kwargs)
+                    if inspect.isawaitable(response):
+                        response = await response
+                finally:
+                    done(started)
+                self._call("on_view_done")
+                return response
+
+            return async_timed_get_response
+
+        def timed_get_response(request, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                response = get_response(request, *args, **kwargs)
+            finally:
+                done(started)
+            self._call("on_view_done")
+            return response
+
+        return timed_get_response
+
+    def time_render(self, render: Callable) -> Callable:
+        def timed_render(request: Any, content: Any) -> Any:
+            started = time.perf_counter()
+            response = render(request, content)
+            _timings().serialize = time.perf_counter() - started
+            self._call("on_serialize_done")
+            return response
+
+        return timed_render
+
+    def time_exception_handler(self, exception_handler: Callable) -> Callable:
+        def done(started: float, exc: Exception) -> None:
+            timings = _timings()
+            timings.exception_handler = time.perf_counter() - started
+            for instrument in self.instruments:
+                instrument.on_exception(timings, exc)
+
+        if self.is_async:
+
+            async def async_timed_exception_handler(request: Any, exc: Exception):
+                started = time.perf_counter()
+                try:
+                    response = exception_handler(request, exc)
+                    if inspect.isawaitable(response):
+                        response = await response
+                    return response
+                finally:
+                    done(started, exc)
+
+            return async_timed_exception_handler
+
+        def timed_exception_handler(request: Any, exc: Exception) -> Any:
+            started = time.perf_counter()
+            try:
+                return exception_handler(request, exc)
+            finally:
+                done(started, exc)
+
+        return timed_exception_handler
+
+    def _call(self, hook: str) -> None:
+        timings = _timings()
+        for instrument in self.instruments:
+            getattr(instrument, hook)(timings)
+
+
+def _timings() -> RequestTimings:
+    return _current_timings.get()  # type: ignore
+
+
+class PrometheusHistogram(Instrument):
+    """
+    In-process histogram of request timings per route, method and phase,
+    rendered in Prometheus text exposition format.
+    """
+
+    DEFAULT_BUCKETS = (
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+
+    def __init__(
+        self,
+        name: str = "apirouter_request_duration_seconds",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.buckets = sorted(buckets)
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str, str], List[float]] = {}
+
+    def on_serialize_done(self, timings: RequestTimings) -> None:
+        self.observe(timings)
+
+    def on_exception(self, timings: RequestTimings, exc: Exception) -> None:
+        self.observe(timings)
+
+    def observe(self, timings: RequestTimings) -> None:
+        values = timings.phases()
+        values["total"] = timings.total
+        with self._lock:
+            for phase, value in values.items():
+                key = (timings.route, timings.method, phase)
+                series = self._series.get(key)
+                if series is None:
+                    # bucket counters, sum, count
+                    series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+                for index, bound in enumerate(self.buckets):
+                    if value <= bound:
+                        series[index] += 1
+                series[-2] += value
+                series[-1] += 1
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} Request handling duration by phase.",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = sorted(self._series.items())
+            for (route, method, phase), values in series:
+                labels = f'route="/{route}",method="{method}",phase="{phase}"'
+                for bound, count in zip(self.buckets, values):
+                    lines.append(
+                        f'{self.name}_bucket{{{labels},le="{bound}"}} {int(count)}'
+                    )
+                lines.append(
+                    f'{self.name}_bucket{{{labels},le="+Inf"}} {int(values[-1])}'
+                )
+                lines.append(f"{self.name}_sum{{{labels}}} {values[-2]}")
+                lines.append(f"{self.name}_count{{{labels}}} {int(values[-1])}")
+        return "\n".join(lines) + "\n"
+
+    def view(self, request: HttpRequest) -> HttpResponse:
+        """
+        Metrics view, can be added to router or Django URL patterns.
+        """
+        return HttpResponse(
+            self.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+        )
+
+
+class CProfileSampler(Instrument):
+    """
+    Profiles sampled requests with `cProfile`.
+
+    Last `limit` profiles are kept in `profiles`, and dumped to `output_dir`
+    as `.prof` files if it is set.
+    """
+
+    def __init__(
+        self, rate: float = 0.01, limit: int = 10, output_dir: Optional[str] = None
+    ):
+        self.rate = rate
+        self.output_dir = output_dir
+        self.profiles: Deque[Tuple[RequestTimings, pstats.Stats]] = deque(maxlen=limit)
+
+    def on_request_start(self, timings: RequestTimings) -> None:
+        if random.random() >= self.rate:
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is active
+            return
+        timings.context["profiler"] = profiler
+
+    def on_serialize_done(self, timings: RequestTimings) -> None:
+        self._finish(timings)
+
+    def on_exception(self, timings: RequestTimings, exc: Exception) -> None:
+        self._finish(timings)
+
+    def _finish(self, timings: RequestTimings) -> None:
+        profiler: Optional[cProfile.Profile] = timings.context.pop("profiler", None)
+        if profiler is None:
+            return
+        profiler.disable()
+        self.profiles.append((timings, pstats.Stats(profiler)))
+        if self.output_dir:
+            route = re.sub(r"[^\w.-]+", "_", timings.route) or "index"
+            filename = f"{timings.method}-{route}-{time.time_ns()}.prof"
+            profiler.dump_stats(os.path.join(self.output_dir, filename))
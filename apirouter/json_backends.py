@@ -0,0 +1,108 @@
+import json
+from functools import lru_cache
+from typing import Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from apirouter.conf import get_json_backend_class
+
+_django_encoder = DjangoJSONEncoder()
+
+
+class JSONBackend:
+    """
+    JSON backend interface.
+
+    `loads` parses bytes and raises `ValueError` on invalid documents,
+    `dumps` encodes objects straight to bytes.
+    """
+
+    def loads(self, data: bytes) -> Any:
+        raise NotImplementedError  # pragma: no cover
+
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError  # pragma: no cover
+
+
+class StdlibJSONBackend(JSONBackend):
+    """
+    Standard library `json` backend.
+    """
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return _django_encoder.encode(obj).encode()
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    `orjson` backend.
+    """
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, default=_django_encoder.default)
+
+
+class UjsonBackend(JSONBackend):
+    """
+    `ujson` backend.
+    """
+
+    def __init__(self):
+        import ujson
+
+        self._ujson = ujson
+
+    def loads(self, data: bytes) -> Any:
+        return self._ujson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj, default=_django_encoder.default).encode()
+
+
+class MsgspecBackend(JSONBackend):
+    """
+    `msgspec` backend.
+    """
+
+    def __init__(self):
+        import msgspec
+
+        self._decode_error = msgspec.DecodeError
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder(enc_hook=_django_encoder.default)
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as exc:
+            raise ValueError(str(exc)) from exc
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+@lru_cache(maxsize=None)
+def get_json_backend() -> JSONBackend:
+    """
+    Get configured JSON backend instance.
+    """
+    return get_json_backend_class()()
+
+
+@receiver(setting_changed)
+def _reset_json_backend(*, setting: str, **kwargs) -> None:
+    if setting == "APIROUTER_JSON_BACKEND":
+        get_json_backend.cache_clear()
@@ -0,0 +1,328 @@
+from functools import lru_cache
+from http import HTTPStatus
+from io import BytesIO
+from typing import Any, Dict, Sequence, Tuple, Type, Union
+
+import attr
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest, HttpResponse, QueryDict
+from django.http.multipartparser import MultiPartParserError
+from django.http.response import HttpResponseBase
+from django.utils.cache import patch_vary_headers
+from django.utils.translation import gettext_lazy as _
+
+from apirouter.exceptions import APIException
+from apirouter.json_backends import get_json_backend
+from apirouter.response import is_streamable
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover
+    cbor2 = None
+
+_django_encoder = DjangoJSONEncoder()
+
+
+def invalid_body() -> APIException:
+    return APIException(
+        status_code=HTTPStatus.BAD_REQUEST, detail=_("Invalid request body.")
+    )
+
+
+class Parser:
+    """
+    Request body parser for `media_type` content.
+    """
+
+    media_type: str
+
+    def parse(self, request: HttpRequest) -> Any:
+        raise NotImplementedError  # pragma: no cover
+
+
+class Renderer:
+    """
+    View result renderer to `media_type` content.
+    """
+
+    media_type: str
+
+    def render(self, data: Any) -> bytes:
+        raise NotImplementedError  # pragma: no cover
+
+
+class JSONParser(Parser):
+    media_type = "application/json"
+
+    def parse(self, request: HttpRequest) -> Any:
+        try:
+            return get_json_backend().loads(request.body)
+        except ValueError:
+            raise invalid_body()
+
+
+class JSONRenderer(Renderer):
+    media_type = "application/json"
+
+    def render(self, data: Any) -> bytes:
+        return get_json_backend().dumps(data)
+
+
+class FormParser(Parser):
+    """
+    URL encoded form parser, returning `request.POST` for POST requests.
+
+    Django parses form bodies of POST requests only, bodies of other methods
+    are parsed by the parser.
+    """
+
+    media_type = "application/x-www-form-urlencoded"
+
+    def parse(self, request: HttpRequest) -> Any:
+        if request.method == "POST":
+            return request.POST
+        return QueryDict(request.body, encoding=request.encoding)
+
+
+class MultiPartParser(FormParser):
+    """
+    Multipart form parser, returning `request.POST`, files are in `request.FILES`.
+    """
+
+    media_type = "multipart/form-data"
+
+    def parse(self, request: HttpRequest) -> Any:
+        if request.method == "POST":
+            return request.POST
+        try:
+            data, files = request.parse_file_upload(request.META, BytesIO(request.body))
+        except MultiPartParserError:
+            raise invalid_body()
+        request._files = files  # type: ignore
+        return data
+
+
+class MessagePackParser(Parser):
+    media_type = "application/msgpack"
+
+    def parse(self, request: HttpRequest) -> Any:
+        try:
+            return msgpack.unpackb(request.body, raw=False)
+        except (ValueError, msgpack.UnpackException):
+            raise invalid_body()
+
+
+class MessagePackRenderer(Renderer):
+    media_type = "application/msgpack"
+
+    def render(self, data: Any) -> bytes:
+        return msgpack.packb(data, default=_django_encoder.default, use_bin_type=True)
+
+
+class CBORParser(Parser):
+    media_type = "application/cbor"
+
+    def parse(self, request: HttpRequest) -> Any:
+        try:
+            return cbor2.loads(request.body)
+        except (ValueError, cbor2.CBORDecodeError):
+            raise invalid_body()
+
+
+class CBORRenderer(Renderer):
+    media_type = "application/cbor"
+
+    def render(self, data: Any) -> bytes:
+        return cbor2.dumps(data, default=_cbor_default)
+
+
+def _cbor_default(encoder: Any, value: Any) -> None:
+    encoder.encode(_django_encoder.default(value))
+
+
+# Parsers and renderers registry by format name, formats requiring not
+# installed packages aren't registered
+PARSERS: Dict[str, Parser] = {
+    "json": JSONParser(),
+    "form": FormParser(),
+    "multipart": MultiPartParser(),
+}
+RENDERERS: Dict[str, Renderer] = {"json": JSONRenderer()}
+if msgpack is not None:  # pragma: no cover
+    PARSERS["msgpack"] = MessagePackParser()
+    RENDERERS["msgpack"] = MessagePackRenderer()
+if cbor2 is not None:  # pragma: no cover
+    PARSERS["cbor"] = CBORParser()
+    RENDERERS["cbor"] = CBORRenderer()
+
+
+def register_parser(name: str, parser: Parser) -> None:
+    PARSERS[name] = parser
+
+
+def register_renderer(name: str, renderer: Renderer) -> None:
+    RENDERERS[name] = renderer
+
+
+# Formats registered only if their packages are installed
+OPTIONAL_FORMATS = ("msgpack", "cbor")
+
+
+def _resolve(
+    formats: Sequence[Union[str, Any]], registry: Dict[str, Any], kind: str
+) -> tuple:
+    resolved = []
+    for item in formats:
+        if isinstance(item, str):
+            if item not in registry:
+                if item in OPTIONAL_FORMATS:
+                    continue
+                raise ImproperlyConfigured(
+                    f"Unknown format {item!r}, available: {', '.join(registry)}."
+                )
+            item = registry[item]
+        resolved.append(item)
+    if not resolved:
+        raise ImproperlyConfigured(
+            f"No available {kind}, {', '.join(map(str, formats))} packages "
+            "aren't installed."
+        )
+    return tuple(resolved)
+
+
+@lru_cache(maxsize=256)
+def parse_accept(accept: str) -> Tuple[Tuple[str, float], ...]:
+    """
+    Parse `Accept` header to media ranges ordered by client preference.
+    """
+    ranges = []
+    for item in accept.split(","):
+        media_range, *params = item.split(";")
+        media_range = media_range.strip().lower()
+        if not media_range:
+            continue
+        quality = 1.0
+        for param in params:
+            name, separator, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        ranges.append((media_range, quality))
+    # More specific ranges first for equal quality, `sorted` keeps header order
+    return tuple(sorted(ranges, key=lambda item: (-item[1], item[0].count("*"))))
+
+
+def _matches(media_range: str, media_type: str) -> bool:
+    if media_range in ("*/*", "*"):
+        return True
+    range_type, separator, range_subtype = media_range.partition("/")
+    main_type, separator, subtype = media_type.partition("/")
+    return range_type == main_type and range_subtype in ("*", subtype)
+
+
+@attr.dataclass(frozen=True)
+class Negotiation:
+    """
+    Content negotiation options.
+
+    Route results are rendered by the first of `renderers` acceptable by
+    client `Accept` header, or 406 error is returned. `Request.data` parses
+    request body with one of `parsers` by `Content-Type`, or returns 415 error.
+    Formats are registered names, like `"json"` or `"msgpack"`, or instances,
+    MessagePack and CBOR formats are skipped if `msgpack` and `cbor2` packages
+    aren't installed.
+    """
+
+    renderers: Sequence[Union[str, Renderer]] = ("json", "msgpack", "cbor")
+    parsers: Sequence[Union[str, Parser]] = (
+        "json",
+        "form",
+        "multipart",
+        "msgpack",
+        "cbor",
+    )
+
+    def __attrs_post_init__(self):
+        object.__setattr__(
+            self, "renderers", _resolve(self.renderers, RENDERERS, "renderers")
+        )
+        object.__setattr__(self, "parsers", _resolve(self.parsers, PARSERS, "parsers"))
+
+    def select_renderer(self, request: HttpRequest) -> Renderer:
+        renderers: Sequence[Renderer] = self.renderers  # type: ignore
+        accept = request.META.get("HTTP_ACCEPT")
+        if not accept:
+            return renderers[0]
+        for media_range, quality in parse_accept(accept):
+            if quality <= 0:
+                continue
+            for renderer in renderers:
+                if _matches(media_range, renderer.media_type):
+                    return renderer
+        raise APIException(status_code=HTTPStatus.NOT_ACCEPTABLE)
+
+    def select_parser(self, request: HttpRequest) -> Parser:
+        content_type = request.META.get("CONTENT_TYPE", "")
+        media_type = content_type.partition(";")[0].strip().lower()
+        for parser in self.parsers:
+            if parser.media_type == media_type:  # type: ignore
+                return parser  # type: ignore
+        raise APIException(status_code=HTTPStatus.UNSUPPORTED_MEDIA_TYPE)
+
+    def parse(self, request: HttpRequest) -> Any:
+        """
+        Parse request body, `None` if the request has no body.
+        """
+        if not request.META.get("CONTENT_LENGTH") and not request.body:
+            return None
+        return self.select_parser(request).parse(request)
+
+    def cache_variant(self, request: HttpRequest) -> str:
+        """
+        Get response cache variant, responses are cached per rendered media type.
+        """
+        try:
+            return self.select_renderer(request).media_type
+        except APIException:
+            return ""
+
+    def make_response(
+        self,
+        request: HttpRequest,
+        content: Any,
+        response_class: Type[HttpResponseBase],
+        streaming_response_class: Type[HttpResponseBase],
+    ) -> HttpResponseBase:
+        """
+        Render view result with negotiated renderer.
+
+        JSON is rendered with router response classes, streamable results are
+        streamed as JSON, or rendered as a list.
+        """
+        renderer = self.select_renderer(request)
+        response: HttpResponseBase
+        if isinstance(renderer, JSONRenderer):
+            if is_streamable(content):
+                response = streaming_response_class(content)
+            else:
+                response = response_class(content)
+        else:
+            if is_streamable(content):
+                content = list(content)
+            response = HttpResponse(
+                renderer.render(content), content_type=renderer.media_type
+            )
+        patch_vary_headers(response, ("Accept",))
+        return response
+
+
+# Used by `Request.data` of requests not handled by a router with negotiation
+default_negotiation = Negotiation(renderers=("json",))
@@ -0,0 +1,317 @@
+import enum
+import inspect
+import re
+import typing
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+
+import attr
+from django.http import HttpRequest, HttpResponse
+from django.utils.functional import cached_property
+
+from apirouter.conditional import etag_matches, make_etag, not_modified
+from apirouter.json_backends import get_json_backend
+from apirouter.params import (
+    PATH_PARAMETER_RE,
+    ParamsParser,
+    is_model,
+    model_fields,
+    unwrap_optional,
+)
+
+if TYPE_CHECKING:
+    from apirouter.routing import APIRouter, APIViewFuncRoute  # pragma: no cover
+
+OPENAPI_VERSION = "3.0.3"
+
+OPERATION_METHODS = ("get", "put", "post", "delete", "patch", "trace")
+
+_CONVERTER_SCHEMAS: Dict[str, dict] = {
+    "int": {"type": "integer"},
+    "str": {"type": "string"},
+    "slug": {"type": "string"},
+    "path": {"type": "string"},
+    "uuid": {"type": "string", "format": "uuid"},
+}
+
+_PRIMITIVE_SCHEMAS: Dict[Any, dict] = {
+    str: {"type": "string"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    bool: {"type": "boolean"},
+    dict: {"type": "object"},
+    list: {"type": "array", "items": {}},
+}
+
+
+def exclude_from_schema(view: Callable) -> Callable:
+    """
+    Exclude view from OpenAPI schema.
+    """
+    setattr(view, "__apirouter_include_in_schema", False)
+    return view
+
+
+@attr.dataclass(frozen=True)
+class Operation:
+    path: str
+    method: str
+    view: Callable
+    name: Optional[str] = None
+    typed: bool = False
+    view_kwargs: Optional[dict] = None
+
+
+class SchemaGenerator:
+    """
+    OpenAPI 3 document generator, walking router routes and view annotations.
+    """
+
+    def __init__(self, router: "APIRouter", info: Optional[dict] = None):
+        self.router = router
+        self.info = info or {"title": router.name or "API", "version": "0.1.0"}
+        self.schemas: Dict[str, dict] = {}
+
+    def generate(self) -> dict:
+        paths: Dict[str, dict] = {}
+        for operation in self._operations(self.router):
+            path = PATH_PARAMETER_RE.sub(r"{\g<parameter>}", operation.path)
+            operations = paths.setdefault(path, {})
+            operations[operation.method] = self._operation(operation)
+        document = {"openapi": OPENAPI_VERSION, "info": self.info, "paths": paths}
+        if self.schemas:
+            document["components"] = {"schemas": dict(sorted(self.schemas.items()))}
+        return document
+
+    def _operations(self, router: "APIRouter", prefix: str = "") -> Iterator[Operation]:
+        from apirouter.routing import (
+            APIIncludeRoute,
+            APIMethodsRoute,
+            APIViewClassRoute,
+        )
+
+        for route in router.routes:
+            if isinstance(route, APIIncludeRoute):
+                yield from self._operations(route.router, prefix + route.prefix)
+                continue
+            route = router.load_route(route)
+            path = "/" + prefix + route.path
+            handlers: List[Tuple[str, Callable, Optional["APIViewFuncRoute"]]]
+            if isinstance(route, APIMethodsRoute):
+                handlers = [
+                    (method.lower(), cast(Callable, handler.view_func), handler)
+                    for method, handler in route.handlers.items()
+                ]
+            elif isinstance(route, APIViewClassRoute):
+                view_class = getattr(route.view_func, "view_class", None)
+                handlers = [
+                    (method, getattr(view_class, method), None)
+                    for method in OPERATION_METHODS
+                    if hasattr(view_class, method)
+                ]
+            else:
+                handlers = [
+                    (method.lower(), cast(Callable, route.view_func), route)
+                    for method in route.methods or ["GET"]
+                ]
+            for method, view, handler in handlers:
+                if method not in OPERATION_METHODS or not getattr(
+                    view, "__apirouter_include_in_schema", True
+                ):
+                    continue
+                typed = handler is not None and (
+                    router.typed if handler.typed is None else handler.typed
+                )
+                yield Operation(
+                    path=path,
+                    method=method,
+                    view=view,
+                    name=route.name,
+                    typed=typed,
+                    view_kwargs=route.view_kwargs,
+                )
+
+    def _operation(self, operation: Operation) -> dict:
+        result: Dict[str, Any] = {
+            "operationId": self._operation_id(operation),
+        }
+        doc = inspect.getdoc(operation.view)
+        if doc:
+            summary, _, description = doc.partition("\n\n")
+            result["summary"] = " ".join(summary.split())
+            if description:
+                result["description"] = description
+
+        parameters = [
+            {
+                "name": match.group("parameter"),
+                "in": "path",
+                "required": True,
+                "schema": dict(
+                    _CONVERTER_SCHEMAS.get(
+                        match.group("converter") or "str", {"type": "string"}
+                    )
+                ),
+            }
+            for match in PATH_PARAMETER_RE.finditer(operation.path)
+        ]
+        responses: Dict[str, dict] = {"200": {"description": "Successful response"}}
+
+        if operation.typed:
+            parser = ParamsParser(
+                operation.view, path=operation.path, view_kwargs=operation.view_kwargs
+            )
+            body_params = []
+            for param in parser.params:
+                if param.source != "query":
+                    body_params.append(param)
+                    continue
+                parameter = {
+                    "name": param.name,
+                    "in": "query",
+                    "required": param.required,
+                    "schema": self.schema(param.annotation, param.default),
+                }
+                parameters.append(parameter)
+            if body_params:
+                result["requestBody"] = self._request_body(body_params)
+            responses["422"] = {"description": "Validation error"}
+
+        if parameters:
+            result["parameters"] = parameters
+
+        return_annotation = typing.get_type_hints(operation.view).get("return")
+        if return_annotation is not None and return_annotation is not type(None):
+            if not (
+                inspect.isclass(return_annotation)
+                and issubclass(return_annotation, HttpResponse)
+            ):
+                responses["200"]["content"] = {
+                    "application/json": {"schema": self.schema(return_annotation)}
+                }
+        result["responses"] = responses
+        return result
+
+    def _request_body(self, params: List[Any]) -> dict:
+        if len(params) == 1:
+            (param,) = params
+            schema = self.schema(param.annotation)
+            required = param.required
+        else:
+            schema = {
+                "type": "object",
+                "properties": {
+                    param.name: self.schema(param.annotation) for param in params
+                },
+            }
+            required_params = [param.name for param in params if param.required]
+            if required_params:
+                schema["required"] = required_params
+            required = bool(required_params)
+        return {
+            "required": required,
+            "content": {"application/json": {"schema": schema}},
+        }
+
+    def _operation_id(self, operation: Operation) -> str:
+        if operation.name:
+            return f"{operation.name}_{operation.method}"
+        path = PATH_PARAMETER_RE.sub(r"\g<parameter>", operation.path)
+        return operation.method + re.sub(r"\W+", "_", path).rstrip("_")
+
+    def schema(self, annotation: Any, default: Any = None) -> dict:
+        """
+        Make JSON schema from type annotation, registering models as components.
+        """
+        annotation, optional = unwrap_optional(annotation)
+        schema = self._schema(annotation)
+        if optional:
+            schema = {**schema, "nullable": True}
+        if isinstance(default, (str, int, float, bool)):
+            schema = {**schema, "default": default}
+        return schema
+
+    def _schema(self, annotation: Any) -> dict:
+        if annotation in _PRIMITIVE_SCHEMAS:
+            return dict(_PRIMITIVE_SCHEMAS[annotation])
+        if is_model(annotation):
+            return self._model_schema(annotation)
+        if inspect.isclass(annotation) and issubclass(annotation, enum.Enum):
+            values = [member.value for member in annotation]
+            schema = self._schema(type(values[0])) if values else {}
+            return {**schema, "enum": values}
+        origin = getattr(annotation, "__origin__", None)
+        args: Tuple[Any, ...] = getattr(annotation, "__args__", None) or ()
+        if origin in (list, List):
+            return {"type": "array", "items": self.schema(args[0]) if args else {}}
+        if origin in (dict, Dict):
+            return {
+                "type": "object",
+                "additionalProperties": self.schema(args[1]) if len(args) == 2 else {},
+            }
+        return {}
+
+    def _model_schema(self, model: type) -> dict:
+        name = model.__name__
+        ref = {"$ref": f"#/components/schemas/{name}"}
+        if name in self.schemas:
+            return ref
+        self.schemas[name] = {}
+        properties = {}
+        required = []
+        for field_name, annotation, field_required in model_fields(model):
+            properties[field_name] = self.schema(annotation)
+            if field_required:
+                required.append(field_name)
+        schema: Dict[str, Any] = {"type": "object", "properties": properties}
+        if required:
+            schema["required"] = required
+        self.schemas[name] = schema
+        return ref
+
+
+class OpenAPISchema:
+    """
+    Router OpenAPI schema.
+
+    The document and its encoded content are built once, on first access,
+    and served as pre-encoded bytes with ETag.
+    """
+
+    def __init__(self, router: "APIRouter", info: Optional[dict] = None):
+        self.router = router
+        self.info = info
+
+    @cached_property
+    def document(self) -> dict:
+        return SchemaGenerator(self.router, info=self.info).generate()
+
+    @cached_property
+    def content(self) -> bytes:
+        return get_json_backend().dumps(self.document)
+
+    @cached_property
+    def etag(self) -> str:
+        return make_etag(self.content)
+
+    def view(self, request: HttpRequest) -> HttpResponse:
+        """
+        Schema view, can be added to router or Django URL patterns.
+        """
+        if etag_matches(request, self.etag):
+            return not_modified(self.etag)
+        response = HttpResponse(self.content, content_type="application/json")
+        response["ETag"] = self.etag
+        return response
+
+
+exclude_from_schema(OpenAPISchema.view)
@@ -0,0 +1,310 @@
+import asyncio
+import datetime
+import json
+from functools import wraps
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import attr
+from asgiref.sync import sync_to_async
+from django.core import signing
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.utils.translation import gettext_lazy as _
+
+from apirouter.exceptions import APIException
+from apirouter.fields import values_fields
+
+COUNT_MODES = ("exact", "estimate")
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """
+    JSON encoder keeping full precision of datetimes and times, so keyset seek
+    doesn't match the last row of the previous page again.
+    """
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class CursorSerializer:
+    """
+    Compact JSON cursor serializer, keeping dates and decimals as strings.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), cls=CursorEncoder).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data.decode())
+
+
+def invalid_cursor() -> APIException:
+    return APIException(status_code=HTTPStatus.BAD_REQUEST, detail=_("Invalid cursor."))
+
+
+def estimate_count(queryset: QuerySet, limit: int) -> int:
+    """
+    Estimate query rows count.
+
+    PostgreSQL planner estimate is used when available, other databases count
+    at most `limit` rows.
+    """
+    queryset = queryset.order_by()
+    connection = connections[queryset.db]
+    if connection.vendor == "postgresql":  # pragma: no cover
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    return queryset[:limit].count()
+
+
+class Pagination:
+    """
+    Paginate view results to page dictionary rendered with router response class.
+    """
+
+    def paginate(self, request: HttpRequest, data: Any) -> Any:
+        raise NotImplementedError  # pragma: no cover
+
+
+@attr.dataclass(frozen=True)
+class CursorPagination(Pagination):
+    """
+    Cursor pagination with signed opaque cursors.
+
+    QuerySets are paginated by keyset, filtering rows after the last row of
+    the previous page by `ordering` columns, so page queries cost is the same
+    for any page depth. Ordering columns should be indexed and not nullable,
+    primary key is added to the ordering to make it unique. Ordering fields
+    missing in `values()` QuerySets are selected for cursors and removed from
+    results. Other sequences are paginated by offset.
+
+    `count` adds `"exact"` rows count or `"estimate"` cheap approximate count.
+    """
+
+    ordering: Optional[Sequence[str]] = None
+    page_size: int = 50
+    max_page_size: int = 100
+    page_size_query_param: Optional[str] = "page_size"
+    cursor_query_param: str = "cursor"
+    count: Optional[str] = None
+    count_limit: int = 10000
+    salt: str = "apirouter.pagination"
+
+    def __attrs_post_init__(self):
+        if self.count is not None and self.count not in COUNT_MODES:
+            raise ImproperlyConfigured(
+                f"Invalid pagination count {self.count!r}, "
+                f"expected one of {COUNT_MODES}."
+            )
+
+    def paginate(self, request: HttpRequest, data: Any) -> Any:
+        """
+        Paginate QuerySet or sequence, other view results are returned as is.
+        """
+        if isinstance(data, QuerySet):
+            return self.paginate_queryset(request, data)
+        if isinstance(data, (list, tuple)):
+            return self.paginate_sequence(request, data)
+        return data
+
+    def get_page_size(self, request: HttpRequest) -> int:
+        if self.page_size_query_param:
+            try:
+                page_size = int(request.GET[self.page_size_query_param])
+            except (KeyError, ValueError):
+                pass
+            else:
+                if page_size > 0:
+                    return min(page_size, self.max_page_size)
+        return self.page_size
+
+    def encode_cursor(self, position: dict) -> str:
+        return signing.dumps(position, salt=self.salt, serializer=CursorSerializer)
+
+    def decode_cursor(self, request: HttpRequest) -> Optional[dict]:
+        cursor = request.GET.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        try:
+            position = signing.loads(
+                cursor, salt=self.salt, serializer=CursorSerializer
+            )
+        except (signing.BadSignature, ValueError):
+            raise invalid_cursor()
+        if not isinstance(position, dict):
+            raise invalid_cursor()
+        return position
+
+    def get_ordering(self, queryset: QuerySet) -> List[Tuple[str, bool]]:
+        """
+        Get `(field, descending)` ordering ending with primary key.
+        """
+        ordering = list(
+            self.ordering
+            or queryset.query.order_by
+            or queryset.model._meta.ordering
+            or ["pk"]
+        )
+        pk_name = queryset.model._meta.pk.name
+        fields = []
+        for field in ordering:
+            if not isinstance(field, str) or field.startswith("?"):
+                raise ImproperlyConfigured(
+                    f"Cursor pagination ordering must be field names, got {field!r}."
+                )
+            name = field.lstrip("-")
+            fields.append((pk_name if name == "pk" else name, field.startswith("-")))
+        if all(name != pk_name for name, descending in fields):
+            fields.append((pk_name, fields[-1][1]))
+        return fields
+
+    def paginate_queryset(self, request: HttpRequest, queryset: QuerySet) -> dict:
+        ordering = self.get_ordering(queryset)
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        values: Optional[list] = None
+        reverse = False
+        if position is not None:
+            values, reverse = position.get("k"), bool(position.get("r"))
+            if not isinstance(values, list) or len(values) != len(ordering):
+                raise invalid_cursor()
+
+        # Ordering values are needed for cursors, even if not selected
+        page_queryset = queryset
+        hidden: List[str] = []
+        fields = values_fields(queryset)
+        if fields is not None:
+            hidden = [name for name, descending in ordering if name not in fields]
+            if hidden:
+                page_queryset = queryset.values(*fields, *hidden)
+        page_queryset = page_queryset.order_by(
+            *(
+                ("-" if descending != reverse else "") + name
+                for name, descending in ordering
+            )
+        )
+        if values is not None:
+            page_queryset = page_queryset.filter(self._seek(ordering, values, reverse))
+        try:
+            items = list(page_queryset[: page_size + 1])
+        except (ValueError, TypeError):
+            raise invalid_cursor()
+        has_more = len(items) > page_size
+        items = items[:page_size]
+        if reverse:
+            items.reverse()
+
+        has_next = has_more if not reverse else True
+        has_previous = has_more if reverse else position is not None
+        page: Dict[str, Any] = {
+            "results": items,
+            "next": (
+                self._keyset_cursor(ordering, items[-1], reverse=False)
+                if items and has_next
+                else None
+            ),
+            "previous": (
+                self._keyset_cursor(ordering, items[0], reverse=True)
+                if items and has_previous
+                else None
+            ),
+        }
+        if hidden:
+            for item in items:
+                for name in hidden:
+                    del item[name]
+        if self.count == "exact":
+            page["count"] = queryset.count()
+        elif self.count == "estimate":
+            page["count"] = estimate_count(queryset, limit=self.count_limit)
+        return page
+
+    def paginate_sequence(self, request: HttpRequest, data: Sequence) -> dict:
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(request) or {}
+        offset = position.get("o", 0)
+        if not isinstance(offset, int) or offset < 0:
+            raise invalid_cursor()
+        end = offset + page_size
+        page: Dict[str, Any] = {
+            "results": list(data[offset:end]),
+            "next": self.encode_cursor({"o": end}) if end < len(data) else None,
+            "previous": (
+                self.encode_cursor({"o": max(offset - page_size, 0)})
+                if offset > 0
+                else None
+            ),
+        }
+        if self.count:
+            page["count"] = len(data)
+        return page
+
+    def _seek(self, ordering: List[Tuple[str, bool]], values: list, reverse: bool) -> Q:
+        """
+        Make keyset condition selecting rows after `values` in the ordering.
+        """
+        condition = Q()
+        for index, (name, descending) in enumerate(ordering):
+            lookup = "lt" if descending != reverse else "gt"
+            row = Q(**{f"{name}__{lookup}": values[index]})
+            for previous_index in range(index):
+                row &= Q(**{ordering[previous_index][0]: values[previous_index]})
+            condition |= row
+        return condition
+
+    def _keyset_cursor(
+        self, ordering: List[Tuple[str, bool]], item: Any, reverse: bool
+    ) -> str:
+        values = [_item_value(item, name) for name, descending in ordering]
+        position: dict = {"k": values}
+        if reverse:
+            position["r"] = 1
+        return self.encode_cursor(position)
+
+
+def _item_value(item: Any, name: str) -> Any:
+    if isinstance(item, dict):
+        return item[name]
+    for attribute in name.split("__"):
+        item = getattr(item, attribute)
+    return item
+
+
+def paginate_view(view: Callable, pagination: Pagination) -> Callable:
+    """
+    Wrap view to paginate QuerySet and sequence results.
+    """
+    if asyncio.iscoroutinefunction(view):
+        async_paginate = sync_to_async(pagination.paginate)
+
+        @wraps(view)
+        async def async_paginated_view(request: HttpRequest, *args, **kwargs) -> Any:
+            data = await view(request, *args, **kwargs)
+            if isinstance(data, HttpResponseBase):
+                return data
+            return await async_paginate(request, data)
+
+        return async_paginated_view
+
+    @wraps(view)
+    def paginated_view(request: HttpRequest, *args, **kwargs) -> Any:
+        data = view(request, *args, **kwargs)
+        if isinstance(data, HttpResponseBase):
+            return data
+        return pagination.paginate(request, data)
+
+    return paginated_view
@@ -0,0 +1,396 @@
+import asyncio
+import dataclasses
+import enum
+import inspect
+import re
+import typing
+from functools import wraps
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import attr
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpRequest
+from django.utils.translation import gettext_lazy as _
+
+from apirouter.exceptions import APIException
+from apirouter.json_backends import get_json_backend
+from apirouter.request import Request
+
+PATH_PARAMETER_RE = re.compile(r"<(?:(?P<converter>[^>:]+):)?(?P<parameter>[^>]+)>")
+
+_TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
+_FALSE_VALUES = frozenset(("0", "false", "no", "off"))
+
+_missing = object()
+
+Converter = Callable[[Any, Tuple[Any, ...]], Any]
+
+
+class ValidationError(Exception):
+    def __init__(self, errors: List[dict]):
+        self.errors = errors
+
+
+def _error(loc: Tuple[Any, ...], msg: str) -> ValidationError:
+    return ValidationError([{"loc": list(loc), "msg": msg}])
+
+
+def _convert_any(value: Any, loc: Tuple[Any, ...]) -> Any:
+    return value
+
+
+def _convert_str(value: Any, loc: Tuple[Any, ...]) -> str:
+    if not isinstance(value, str):
+        raise _error(loc, "Value is not a valid string.")
+    return value
+
+
+def _convert_int(value: Any, loc: Tuple[Any, ...]) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    raise _error(loc, "Value is not a valid integer.")
+
+
+def _convert_float(value: Any, loc: Tuple[Any, ...]) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    raise _error(loc, "Value is not a valid float.")
+
+
+def _convert_bool(value: Any, loc: Tuple[Any, ...]) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.lower()
+        if lowered in _TRUE_VALUES:
+            return True
+        if lowered in _FALSE_VALUES:
+            return False
+    raise _error(loc, "Value is not a valid boolean.")
+
+
+def _convert_dict(value: Any, loc: Tuple[Any, ...]) -> dict:
+    if not isinstance(value, dict):
+        raise _error(loc, "Value is not a valid object.")
+    return value
+
+
+_PRIMITIVE_CONVERTERS: Dict[Any, Converter] = {
+    Any: _convert_any,
+    str: _convert_str,
+    int: _convert_int,
+    float: _convert_float,
+    bool: _convert_bool,
+    dict: _convert_dict,
+}
+
+
+def is_model(annotation: Any) -> bool:
+    """
+    Check if annotation is a dataclass or attrs class, parsed from JSON object.
+    """
+    return inspect.isclass(annotation) and (
+        dataclasses.is_dataclass(annotation) or attr.has(annotation)
+    )
+
+
+def unwrap_optional(annotation: Any) -> Tuple[Any, bool]:
+    if getattr(annotation, "__origin__", None) is typing.Union:
+        args = [arg for arg in annotation.__args__ if arg is not type(None)]
+        if len(args) == 1 and len(args) < len(annotation.__args__):
+            return args[0], True
+    return annotation, False
+
+
+def model_fields(model: type) -> List[Tuple[str, Any, bool]]:
+    """
+    Get model fields as `(name, annotation, required)` tuples.
+    """
+    hints = typing.get_type_hints(model)
+    if dataclasses.is_dataclass(model):
+        return [
+            (
+                field.name,
+                hints.get(field.name, field.type),
+                field.default is dataclasses.MISSING
+                and field.default_factory is dataclasses.MISSING,  # type: ignore
+            )
+            for field in dataclasses.fields(model)
+            if field.init
+        ]
+    return [
+        (
+            field.name,
+            hints.get(field.name, field.type) or Any,
+            field.default is attr.NOTHING,
+        )
+        for field in attr.fields(model)
+        if field.init
+    ]
+
+
+def compile_converter(annotation: Any) -> Converter:
+    """
+    Compile value converter for type annotation.
+    """
+    annotation, optional = unwrap_optional(annotation)
+    converter = _compile_converter(annotation)
+    if not optional:
+        return converter
+
+    def convert_optional(value: Any, loc: Tuple[Any, ...]) -> Any:
+        if value is None:
+            return None
+        return converter(value, loc)
+
+    return convert_optional
+
+
+def _compile_converter(annotation: Any) -> Converter:
+    if annotation in _PRIMITIVE_CONVERTERS:
+        return _PRIMITIVE_CONVERTERS[annotation]
+
+    if is_model(annotation):
+        return _compile_model_converter(annotation)
+
+    if inspect.isclass(annotation) and issubclass(annotation, enum.Enum):
+        enum_class = annotation
+
+        def convert_enum(value: Any, loc: Tuple[Any, ...]) -> Any:
+            try:
+                return enum_class(value)
+            except ValueError:
+                choices = ", ".join(repr(member.value) for member in enum_class)
+                raise _error(loc, f"Value is not a valid choice ({choices}).")
+
+        return convert_enum
+
+    origin = getattr(annotation, "__origin__", None)
+    args: Tuple[Any, ...] = getattr(annotation, "__args__", None) or ()
+    if origin in (list, List):
+        item_converter = compile_converter(args[0] if args else Any)
+
+        def convert_list(value: Any, loc: Tuple[Any, ...]) -> list:
+            if not isinstance(value, list):
+                raise _error(loc, "Value is not a valid list.")
+            items = []
+            errors = []
+            for index, item in enumerate(value):
+                try:
+                    items.append(item_converter(item, loc + (index,)))
+                except ValidationError as exc:
+                    errors.extend(exc.errors)
+            if errors:
+                raise ValidationError(errors)
+            return items
+
+        return convert_list
+    if origin in (dict, Dict):
+        value_converter = compile_converter(args[1] if len(args) == 2 else Any)
+
+        def convert_dict(value: Any, loc: Tuple[Any, ...]) -> dict:
+            value = _convert_dict(value, loc)
+            items = {}
+            errors = []
+            for key, item in value.items():
+                try:
+                    items[key] = value_converter(item, loc + (key,))
+                except ValidationError as exc:
+                    errors.extend(exc.errors)
+            if errors:
+                raise ValidationError(errors)
+            return items
+
+        return convert_dict
+
+    raise ImproperlyConfigured(f"Unsupported parameter type {annotation!r}.")
+
+
+def _compile_model_converter(model: type) -> Converter:
+    fields = [
+        (name, compile_converter(annotation), required)
+        for name, annotation, required in model_fields(model)
+    ]
+
+    def convert_model(value: Any, loc: Tuple[Any, ...]) -> Any:
+        value = _convert_dict(value, loc)
+        kwargs = {}
+        errors = []
+        for name, converter, required in fields:
+            item = value.get(name, _missing)
+            if item is _missing:
+                if required:
+                    errors.append(
+                        {"loc": list(loc + (name,)), "msg": "Field required."}
+                    )
+                continue
+            try:
+                kwargs[name] = converter(item, loc + (name,))
+            except ValidationError as exc:
+                errors.extend(exc.errors)
+        if errors:
+            raise ValidationError(errors)
+        return model(**kwargs)
+
+    return convert_model
+
+
+@attr.dataclass(frozen=True)
+class Param:
+    name: str
+    source: str
+    converter: Converter
+    annotation: Any = Any
+    default: Any = _missing
+    many: bool = False
+
+    @property
+    def required(self) -> bool:
+        return self.default is _missing
+
+
+class ParamsParser:
+    """
+    View parameters parser compiled from view type annotations.
+
+    Parameters matching path converters or view kwargs are passed as is,
+    dataclass and attrs class parameters are parsed from JSON body,
+    other parameters are parsed from query string.
+    """
+
+    def __init__(self, view: Callable, path: str, view_kwargs: Optional[dict] = None):
+        self.view = view
+        self.params: List[Param] = []
+
+        path_params = {
+            match.group("parameter") for match in PATH_PARAMETER_RE.finditer(path)
+        }
+        path_params.update(view_kwargs or ())
+
+        hints = typing.get_type_hints(view)
+        parameters = list(inspect.signature(view).parameters.values())[1:]
+        body_params = [
+            parameter
+            for parameter in parameters
+            if parameter.name not in path_params and is_model(hints.get(parameter.name))
+        ]
+        for parameter in parameters:
+            if parameter.name in path_params or parameter.kind in (
+                parameter.VAR_POSITIONAL,
+                parameter.VAR_KEYWORD,
+            ):
+                continue
+            annotation = hints.get(parameter.name, str)
+            default = (
+                _missing if parameter.default is parameter.empty else parameter.default
+            )
+            if parameter in body_params:
+                source = "body" if len(body_params) == 1 else "body_field"
+                self.params.append(
+                    Param(
+                        name=parameter.name,
+                        source=source,
+                        converter=compile_converter(annotation),
+                        annotation=annotation,
+                        default=default,
+                    )
+                )
+                continue
+            unwrapped, _ = unwrap_optional(annotation)
+            many = getattr(unwrapped, "__origin__", None) in (list, List)
+            self.params.append(
+                Param(
+                    name=parameter.name,
+                    source="query",
+                    converter=compile_converter(annotation),
+                    annotation=annotation,
+                    default=default,
+                    many=many,
+                )
+            )
+        self.has_body = bool(body_params)
+        self.embed_body = len(body_params) > 1
+
+    def parse(self, request: Any, kwargs: dict) -> dict:
+        """
+        Parse and validate view parameters, raising `APIException(422)` on errors.
+        """
+        params = dict(kwargs)
+        body = self._body(request) if self.has_body else None
+        query = request.GET
+        errors: List[dict] = []
+        for param in self.params:
+            if param.source == "query":
+                if param.many:
+                    value = query.getlist(param.name) or _missing
+                else:
+                    value = query.get(param.name, _missing)
+                loc: Tuple[Any, ...] = ("query", param.name)
+            elif param.source == "body":
+                value = body
+                loc = ("body",)
+            else:
+                value = body.get(param.name, _missing)  # type: ignore
+                loc = ("body", param.name)
+            if value is _missing:
+                if param.required:
+                    errors.append({"loc": list(loc), "msg": "Field required."})
+                else:
+                    params[param.name] = param.default
+                continue
+            try:
+                params[param.name] = param.converter(value, loc)
+            except ValidationError as exc:
+                errors.extend(exc.errors)
+        if errors:
+            raise APIException(
+                status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail=errors
+            )
+        return params
+
+    def _body(self, request: Any) -> Any:
+        if isinstance(request, Request):
+            body = request.json()
+        else:
+            try:
+                body = get_json_backend().loads(request.body)
+            except ValueError:
+                raise APIException(
+                    status_code=HTTPStatus.BAD_REQUEST, detail=_("Invalid JSON body.")
+                )
+        if self.embed_body and not isinstance(body, dict):
+            raise APIException(
+                status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+                detail=[{"loc": ["body"], "msg": "Value is not a valid object."}],
+            )
+        return body
+
+
+def typed_view(view: Callable, parser: ParamsParser) -> Callable:
+    """
+    Wrap view to receive parsed and validated parameters.
+    """
+    if asyncio.iscoroutinefunction(view):
+
+        @wraps(view)
+        async def async_typed_view(request: HttpRequest, *args, **kwargs) -> Any:
+            return await view(request, *args, **parser.parse(request, kwargs))
+
+        return async_typed_view
+
+    @wraps(view)
+    def typed_view(request: HttpRequest, *args, **kwargs) -> Any:
+        return view(request, *args, **parser.parse(request, kwargs))
+
+    return typed_view
@@ -0,0 +1,254 @@
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+import attr
+from django.core.cache import DEFAULT_CACHE_ALIAS, BaseCache, caches
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpRequest
+
+from apirouter.exceptions import APIException
+from apirouter.utils import check_request
+
+_RATE_RE = re.compile(r"^(?P<limit>\d+)/(?P<multiplier>\d*)(?P<unit>[smhd])$")
+
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+ALGORITHMS = ("token_bucket", "sliding_window")
+
+# Tolerance of clock and interval float rounding, in seconds
+_EPSILON = 1e-6
+
+
+def parse_rate(rate: str) -> Tuple[int, float]:
+    """
+    Parse rate string like `100/m` or `10/5s` to `(limit, period)` tuple.
+    """
+    match = _RATE_RE.match(rate)
+    if not match:
+        raise ImproperlyConfigured(f"Invalid rate {rate!r}, expected e.g. '100/m'.")
+    multiplier = int(match.group("multiplier") or 1)
+    return int(match.group("limit")), float(multiplier * _UNITS[match.group("unit")])
+
+
+class RateLimitStore:
+    """
+    Rate limit counters store.
+
+    Algorithm methods count a hit and return seconds to wait before the next
+    allowed hit, zero if the hit is allowed.
+    """
+
+    def token_bucket(self, key: str, limit: int, period: float) -> float:
+        raise NotImplementedError  # pragma: no cover
+
+    def sliding_window(self, key: str, limit: int, period: float) -> float:
+        raise NotImplementedError  # pragma: no cover
+
+
+def _gcra(tat: Optional[float], now: float, limit: int, period: float) -> float:
+    """
+    Token bucket as generic cell rate algorithm, returns new theoretical
+    arrival time, or negative retry delay if the bucket is empty.
+    """
+    interval = period / limit
+    new_tat = max(tat or now, now) + interval
+    overflow = new_tat - now - period
+    if overflow > _EPSILON:
+        return -overflow
+    return new_tat
+
+
+def _window(now: float, period: float) -> Tuple[int, float]:
+    """
+    Get current fixed window index and elapsed window fraction.
+    """
+    position = now / period
+    index = int(position)
+    return index, position - index
+
+
+class MemoryStore(RateLimitStore):
+    """
+    In-process rate limit store for single process deployments.
+
+    Keys are kept in LRU order, at most `max_keys` of them, the least recently
+    hit key is evicted per new key, so floods of distinct keys stay cheap.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, float]" = OrderedDict()
+        self._windows: "OrderedDict[str, Tuple[int, int, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _store(self, keys: OrderedDict, key: str, value: object) -> None:
+        keys[key] = value
+        keys.move_to_end(key)
+        if len(keys) > self.max_keys:
+            keys.popitem(last=False)
+
+    def token_bucket(self, key: str, limit: int, period: float) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tat = _gcra(self._buckets.get(key), now, limit, period)
+            if tat < 0:
+                return -tat
+            self._store(self._buckets, key, tat)
+        return 0.0
+
+    def sliding_window(self, key: str, limit: int, period: float) -> float:
+        index, elapsed = _window(time.monotonic(), period)
+        with self._lock:
+            window, current, previous = self._windows.get(key, (index, 0, 0))
+            if window != index:
+                previous = current if window == index - 1 else 0
+                current = 0
+            estimate = previous * (1 - elapsed) + current
+            if estimate >= limit:
+                self._store(self._windows, key, (index, current, previous))
+                return _sliding_window_retry(previous, current, elapsed, limit, period)
+            self._store(self._windows, key, (index, current + 1, previous))
+        return 0.0
+
+
+def _sliding_window_retry(
+    previous: int, current: int, elapsed: float, limit: int, period: float
+) -> float:
+    if previous:
+        # Previous window weight decreasing enough to admit one more hit
+        wait = (previous * (1 - elapsed) + current - limit + 1) / previous * period
+        if elapsed + wait / period < 1:
+            return max(wait, 0.001)
+    return (1 - elapsed) * period
+
+
+@attr.dataclass(frozen=True)
+class CacheStore(RateLimitStore):
+    """
+    Rate limit store over Django cache framework, shared by processes and nodes.
+
+    Sliding window counters use atomic `cache.incr()`. Token bucket state is
+    read and written non atomically, so concurrent hits are limited approximately.
+    """
+
+    cache_alias: str = DEFAULT_CACHE_ALIAS
+    key_prefix: str = "apirouter:ratelimit"
+
+    @property
+    def cache(self) -> BaseCache:
+        return caches[self.cache_alias]
+
+    def token_bucket(self, key: str, limit: int, period: float) -> float:
+        cache_key = f"{self.key_prefix}:tb:{key}"
+        now = time.time()
+        tat = _gcra(self.cache.get(cache_key), now, limit, period)
+        if tat < 0:
+            return -tat
+        self.cache.set(cache_key, tat, math.ceil(period))
+        return 0.0
+
+    def sliding_window(self, key: str, limit: int, period: float) -> float:
+        index, elapsed = _window(time.time(), period)
+        current_key = f"{self.key_prefix}:sw:{key}:{index}"
+        previous = self.cache.get(f"{self.key_prefix}:sw:{key}:{index - 1}", 0)
+        self.cache.add(current_key, 0, math.ceil(period * 2))
+        try:
+            current = self.cache.incr(current_key)
+        except ValueError:
+            # Expired between add and incr
+            self.cache.set(current_key, 1, math.ceil(period * 2))
+            current = 1
+        if previous * (1 - elapsed) + current - 1 >= limit:
+            self.cache.decr(current_key)
+            return _sliding_window_retry(previous, current - 1, elapsed, limit, period)
+        return 0.0
+
+
+def ip_key(request: HttpRequest) -> str:
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def user_key(request: HttpRequest) -> str:
+    """
+    Key by authenticated user, falling back to client IP address.
+    """
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return f"user:{user.pk}"
+    return f"ip:{ip_key(request)}"
+
+
+KEY_FUNCTIONS: Dict[str, Callable[[HttpRequest], str]] = {
+    "ip": ip_key,
+    "user": user_key,
+}
+
+
+@attr.dataclass(frozen=True)
+class RateLimit:
+    """
+    Route rate limit options.
+
+    `key` is `"ip"`, `"user"` or a callable taking request and returning a key
+    string. Limits are counted per route, or shared by routes with same `scope`.
+    """
+
+    rate: str
+    key: Union[str, Callable[[HttpRequest], str]] = "ip"
+    algorithm: str = "token_bucket"
+    scope: Optional[str] = None
+    methods: Optional[Sequence[str]] = None
+    store: RateLimitStore = attr.Factory(MemoryStore)
+    limit: int = attr.ib(init=False)
+    period: float = attr.ib(init=False)
+    key_func: Callable[[HttpRequest], str] = attr.ib(init=False)
+
+    def __attrs_post_init__(self):
+        limit, period = parse_rate(self.rate)
+        object.__setattr__(self, "limit", limit)
+        object.__setattr__(self, "period", period)
+        if self.algorithm not in ALGORITHMS:
+            raise ImproperlyConfigured(
+                f"Invalid rate limit algorithm {self.algorithm!r}, "
+                f"expected one of {ALGORITHMS}."
+            )
+        if callable(self.key):
+            key_func = self.key
+        elif self.key in KEY_FUNCTIONS:
+            key_func = KEY_FUNCTIONS[self.key]
+        else:
+            raise ImproperlyConfigured(f"Invalid rate limit key {self.key!r}.")
+        object.__setattr__(self, "key_func", key_func)
+
+    def check(self, request: HttpRequest, scope: str) -> Optional[APIException]:
+        """
+        Count request hit, returning `APIException(429)` if limit is exceeded.
+        """
+        if self.methods and request.method not in self.methods:
+            return None
+        key = f"{self.scope or scope}:{self.key_func(request)}"
+        retry_after = getattr(self.store, self.algorithm)(key, self.limit, self.period)
+        if not retry_after:
+            return None
+        return APIException(
+            status_code=HTTPStatus.TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+def rate_limit_view(
+    view: Callable, rate_limit: RateLimit, scope: str, exception_handler: Callable
+) -> Callable:
+    """
+    Wrap view with rate limit, rejecting requests before the view is handled.
+    """
+    return check_request(
+        view,
+        check=lambda request: rate_limit.check(request, scope),
+        exception_handler=exception_handler,
+    )
@@ -1,6 +1,15 @@
-import json
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+    cast,
+)
 
 from django.contrib.sessions.backends.base import SessionBase
 from django.core.files.uploadhandler import FileUploadHandler
@@ -8,10 +17,12 @@ from django.http import HttpRequest
 from django.http.request import RAISE_ERROR, HttpHeaders, QueryDict
 from django.urls import ResolverMatch
 from django.utils.datastructures import MultiValueDict
-from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
+from apirouter.body import iter_json_items
 from apirouter.exceptions import APIException
+from apirouter.json_backends import get_json_backend
+from apirouter.negotiation import Negotiation, default_negotiation
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AnonymousUser, User  # pragma: no cover
@@ -19,20 +30,48 @@ if TYPE_CHECKING:
 _missing = object()
 
 
+def _request_attribute(name: str) -> property:
+    """
+    Make property delegating reads and writes to the wrapped request attribute.
+    """
+
+    def fget(self: "Request") -> Any:
+        return getattr(self._request, name)
+
+    def fset(self: "Request", value: Any) -> None:
+        setattr(self._request, name, value)
+
+    return property(fget, fset)
+
+
 class Request:
     """
     Request class.
+
+    Wrapper state is kept in slots, `__dict__` is only allocated when custom
+    attributes are assigned. Attributes not defined on the class are read from
+    the wrapped request.
     """
 
+    __slots__ = ("_request", "_json", "_data", "negotiation", "__dict__")
+
     def __init__(self, request: HttpRequest):
         self._request = request
-        self._json: Optional[Any] = _missing
+        self._json: Any = _missing
+        self._data: Any = _missing
+        self.negotiation: Optional[Negotiation] = None
 
     def __getattr__(self, attr: str) -> Any:
-        try:
-            return getattr(self._request, attr)
-        except AttributeError:
-            return self.__getattribute__(attr)
+        value = getattr(self._request, attr, _missing)
+        if value is _missing:
+            return object.__getattribute__(self, attr)
+        return value
+
+    META = _request_attribute("META")
+    GET = _request_attribute("GET")
+    POST = _request_attribute("POST")
+    COOKIES = _request_attribute("COOKIES")
+    FILES = _request_attribute("FILES")
 
     @property
     def query_params(self) -> QueryDict:
@@ -86,7 +125,7 @@ class Request:
     def content_params(self) -> dict:
         return self._request.content_params
 
-    @cached_property
+    @property
     def headers(self) -> HttpHeaders:
         return self._request.headers
 
@@ -170,13 +209,32 @@ class Request:
         """
         if self._json is _missing:
             try:
-                self._json = json.loads(self.body)
+                self._json = get_json_backend().loads(self._request.body)
             except ValueError:
                 raise APIException(
                     status_code=HTTPStatus.BAD_REQUEST, detail=_("Invalid JSON body.")
                 )
         return self._json
 
+    @property
+    def data(self) -> Any:
+        """
+        Get request body parsed by `Content-Type`, `None` for empty body.
+
+        Parsers are selected from router content negotiation options, JSON, form
+        and installed binary formats parsers are used by default.
+        """
+        if self._data is _missing:
+            negotiation = self.negotiation or default_negotiation
+            self._data = negotiation.parse(self._request)
+        return self._data
+
+    def iter_json_items(self, chunk_size: int = 65536) -> Iterator[Any]:
+        """
+        Parse top-level JSON array body items incrementally, in constant memory.
+        """
+        return iter_json_items(self._request.read, chunk_size=chunk_size)
+
     @property
     def session(self) -> SessionBase:
         session = getattr(self._request, "session", None)
@@ -0,0 +1,147 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import attr
+from django.core.exceptions import ImproperlyConfigured
+from django.urls.resolvers import (
+    Resolver404,
+    ResolverMatch,
+    RoutePattern,
+    URLPattern,
+    URLResolver,
+)
+
+
+@attr.dataclass(frozen=True)
+class CompiledRoute:
+    index: int
+    route: str
+    pattern: URLPattern
+    match: RoutePattern
+    default_kwargs: dict
+    app_names: List[str]
+    namespaces: List[str]
+
+    def resolve(self, path: str) -> Optional[ResolverMatch]:
+        match = self.match.match(path)
+        if not match:
+            return None
+        _, args, kwargs = match
+        kwargs = {**self.default_kwargs, **kwargs, **self.pattern.default_args}
+        return ResolverMatch(
+            self.pattern.callback,
+            args,
+            kwargs,
+            self.pattern.name,
+            app_names=self.app_names,
+            namespaces=self.namespaces,
+            route=self.route,
+        )
+
+
+@attr.dataclass
+class RouteNode:
+    routes: List[CompiledRoute] = attr.Factory(list)
+    children: Dict[str, "RouteNode"] = attr.Factory(dict)
+
+
+class CompiledURLResolver(URLResolver):
+    """
+    URL resolver flattening nested `path()` patterns into a dispatch table.
+
+    Static routes are resolved with a single dictionary lookup. Dynamic routes
+    are indexed in a trie by their literal leading path segments, so only
+    routes sharing the request path prefix are matched with regular expressions.
+    Nested patterns are kept as is, so `reverse()` and namespaces keep working.
+    """
+
+    def __init__(self, urlpatterns: List[Any]):
+        super().__init__(RoutePattern(""), urlpatterns)
+        self._static_routes: Dict[str, CompiledRoute] = {}
+        self._dynamic_routes = RouteNode()
+        self._tried: List[List[Any]] = []
+        self._compile()
+
+    def resolve(self, path: Any) -> ResolverMatch:
+        path = str(path)
+        static_route = self._static_routes.get(path)
+        best_index = static_route.index if static_route else len(self._tried)
+
+        for route in self._candidates(path):
+            if route.index > best_index:
+                break
+            resolved = route.resolve(path)
+            if resolved:
+                return resolved
+
+        if static_route:
+            return static_route.resolve(path)  # type: ignore
+        raise Resolver404({"tried": self._tried, "path": path})
+
+    def _candidates(self, path: str) -> List[CompiledRoute]:
+        node = self._dynamic_routes
+        candidates = list(node.routes)
+        for segment in path.split("/"):
+            child = node.children.get(segment)
+            if child is None:
+                break
+            node = child
+            candidates.extend(node.routes)
+        candidates.sort(key=lambda route: route.index)
+        return candidates
+
+    def _compile(self) -> None:
+        for route in self._flatten(self.url_patterns, routes=[]):
+            self._tried.append([route.pattern])
+            segments = route.route.split("/")
+            if not any("<" in segment for segment in segments):
+                self._static_routes.setdefault(route.route, route)
+                continue
+            node = self._dynamic_routes
+            for segment in segments:
+                if "<" in segment:
+                    break
+                node = node.children.setdefault(segment, RouteNode())
+            node.routes.append(route)
+
+    def _flatten(
+        self,
+        patterns: List[Any],
+        routes: List[CompiledRoute],
+        prefix: str = "",
+        default_kwargs: Optional[dict] = None,
+        app_names: Tuple[str, ...] = (),
+        namespaces: Tuple[str, ...] = (),
+    ) -> List[CompiledRoute]:
+        for pattern in patterns:
+            if not isinstance(pattern.pattern, RoutePattern):
+                raise ImproperlyConfigured(
+                    "CompiledURLResolver supports only path() patterns, "
+                    f"got {pattern.pattern!r}."
+                )
+            route = prefix + str(pattern.pattern)
+            if isinstance(pattern, URLResolver):
+                self._flatten(
+                    pattern.url_patterns,
+                    routes=routes,
+                    prefix=route,
+                    default_kwargs={**(default_kwargs or {}), **pattern.default_kwargs},
+                    app_names=app_names + _optional(pattern.app_name),
+                    namespaces=namespaces + _optional(pattern.namespace),
+                )
+            else:
+                routes.append(
+                    CompiledRoute(
+                        index=len(routes),
+                        route=route,
+                        pattern=pattern,
+                        match=RoutePattern(route, name=pattern.name, is_endpoint=True),
+                        default_kwargs=default_kwargs or {},
+                        app_names=list(app_names),
+                        namespaces=list(namespaces),
+                    )
+                )
+        return routes
+
+
+def _optional(value: Optional[str]) -> Tuple[str, ...]:
+    return (value,) if value else ()
@@ -1,8 +1,15 @@
-from typing import Any, Optional, Union
+from collections.abc import Iterator
+from typing import Any, Iterable, Optional, Union
 
-from django.http.response import HttpResponse, JsonResponse as DjangoJsonResponse
+from django.db.models import QuerySet
+from django.http.response import (
+    HttpResponse,
+    JsonResponse as DjangoJsonResponse,
+    StreamingHttpResponse,
+)
 from django.utils.encoding import force_bytes
 
+from apirouter.json_backends import get_json_backend
 from apirouter.utils import set_response_headers
 
 
@@ -20,8 +27,68 @@ class Response(HttpResponse):
 
 
 class JsonResponse(DjangoJsonResponse):
+    """
+    JSON response encoded with configured `APIROUTER_JSON_BACKEND`.
+
+    Passing Django `encoder` or `json_dumps_params` falls back to `json.dumps`.
+    """
+
     def __init__(self, data: Any, headers: Optional[dict] = None, **kwargs):
-        kwargs["safe"] = False
-        super().__init__(data, **kwargs)
+        if "encoder" in kwargs or "json_dumps_params" in kwargs:
+            kwargs["safe"] = False
+            super().__init__(data, **kwargs)
+        else:
+            kwargs.pop("safe", None)
+            kwargs.setdefault("content_type", "application/json")
+            super(DjangoJsonResponse, self).__init__(
+                get_json_backend().dumps(data), **kwargs
+            )
+
+        set_response_headers(self, headers)
+
+
+class StreamingJsonResponse(StreamingHttpResponse):
+    """
+    JSON array response encoded incrementally, `chunk_size` items at a time.
+
+    QuerySets are iterated with `.iterator()`, so results are not cached in memory.
+    """
+
+    def __init__(
+        self,
+        data: Iterable,
+        headers: Optional[dict] = None,
+        chunk_size: int = 1000,
+        **kwargs
+    ):
+        kwargs.setdefault("content_type", "application/json")
+        if isinstance(data, QuerySet):
+            data = data.iterator(chunk_size=chunk_size)
+        super().__init__(self._encode(data, chunk_size), **kwargs)
 
         set_response_headers(self, headers)
+
+    @staticmethod
+    def _encode(data: Iterable, chunk_size: int) -> Iterable[bytes]:
+        dumps = get_json_backend().dumps
+        chunk = []
+        separator = b"["
+        for item in data:
+            chunk.append(dumps(item))
+            if len(chunk) >= chunk_size:
+                yield separator + b",".join(chunk)
+                chunk = []
+                separator = b","
+        if chunk:
+            yield separator + b",".join(chunk) + b"]"
+        elif separator == b"[":
+            yield b"[]"
+        else:
+            yield b"]"
+
+
+def is_streamable(content: Any) -> bool:
+    """
+    Check whether view result should be streamed with `StreamingJsonResponse`.
+    """
+    return isinstance(content, (Iterator, QuerySet))
@@ -1,54 +1,115 @@
+import asyncio
 import inspect
-from functools import wraps
-from typing import Callable, List, Optional, Type, Union
+import logging
+import time
+from functools import partial, wraps
+from typing import Any, Callable, Dict, List, Optional, Type, Union, cast
 
 import attr
-from django.http import HttpRequest, HttpResponse
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db.models import QuerySet
+from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed
+from django.http.response import HttpResponseBase
 from django.urls import include, path as url_path
 from django.urls.resolvers import URLPattern
 from django.utils.functional import cached_property
 from django.views import View
-from django.views.decorators.http import require_http_methods
 
+from apirouter.batch import Batch
+from apirouter.body import limit_body_size
+from apirouter.cache import ResponseCache, cache_response
+from apirouter.compression import Compression, compress_view
+from apirouter.conditional import condition_etag_key, set_etag
 from apirouter.conf import (
     get_default_exception_handler,
     get_default_request_class,
     get_default_response_class,
+    get_default_streaming_response_class,
 )
 from apirouter.decorators import compose_decorators
+from apirouter.executors import ThreadPool, offload_view
+from apirouter.fields import FieldSelection, select_fields_view
+from apirouter.idempotency import Idempotency, idempotent_view
+from apirouter.instrumentation import Instrument, ViewTimer
+from apirouter.lazy import RouterStats, import_view, lazy_view
+from apirouter.negotiation import Negotiation
+from apirouter.openapi import OpenAPISchema
+from apirouter.pagination import Pagination, paginate_view
+from apirouter.params import ParamsParser, typed_view
+from apirouter.ratelimit import RateLimit, rate_limit_view
 from apirouter.request import Request
+from apirouter.resolvers import CompiledURLResolver
+from apirouter.response import is_streamable
+from apirouter.sse import stream_view
 from apirouter.types import ExceptionHandlerType, RequestType
-from apirouter.utils import removeprefix
+from apirouter.utils import is_asgi_request, is_async_view, removeprefix
+
+logger = logging.getLogger("apirouter")
 
 
 @attr.dataclass(frozen=True)
 class APIViewFuncRoute:
     path: str
-    view_func: Callable
+    view_func: Union[Callable, str]
     view_kwargs: Optional[dict] = None
     methods: Optional[List[str]] = None
     name: Optional[str] = None
     request_class: Optional[Type[RequestType]] = None
+    cache: Optional[ResponseCache] = None
+    etag: Optional[bool] = None
+    etag_key: Optional[Callable] = None
+    rate_limit: Optional[RateLimit] = None
+    max_body_size: Optional[int] = None
+    compression: Optional[Compression] = None
+    executor: Optional[Union[str, ThreadPool]] = None
+    paginate: Optional[Pagination] = None
+    fields: Optional[FieldSelection] = None
+    negotiation: Optional[Negotiation] = None
+    idempotent: Optional[Union[bool, Idempotency]] = None
+    typed: Optional[bool] = None
+    is_async: bool = attr.ib(init=False)
 
     def __attrs_post_init__(self):
         object.__setattr__(self, "path", removeprefix(self.path, prefix="/"))
         if self.methods:
-            view_func = require_http_methods(self.methods)(self.view_func)
-            object.__setattr__(self, "view_func", view_func)
+            methods = [method.upper() for method in self.methods]
+            object.__setattr__(self, "methods", methods)
+        if isinstance(self.view_func, str):
+            # Dotted path, imported when the route is loaded
+            object.__setattr__(self, "is_async", False)
+            return
+        object.__setattr__(self, "is_async", is_async_view(self.view_func))
 
 
 @attr.dataclass(frozen=True)
 class APIViewClassRoute:
     path: str
-    view: Union[Type[View], Callable]
+    view: Union[Type[View], Callable, str]
     view_func: Callable = attr.ib(init=False)
     view_kwargs: Optional[dict] = None
     name: Optional[str] = None
     decorators: Optional[List[Callable]] = None
     request_class: Optional[Type[RequestType]] = None
+    cache: Optional[ResponseCache] = None
+    etag: Optional[bool] = None
+    etag_key: Optional[Callable] = None
+    rate_limit: Optional[RateLimit] = None
+    max_body_size: Optional[int] = None
+    compression: Optional[Compression] = None
+    executor: Optional[Union[str, ThreadPool]] = None
+    paginate: Optional[Pagination] = None
+    fields: Optional[FieldSelection] = None
+    negotiation: Optional[Negotiation] = None
+    idempotent: Optional[Union[bool, Idempotency]] = None
+    is_async: bool = attr.ib(init=False)
 
     def __attrs_post_init__(self):
         object.__setattr__(self, "path", removeprefix(self.path, prefix="/"))
+        if isinstance(self.view, str):
+            # Dotted path, imported when the route is loaded
+            object.__setattr__(self, "is_async", False)
+            return
+        object.__setattr__(self, "is_async", is_async_view(self.view))
         if inspect.isclass(self.view):
             view_func = self.view.as_view()
         else:
@@ -58,14 +119,27 @@ class APIViewClassRoute:
         object.__setattr__(self, "view_func", view_func)
 
 
+@attr.dataclass(frozen=True)
+class APIMethodsRoute:
+    path: str
+    handlers: Dict[str, APIViewFuncRoute] = attr.Factory(dict)
+    view_kwargs: Optional[dict] = None
+    name: Optional[str] = None
+
+    def __attrs_post_init__(self):
+        object.__setattr__(self, "path", removeprefix(self.path, prefix="/"))
+
+
 @attr.dataclass(frozen=True)
 class APIIncludeRoute:
     router: "APIRouter"
     prefix: str = ""
 
 
-APIRoute = Union[APIViewFuncRoute, APIViewClassRoute]
-APIRouteAny = Union[APIViewFuncRoute, APIViewClassRoute, APIIncludeRoute]
+APIRoute = Union[APIViewFuncRoute, APIViewClassRoute, APIMethodsRoute]
+APIRouteAny = Union[
+    APIViewFuncRoute, APIViewClassRoute, APIMethodsRoute, APIIncludeRoute
+]
 
 
 class APIRouter:
@@ -77,35 +151,220 @@ class APIRouter:
         exception_handler: Optional[ExceptionHandlerType] = None,
         request_class: Optional[Type[RequestType]] = None,
         response_class: Optional[Type[HttpResponse]] = None,
+        streaming_response_class: Optional[Type[HttpResponse]] = None,
+        compiled: bool = False,
+        cache: Optional[ResponseCache] = None,
+        etag: bool = False,
+        instruments: Optional[List[Instrument]] = None,
+        typed: bool = False,
+        openapi_info: Optional[dict] = None,
+        lazy: bool = False,
+        rate_limit: Optional[RateLimit] = None,
+        max_body_size: Optional[int] = None,
+        compression: Optional[Compression] = None,
+        executor: Optional[Union[str, ThreadPool]] = None,
+        paginate: Optional[Pagination] = None,
+        fields: Optional[FieldSelection] = None,
+        negotiation: Optional[Negotiation] = None,
+        idempotent: bool = False,
+        thread_pool: Optional[ThreadPool] = None,
+        idempotency: Optional[Idempotency] = None,
     ):
         self.name = name
         self.decorators = decorators or []
         self.exception_handler = exception_handler or get_default_exception_handler()
         self.request_class = request_class or get_default_request_class()
         self.response_class = response_class or get_default_response_class()
+        self.streaming_response_class = (
+            streaming_response_class or get_default_streaming_response_class()
+        )
+        self.compiled = compiled
+        self.cache = cache
+        self.etag = etag
+        self.instruments = instruments or []
+        self.typed = typed
+        self.openapi_info = openapi_info
+        self.lazy = lazy
+        self.rate_limit = rate_limit
+        self.max_body_size = max_body_size
+        self.compression = compression
+        self.executor = executor
+        self.paginate = paginate
+        self.fields = fields
+        self.negotiation = negotiation
+        self.idempotent = idempotent
+        self.idempotency = idempotency or Idempotency()
+        self.thread_pool = thread_pool or ThreadPool()
+        self.stats = RouterStats(name=name)
         self.routes: List[APIRouteAny] = []
 
     @cached_property
     def urls(self) -> List[URLPattern]:
+        started = time.perf_counter()
         urls = self._build_urls()
         if self.name:
-            return [url_path("", include((urls, self.name)))]
+            urls = [url_path("", include((urls, self.name)))]
+        if self.compiled:
+            urls = [CompiledURLResolver(urls)]
+        self.stats.build_time = time.perf_counter() - started
+        logger.debug("Router URL patterns built: %s", self.stats)
         return urls
 
+    def build_report(self) -> List[RouterStats]:
+        """
+        Get URL patterns build statistics of the router and included routers.
+        """
+        report = [self.stats]
+        for route in self.routes:
+            if isinstance(route, APIIncludeRoute):
+                # Routers included more than once are reported once, stats of
+                # different routers may be equal
+                report.extend(
+                    stats
+                    for stats in route.router.build_report()
+                    if all(stats is not reported for reported in report)
+                )
+        return report
+
+    def load_route(self, route: APIRoute) -> APIRoute:
+        """
+        Import dotted path route targets.
+        """
+        if isinstance(route, APIMethodsRoute):
+            handlers = {
+                method: cast(APIViewFuncRoute, self.load_route(handler))
+                for method, handler in route.handlers.items()
+            }
+            if all(handlers[m] is h for m, h in route.handlers.items()):
+                return route
+            return attr.evolve(route, handlers=handlers)
+        if isinstance(route, APIViewFuncRoute) and isinstance(route.view_func, str):
+            return attr.evolve(
+                route, view_func=import_view(route.view_func, stats=self.stats)
+            )
+        if isinstance(route, APIViewClassRoute) and isinstance(route.view, str):
+            return attr.evolve(route, view=import_view(route.view, stats=self.stats))
+        return route
+
+    @cached_property
+    def openapi_schema(self) -> OpenAPISchema:
+        return OpenAPISchema(self, info=self.openapi_info)
+
+    def openapi(self) -> dict:
+        """
+        Get OpenAPI document, built once on first access.
+        """
+        return self.openapi_schema.document
+
+    def add_openapi_route(
+        self, path: str = "/openapi.json", *, name: Optional[str] = "openapi"
+    ) -> None:
+        """
+        Add route serving pre-encoded OpenAPI document with ETag.
+        """
+        self.add_route(
+            path, self.openapi_schema.view, name=name, methods=["GET", "HEAD"]
+        )
+
+    def add_batch_route(
+        self,
+        path: str = "/batch",
+        *,
+        name: Optional[str] = "batch",
+        max_requests: int = 20,
+        concurrent: bool = False,
+    ) -> None:
+        """
+        Add route executing batch of router sub-requests in one HTTP request.
+
+        With `concurrent=True` sub-requests run concurrently, async views on the
+        event loop and sync views in a thread.
+        """
+        batch = Batch(
+            self,
+            path=removeprefix(path, prefix="/"),
+            max_requests=max_requests,
+            concurrent=concurrent,
+        )
+        self.add_route(path, batch.view(), name=name, methods=["POST"])
+
+    def add_stream_route(
+        self,
+        path: str,
+        view_func: Callable,
+        *,
+        name: Optional[str] = None,
+        request_class: Optional[Type[RequestType]] = None,
+        rate_limit: Optional[RateLimit] = None,
+        heartbeat: Optional[float] = 15,
+        retry: Optional[int] = None,
+        thread_pool: Optional[ThreadPool] = None,
+        typed: Optional[bool] = None,
+    ) -> None:
+        """
+        Add route streaming events of sync or async generator view as
+        server-sent events.
+        """
+        self.add_route(
+            path,
+            stream_view(
+                view_func,
+                heartbeat=heartbeat,
+                retry=retry,
+                thread_pool=thread_pool or self.thread_pool,
+            ),
+            name=name,
+            methods=["GET"],
+            request_class=request_class,
+            rate_limit=rate_limit,
+            typed=typed,
+        )
+
     def include_router(self, router: "APIRouter", *, prefix: str = "") -> None:
         if prefix:
             prefix = removeprefix(prefix, prefix="/")
         self.routes.append(APIIncludeRoute(router=router, prefix=prefix))
 
+    def evict_cache(self, path: str) -> None:
+        """
+        Evict cached responses of the route registered with the given path.
+        """
+        path = removeprefix(path, prefix="/")
+        for route in self.routes:
+            if isinstance(route, APIIncludeRoute) or route.path != path:
+                continue
+            if isinstance(route, APIMethodsRoute):
+                routes: List[Union[APIViewFuncRoute, APIViewClassRoute]] = list(
+                    route.handlers.values()
+                )
+            else:
+                routes = [route]
+            for handler in routes:
+                cache = handler.cache or self.cache
+                if cache:
+                    cache.evict(route_id=self._cache_route_id(handler.path))
+
     def add_route(
         self,
         path: str,
-        view_func: Callable,
+        view_func: Union[Callable, str],
         *,
         view_kwargs: Optional[dict] = None,
         name: Optional[str] = None,
         methods: Optional[List[str]] = None,
         request_class: Optional[Type[RequestType]] = None,
+        cache: Optional[ResponseCache] = None,
+        etag: Optional[bool] = None,
+        etag_key: Optional[Callable] = None,
+        rate_limit: Optional[RateLimit] = None,
+        max_body_size: Optional[int] = None,
+        compression: Optional[Compression] = None,
+        executor: Optional[Union[str, ThreadPool]] = None,
+        paginate: Optional[Pagination] = None,
+        fields: Optional[FieldSelection] = None,
+        negotiation: Optional[Negotiation] = None,
+        idempotent: Optional[Union[bool, Idempotency]] = None,
+        typed: Optional[bool] = None,
     ) -> None:
         self.routes.append(
             APIViewFuncRoute(
@@ -115,18 +374,100 @@ class APIRouter:
                 name=name,
                 methods=methods,
                 request_class=request_class,
+                cache=cache,
+                etag=etag,
+                etag_key=etag_key,
+                rate_limit=rate_limit,
+                max_body_size=max_body_size,
+                compression=compression,
+                executor=executor,
+                paginate=paginate,
+                fields=fields,
+                negotiation=negotiation,
+                idempotent=idempotent,
+                typed=typed,
             )
         )
 
+    def add_method_route(
+        self,
+        path: str,
+        method: str,
+        view_func: Union[Callable, str],
+        *,
+        view_kwargs: Optional[dict] = None,
+        name: Optional[str] = None,
+        request_class: Optional[Type[RequestType]] = None,
+        cache: Optional[ResponseCache] = None,
+        etag: Optional[bool] = None,
+        etag_key: Optional[Callable] = None,
+        rate_limit: Optional[RateLimit] = None,
+        max_body_size: Optional[int] = None,
+        compression: Optional[Compression] = None,
+        executor: Optional[Union[str, ThreadPool]] = None,
+        paginate: Optional[Pagination] = None,
+        fields: Optional[FieldSelection] = None,
+        negotiation: Optional[Negotiation] = None,
+        idempotent: Optional[Union[bool, Idempotency]] = None,
+        typed: Optional[bool] = None,
+    ) -> None:
+        """
+        Add HTTP method handler, merging handlers registered for the same path.
+        """
+        handler = APIViewFuncRoute(
+            path=path,
+            view_func=view_func,
+            view_kwargs=view_kwargs,
+            request_class=request_class,
+            cache=cache,
+            etag=etag,
+            etag_key=etag_key,
+            rate_limit=rate_limit,
+            max_body_size=max_body_size,
+            compression=compression,
+            executor=executor,
+            paginate=paginate,
+            fields=fields,
+            negotiation=negotiation,
+            idempotent=idempotent,
+            typed=typed,
+        )
+        for route in self.routes:
+            if isinstance(route, APIMethodsRoute) and route.path == handler.path:
+                if route.view_kwargs != view_kwargs or (
+                    name and route.name and route.name != name
+                ):
+                    raise ValueError(
+                        f"Conflicting view_kwargs or name for path '{path}'."
+                    )
+                if name and not route.name:
+                    object.__setattr__(route, "name", name)
+                break
+        else:
+            route = APIMethodsRoute(path=path, view_kwargs=view_kwargs, name=name)
+            self.routes.append(route)
+        route.handlers[method.upper()] = handler
+
     def add_view(
         self,
         path: str,
-        view_class: Type[View],
+        view_class: Union[Type[View], str],
         *,
         view_kwargs: Optional[dict] = None,
         name: Optional[str] = None,
         decorators: Optional[List[Callable]] = None,
         request_class: Optional[Type[RequestType]] = None,
+        cache: Optional[ResponseCache] = None,
+        etag: Optional[bool] = None,
+        etag_key: Optional[Callable] = None,
+        rate_limit: Optional[RateLimit] = None,
+        max_body_size: Optional[int] = None,
+        compression: Optional[Compression] = None,
+        executor: Optional[Union[str, ThreadPool]] = None,
+        paginate: Optional[Pagination] = None,
+        fields: Optional[FieldSelection] = None,
+        negotiation: Optional[Negotiation] = None,
+        idempotent: Optional[Union[bool, Idempotency]] = None,
     ) -> None:
         self.routes.append(
             APIViewClassRoute(
@@ -136,6 +477,17 @@ class APIRouter:
                 name=name,
                 decorators=decorators,
                 request_class=request_class,
+                cache=cache,
+                etag=etag,
+                etag_key=etag_key,
+                rate_limit=rate_limit,
+                max_body_size=max_body_size,
+                compression=compression,
+                executor=executor,
+                paginate=paginate,
+                fields=fields,
+                negotiation=negotiation,
+                idempotent=idempotent,
             )
         )
 
@@ -147,6 +499,18 @@ class APIRouter:
         methods: Optional[List[str]] = None,
         name: Optional[str] = None,
         request_class: Optional[Type[RequestType]] = None,
+        cache: Optional[ResponseCache] = None,
+        etag: Optional[bool] = None,
+        etag_key: Optional[Callable] = None,
+        rate_limit: Optional[RateLimit] = None,
+        max_body_size: Optional[int] = None,
+        compression: Optional[Compression] = None,
+        executor: Optional[Union[str, ThreadPool]] = None,
+        paginate: Optional[Pagination] = None,
+        fields: Optional[FieldSelection] = None,
+        negotiation: Optional[Negotiation] = None,
+        idempotent: Optional[Union[bool, Idempotency]] = None,
+        typed: Optional[bool] = None,
     ) -> Callable:
         def decorator(view_func: Callable):
             self.add_route(
@@ -156,11 +520,112 @@ class APIRouter:
                 name=name,
                 methods=methods,
                 request_class=request_class,
+                cache=cache,
+                etag=etag,
+                etag_key=etag_key,
+                rate_limit=rate_limit,
+                max_body_size=max_body_size,
+                compression=compression,
+                executor=executor,
+                paginate=paginate,
+                fields=fields,
+                negotiation=negotiation,
+                idempotent=idempotent,
+                typed=typed,
+            )
+            return view_func
+
+        return decorator
+
+    def method_route(
+        self,
+        method: str,
+        path: str,
+        *,
+        view_kwargs: Optional[dict] = None,
+        name: Optional[str] = None,
+        request_class: Optional[Type[RequestType]] = None,
+        cache: Optional[ResponseCache] = None,
+        etag: Optional[bool] = None,
+        etag_key: Optional[Callable] = None,
+        rate_limit: Optional[RateLimit] = None,
+        max_body_size: Optional[int] = None,
+        compression: Optional[Compression] = None,
+        executor: Optional[Union[str, ThreadPool]] = None,
+        paginate: Optional[Pagination] = None,
+        fields: Optional[FieldSelection] = None,
+        negotiation: Optional[Negotiation] = None,
+        idempotent: Optional[Union[bool, Idempotency]] = None,
+        typed: Optional[bool] = None,
+    ) -> Callable:
+        def decorator(view_func: Callable):
+            self.add_method_route(
+                path,
+                method,
+                view_func,
+                view_kwargs=view_kwargs,
+                name=name,
+                request_class=request_class,
+                cache=cache,
+                etag=etag,
+                etag_key=etag_key,
+                rate_limit=rate_limit,
+                max_body_size=max_body_size,
+                compression=compression,
+                executor=executor,
+                paginate=paginate,
+                fields=fields,
+                negotiation=negotiation,
+                idempotent=idempotent,
+                typed=typed,
+            )
+            return view_func
+
+        return decorator
+
+    def stream(
+        self,
+        path: str,
+        *,
+        name: Optional[str] = None,
+        request_class: Optional[Type[RequestType]] = None,
+        rate_limit: Optional[RateLimit] = None,
+        heartbeat: Optional[float] = 15,
+        retry: Optional[int] = None,
+        thread_pool: Optional[ThreadPool] = None,
+        typed: Optional[bool] = None,
+    ) -> Callable:
+        def decorator(view_func: Callable):
+            self.add_stream_route(
+                path,
+                view_func,
+                name=name,
+                request_class=request_class,
+                rate_limit=rate_limit,
+                heartbeat=heartbeat,
+                retry=retry,
+                thread_pool=thread_pool,
+                typed=typed,
             )
             return view_func
 
         return decorator
 
+    def get(self, path: str, **kwargs) -> Callable:
+        return self.method_route("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> Callable:
+        return self.method_route("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> Callable:
+        return self.method_route("PUT", path, **kwargs)
+
+    def patch(self, path: str, **kwargs) -> Callable:
+        return self.method_route("PATCH", path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> Callable:
+        return self.method_route("DELETE", path, **kwargs)
+
     def view(
         self,
         path: str,
@@ -169,6 +634,17 @@ class APIRouter:
         name: Optional[str] = None,
         decorators: Optional[List[Callable]] = None,
         request_class: Optional[Type[RequestType]] = None,
+        cache: Optional[ResponseCache] = None,
+        etag: Optional[bool] = None,
+        etag_key: Optional[Callable] = None,
+        rate_limit: Optional[RateLimit] = None,
+        max_body_size: Optional[int] = None,
+        compression: Optional[Compression] = None,
+        executor: Optional[Union[str, ThreadPool]] = None,
+        paginate: Optional[Pagination] = None,
+        fields: Optional[FieldSelection] = None,
+        negotiation: Optional[Negotiation] = None,
+        idempotent: Optional[Union[bool, Idempotency]] = None,
     ) -> Callable:
         def decorator(view_class: Type[View]) -> Callable:
             self.add_view(
@@ -178,6 +654,17 @@ class APIRouter:
                 name=name,
                 decorators=decorators,
                 request_class=request_class,
+                cache=cache,
+                etag=etag,
+                etag_key=etag_key,
+                rate_limit=rate_limit,
+                max_body_size=max_body_size,
+                compression=compression,
+                executor=executor,
+                paginate=paginate,
+                fields=fields,
+                negotiation=negotiation,
+                idempotent=idempotent,
             )
             return view_class
 
@@ -229,13 +716,32 @@ class APIRouter:
         """
         Make route URL pattern.
         """
+        self.stats.routes += 1
+        if self.lazy:
+            return self._lazy_path_route(route)
         return url_path(
             route.path,
-            view=self._handle(route),
+            view=self._handle(self.load_route(route)),
             kwargs=route.view_kwargs,
             name=route.name,
         )
 
+    def _lazy_path_route(self, route: APIRoute) -> URLPattern:
+        """
+        Make route URL pattern, loading route handler on first dispatch.
+        """
+        self.stats.lazy_routes += 1
+        pattern = url_path(
+            route.path,
+            view=lazy_view(
+                lambda: self._handle(self.load_route(route)),
+                on_load=lambda handler: setattr(pattern, "callback", handler),
+            ),
+            kwargs=route.view_kwargs,
+            name=route.name,
+        )
+        return pattern
+
     def _include_route(self, route: APIIncludeRoute) -> URLPattern:
         """
         Make include URL pattern.
@@ -260,27 +766,306 @@ class APIRouter:
         """
         Handle route.
         """
+        if isinstance(route, APIMethodsRoute):
+            return self._dispatch_methods(
+                {
+                    method: self._handle(handler)
+                    for method, handler in route.handlers.items()
+                }
+            )
         request_class = route.request_class or self.request_class
-        return self._handle_view(route.view_func, request_class=request_class)
+        etag = self.etag if route.etag is None else route.etag
+        negotiation = route.negotiation or self.negotiation
+        view_func = cast(Callable, route.view_func)
+        if isinstance(route, APIViewFuncRoute) and (
+            self.typed if route.typed is None else route.typed
+        ):
+            parser = ParamsParser(
+                view_func, path=route.path, view_kwargs=route.view_kwargs
+            )
+            view_func = typed_view(view_func, parser=parser)
+        selection = route.fields or self.fields
+        if selection:
+            view_func = select_fields_view(view_func, selection=selection)
+        pagination = route.paginate or self.paginate
+        if pagination:
+            view_func = paginate_view(view_func, pagination=pagination)
+        view = self._handle_view(
+            view_func,
+            request_class=request_class,
+            is_async=route.is_async,
+            etag=etag and not route.etag_key,
+            negotiation=negotiation,
+            route=route,
+        )
+        executor = route.executor or self.executor
+        if executor and not route.is_async:
+            view = offload_view(
+                view,
+                executor=executor,
+                thread_pool=self.thread_pool,
+                exception_handler=self.exception_handler,
+            )
+        compression = route.compression or self.compression
+        if compression:
+            view = compress_view(view, compression=compression)
+        variants = [
+            options.cache_variant for options in (negotiation, compression) if options
+        ]
+        cache = route.cache or self.cache
+        if cache:
+            view = cache_response(
+                view,
+                cache=cache,
+                route_id=self._cache_route_id(route.path),
+                variants=variants,
+            )
+        if route.etag_key:
+            view = condition_etag_key(view, etag_key=route.etag_key, variants=variants)
+        idempotent = self.idempotent if route.idempotent is None else route.idempotent
+        if idempotent:
+            view = idempotent_view(
+                view,
+                idempotency=(
+                    idempotent
+                    if isinstance(idempotent, Idempotency)
+                    else self.idempotency
+                ),
+                scope=self._cache_route_id(route.path),
+                exception_handler=self.exception_handler,
+            )
+        max_body_size = route.max_body_size or self.max_body_size
+        if max_body_size:
+            view = limit_body_size(
+                view,
+                max_body_size=max_body_size,
+                exception_handler=self.exception_handler,
+            )
+        rate_limit = route.rate_limit or self.rate_limit
+        if rate_limit:
+            view = rate_limit_view(
+                view,
+                rate_limit=rate_limit,
+                scope=self._cache_route_id(route.path),
+                exception_handler=self.exception_handler,
+            )
+        if isinstance(route, APIViewFuncRoute) and route.methods:
+            return self._dispatch_methods({method: view for method in route.methods})
+        return view
+
+    def _cache_route_id(self, path: str) -> str:
+        return f"{self.name or ''}/{path}"
+
+    def _dispatch_methods(self, handlers: Dict[str, Callable]) -> Callable:
+        """
+        Dispatch request to handler by HTTP method, responding 405 otherwise.
+        """
+        # `Allow` value is built once, a single item is joined as is
+        allow = (", ".join(handlers),)
+        is_async = all(asyncio.iscoroutinefunction(h) for h in handlers.values())
+        if not is_async:
+            handlers = {
+                method: (
+                    async_to_sync(handler)
+                    if asyncio.iscoroutinefunction(handler)
+                    else handler
+                )
+                for method, handler in handlers.items()
+            }
+        first_handler = next(iter(handlers.values()))
+
+        if is_async:
+
+            @wraps(first_handler)
+            async def async_dispatch(request: HttpRequest, *args, **kwargs):
+                handler = handlers.get(request.method)  # type: ignore
+                if handler is None:
+                    return HttpResponseNotAllowed(allow)
+                return await handler(request, *args, **kwargs)
+
+            return async_dispatch
+
+        @wraps(first_handler)
+        def dispatch(request: HttpRequest, *args, **kwargs):
+            handler = handlers.get(request.method)  # type: ignore
+            if handler is None:
+                return HttpResponseNotAllowed(allow)
+            return handler(request, *args, **kwargs)
+
+        return dispatch
 
     def _handle_view(
-        self, view: Callable, request_class: Type[RequestType]
+        self,
+        view: Callable,
+        request_class: Type[RequestType],
+        is_async: bool = False,
+        etag: bool = False,
+        negotiation: Optional[Negotiation] = None,
+        route: Optional[APIRoute] = None,
     ) -> Callable:
         """
         Handle view.
+
+        Router decorators are composed once, when the URL patterns are built,
+        so the per-request cost does not depend on decorators setup.
         """
+        make_request: Optional[Callable] = (
+            request_class if issubclass(request_class, Request) else None
+        )
+        make_response: Callable = self._make_response
+        if negotiation:
+            make_response = partial(
+                self._make_negotiated_response, negotiation=negotiation
+            )
+            if make_request:
+                make_request = partial(
+                    self._make_negotiated_request,
+                    request_class=request_class,
+                    negotiation=negotiation,
+                )
+        render = (
+            partial(self._make_etag_response, make_response=make_response)
+            if etag
+            else make_response
+        )
+        exception_handler = self.exception_handler
+        if not is_async and asyncio.iscoroutinefunction(exception_handler):
+            exception_handler = async_to_sync(exception_handler)
+
+        if self.instruments:
+            timer = ViewTimer(self.instruments, route=route, is_async=is_async)
+            view = timer.time_view(view)
+            get_response = compose_decorators(*self.decorators)(view)
+            make_request = timer.time_make_request(make_request)
+            get_response = timer.time_get_response(get_response)
+            render = timer.time_render(render)
+            exception_handler = timer.time_exception_handler(exception_handler)
+            wrap = timer.time_request
+        else:
+            get_response = compose_decorators(*self.decorators)(view)
+            wrap = None
 
+        if is_async:
+            wrapped_view = self._wrap_async_view(
+                view,
+                make_request=make_request,
+                get_response=get_response,
+                render=render,
+                exception_handler=exception_handler,
+            )
+        else:
+            wrapped_view = self._wrap_view(
+                view,
+                make_request=make_request,
+                get_response=get_response,
+                render=render,
+                exception_handler=exception_handler,
+            )
+        if wrap:
+            return wrap(wrapped_view)
+        return wrapped_view
+
+    def _wrap_view(
+        self,
+        view: Callable,
+        make_request: Optional[Callable],
+        get_response: Callable,
+        render: Callable,
+        exception_handler: Callable,
+    ) -> Callable:
         @wraps(view)
         def wrapped_view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
-            if issubclass(request_class, Request):
-                request = request_class(request)
+            if make_request:
+                request = make_request(request)
             try:
-                get_response = compose_decorators(*self.decorators)(view)
-                response = get_response(request, *args, **kwargs)
-                if not isinstance(response, HttpResponse):
-                    return self.response_class(response)
-                return response
+                content = get_response(request, *args, **kwargs)
+                if isinstance(content, QuerySet) and is_asgi_request(request):
+                    # ASGI handler iterates streaming responses on the event
+                    # loop, QuerySets are fetched in the view thread instead
+                    content = list(content)
+                return render(request, content)
             except Exception as exc:
-                return self.exception_handler(request, exc)
+                return exception_handler(request, exc)
 
         return wrapped_view
+
+    def _wrap_async_view(
+        self,
+        view: Callable,
+        make_request: Optional[Callable],
+        get_response: Callable,
+        render: Callable,
+        exception_handler: Callable,
+    ) -> Callable:
+        """
+        Wrap coroutine view, awaiting view, decorators and exception handler.
+
+        Returned QuerySets are evaluated in a thread before rendering.
+        """
+
+        @wraps(view)
+        async def wrapped_view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            if make_request:
+                request = make_request(request)
+            try:
+                content = get_response(request, *args, **kwargs)
+                if inspect.isawaitable(content):
+                    content = await content
+                if isinstance(content, QuerySet):
+                    # QuerySets can't be iterated on the event loop after the
+                    # view returns, they are fetched in a thread, not streamed
+                    content = await sync_to_async(list)(content)  # type: ignore
+                return render(request, content)
+            except Exception as exc:
+                response = exception_handler(request, exc)
+                if inspect.isawaitable(response):
+                    response = await response
+                return response
+
+        return wrapped_view
+
+    def _make_response(self, request: RequestType, content: Any) -> HttpResponseBase:
+        """
+        Make HTTP response from view result.
+        """
+        if isinstance(content, HttpResponseBase):
+            return content
+        if is_streamable(content):
+            return self.streaming_response_class(content)
+        return self.response_class(content)
+
+    def _make_negotiated_request(
+        self,
+        request: HttpRequest,
+        request_class: Type[Request],
+        negotiation: Negotiation,
+    ) -> Request:
+        api_request = request_class(request)
+        api_request.negotiation = negotiation
+        return api_request
+
+    def _make_negotiated_response(
+        self, request: RequestType, content: Any, negotiation: Negotiation
+    ) -> HttpResponseBase:
+        """
+        Make HTTP response from view result with renderer selected by `Accept`.
+        """
+        if isinstance(content, HttpResponseBase):
+            return content
+        return negotiation.make_response(
+            request,  # type: ignore
+            content,
+            response_class=self.response_class,
+            streaming_response_class=self.streaming_response_class,
+        )
+
+    def _make_etag_response(
+        self, request: RequestType, content: Any, make_response: Callable
+    ) -> HttpResponseBase:
+        """
+        Make HTTP response from view result with content based ETag.
+        """
+        response = make_response(request, content)
+        if response is content:
+            return response
+        return set_etag(request, response)  # type: ignore
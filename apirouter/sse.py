@@ -0,0 +1,426 @@
+import asyncio
+import contextvars
+import inspect
+import threading
+import time
+from functools import wraps
+from typing import Any, AsyncGenerator, Callable, Iterator, Optional
+
+import attr
+import django
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ImproperlyConfigured
+from django.core.handlers.asgi import ASGIHandler as DjangoASGIHandler
+from django.http import HttpRequest, StreamingHttpResponse
+
+from apirouter.executors import ThreadPool
+from apirouter.json_backends import get_json_backend
+from apirouter.utils import is_asgi_request, set_response_headers
+
+HEARTBEAT = b": heartbeat\n\n"
+
+ASGI_HANDLER_REQUIRED = (
+    "Event streams can't be iterated on the event loop by Django ASGI handler, "
+    "serve ASGI application with apirouter.sse.get_asgi_application()."
+)
+
+# End of events marker, `StopIteration` can't be passed through futures
+_end = object()
+
+# ASGI `receive` callable of the current request, for disconnect detection
+_asgi_receive: contextvars.ContextVar = contextvars.ContextVar("apirouter_receive")
+
+
+@attr.dataclass(frozen=True)
+class Event:
+    """
+    Server-sent event.
+
+    Strings are sent as is, other `data` is encoded to JSON. Views can also
+    yield plain data, it's sent as event `data`.
+    """
+
+    data: Any = None
+    event: Optional[str] = None
+    id: Optional[str] = None
+    retry: Optional[int] = None
+    comment: Optional[str] = None
+
+
+def _field(name: str, value: str) -> str:
+    if "\n" in value or "\r" in value:
+        raise ValueError(f"Event {name} must not contain line breaks.")
+    return f"{name}: {value}\n"
+
+
+def _data_lines(data: Any) -> str:
+    if isinstance(data, bytes):
+        data = data.decode()
+    elif not isinstance(data, str):
+        data = get_json_backend().dumps(data).decode()
+    return "".join(f"data: {line}\n" for line in data.splitlines() or [""])
+
+
+def encode_event(event: Any) -> bytes:
+    """
+    Encode event or plain data to event stream message.
+    """
+    if not isinstance(event, Event):
+        return (_data_lines(event) + "\n").encode()
+    message = ""
+    if event.comment is not None:
+        message += "".join(f": {line}\n" for line in event.comment.splitlines())
+    if event.event is not None:
+        message += _field("event", event.event)
+    if event.id is not None:
+        if "\0" in event.id:
+            raise ValueError("Event id must not contain NULL character.")
+        message += _field("id", event.id)
+    if event.retry is not None:
+        message += f"retry: {int(event.retry)}\n"
+    if event.data is not None:
+        message += _data_lines(event.data)
+    return (message + "\n").encode()
+
+
+def get_last_event_id(request: HttpRequest) -> Optional[str]:
+    """
+    Get id of the last event received by reconnecting client.
+
+    `EventSource` sends `Last-Event-ID` header, `lastEventId` query parameter
+    is used by polyfills not able to set headers.
+    """
+    return request.headers.get("Last-Event-ID") or request.GET.get("lastEventId")
+
+
+class _SyncEvents:
+    """
+    Sync events iterator stepped in worker threads under ASGI.
+
+    Iterator is closed in a worker thread too, after the running step ends.
+    """
+
+    def __init__(self, iterator: Iterator, thread_pool: Optional[ThreadPool]):
+        self.iterator = iterator
+        self.thread_pool = thread_pool
+        self._lock = threading.Lock()
+        self._running = False
+        self._closed = False
+
+    def _step(self) -> Any:
+        with self._lock:
+            if self._closed:
+                return _end
+            self._running = True
+        try:
+            return next(self.iterator, _end)
+        finally:
+            with self._lock:
+                self._running = False
+                closed = self._closed
+            if closed:
+                self._close()
+
+    def _close(self) -> None:
+        close = getattr(self.iterator, "close", None)
+        if close is not None:
+            close()
+
+    async def _run(self, func: Callable) -> Any:
+        if self.thread_pool is not None:
+            return await self.thread_pool.run(func)
+        return await sync_to_async(func, thread_sensitive=False)()
+
+    async def next(self) -> Any:
+        return await self._run(self._step)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            self._closed = True
+            running = self._running
+        if not running:
+            await self._run(self._close)
+
+
+def _check_sync_iteration() -> None:
+    """
+    Check that events aren't iterated synchronously on a running event loop,
+    like Django ASGI handler does with streaming responses.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    raise ImproperlyConfigured(ASGI_HANDLER_REQUIRED)
+
+
+class EventStreamResponse(StreamingHttpResponse):
+    """
+    Server-sent events response streaming sync or async iterable of events.
+
+    A heartbeat comment is sent after `heartbeat` seconds without events, so
+    proxies keep idle connections open and disconnected clients are detected.
+    Sync iterables can yield `None` to let a heartbeat be sent while idle.
+
+    Under WSGI events are iterated in the request thread. Under ASGI, with
+    `apirouter.sse.get_asgi_application()`, async iterables are streamed on the
+    event loop and sync iterables are stepped in `thread_pool` workers.
+    """
+
+    def __init__(
+        self,
+        events: Any,
+        heartbeat: Optional[float] = 15,
+        retry: Optional[int] = None,
+        thread_pool: Optional[ThreadPool] = None,
+        headers: Optional[dict] = None,
+        **kwargs,
+    ):
+        kwargs.setdefault("content_type", "text/event-stream")
+        self.events = events
+        self.heartbeat = heartbeat
+        self.retry = retry
+        self.thread_pool = thread_pool
+        super().__init__(self._iter_chunks(), **kwargs)
+        self["Cache-Control"] = "no-cache"
+        # Disable nginx proxy buffering
+        self["X-Accel-Buffering"] = "no"
+
+        set_response_headers(self, headers)
+
+    @property
+    def is_async_events(self) -> bool:
+        return hasattr(self.events, "__aiter__")
+
+    def _preamble(self) -> Iterator[bytes]:
+        if self.retry is not None:
+            yield encode_event(Event(retry=self.retry))
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        _check_sync_iteration()
+        if self.is_async_events:
+            # Async events outside of ASGI handler run in a private event loop
+            loop = asyncio.new_event_loop()
+            chunks = self.aiter_chunks()
+            try:
+                while True:
+                    try:
+                        yield loop.run_until_complete(chunks.__anext__())
+                    except StopAsyncIteration:
+                        return
+            finally:
+                loop.run_until_complete(chunks.aclose())
+                loop.close()
+
+        yield from self._preamble()
+        iterator = iter(self.events)
+        sent = time.monotonic()
+        try:
+            for event in iterator:
+                if event is None:
+                    if self.heartbeat and time.monotonic() - sent >= self.heartbeat:
+                        sent = time.monotonic()
+                        yield HEARTBEAT
+                    continue
+                sent = time.monotonic()
+                yield encode_event(event)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    async def aiter_chunks(self) -> AsyncGenerator[bytes, None]:
+        """
+        Iterate encoded events on the event loop, with heartbeats.
+        """
+        for chunk in self._preamble():
+            yield chunk
+
+        sync_events: Optional[_SyncEvents] = None
+        if self.is_async_events:
+            iterator = self.events.__aiter__()
+
+            async def next_event() -> Any:
+                try:
+                    return await iterator.__anext__()
+                except StopAsyncIteration:
+                    return _end
+
+        else:
+            sync_events = _SyncEvents(iter(self.events), self.thread_pool)
+            next_event = sync_events.next
+
+        pending: Optional[asyncio.Future] = None
+        sent = time.monotonic()
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(next_event())
+                timeout = (
+                    max(self.heartbeat - (time.monotonic() - sent), 0)
+                    if self.heartbeat
+                    else None
+                )
+                done, _pending = await asyncio.wait((pending,), timeout=timeout)
+                if not done:
+                    sent = time.monotonic()
+                    yield HEARTBEAT
+                    continue
+                event, pending = pending.result(), None
+                if event is _end:
+                    return
+                if event is None:
+                    continue
+                sent = time.monotonic()
+                yield encode_event(event)
+        finally:
+            if pending is not None:
+                pending.cancel()
+                try:
+                    await pending
+                except (asyncio.CancelledError, Exception):
+                    pass
+            if sync_events is not None:
+                await sync_events.aclose()
+            elif hasattr(iterator, "aclose"):
+                await iterator.aclose()
+
+
+async def _wait_disconnect(receive: Callable) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+class ASGIHandler(DjangoASGIHandler):
+    """
+    Django ASGI handler streaming server-sent events on the event loop.
+
+    Event streams are cancelled as soon as the client disconnects, so idle
+    clients hold neither a thread nor an iterator. Other responses are sent
+    by Django handler.
+    """
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        token = _asgi_receive.set(receive)
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            _asgi_receive.reset(token)
+
+    async def send_response(self, response: Any, send: Callable) -> None:
+        if not isinstance(response, EventStreamResponse):
+            return await super().send_response(response, send)
+        headers = [
+            (
+                header.encode("ascii") if isinstance(header, str) else header,
+                value.encode("latin1") if isinstance(value, str) else value,
+            )
+            for header, value in response.items()
+        ]
+        for cookie in response.cookies.values():
+            headers.append(
+                (b"Set-Cookie", cookie.output(header="").encode("ascii").strip())
+            )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": headers,
+            }
+        )
+
+        async def stream() -> None:
+            chunks = response.aiter_chunks()
+            try:
+                async for chunk in chunks:
+                    await send(
+                        {"type": "http.response.body", "body": chunk, "more_body": True}
+                    )
+            finally:
+                await chunks.aclose()
+
+        streaming = asyncio.ensure_future(stream())
+        receive = _asgi_receive.get(None)
+        disconnect = asyncio.ensure_future(
+            _wait_disconnect(receive) if receive else asyncio.Future()
+        )
+        try:
+            done, _pending = await asyncio.wait(
+                (streaming, disconnect), return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for task in (streaming, disconnect):
+                task.cancel()
+            await asyncio.gather(streaming, disconnect, return_exceptions=True)
+        try:
+            if disconnect not in done:
+                streaming.result()
+                await send({"type": "http.response.body"})
+        finally:
+            await sync_to_async(response.close, thread_sensitive=True)()
+
+
+def get_asgi_application() -> ASGIHandler:
+    """
+    Get ASGI application streaming server-sent events without worker threads.
+    """
+    django.setup(set_prefix=False)
+    return ASGIHandler()
+
+
+def stream_view(
+    view: Callable,
+    heartbeat: Optional[float] = 15,
+    retry: Optional[int] = None,
+    thread_pool: Optional[ThreadPool] = None,
+) -> Callable:
+    """
+    Make view responding with events of sync or async generator `view`.
+
+    Views accepting `last_event_id` argument get the id of the last event
+    received by reconnecting client, to resume the stream after it.
+    """
+    signature = inspect.signature(view)
+    resume = "last_event_id" in signature.parameters
+
+    def make_response(request: HttpRequest, *args, **kwargs) -> EventStreamResponse:
+        if is_asgi_request(request) and _asgi_receive.get(None) is None:
+            # Fail before the response starts under Django ASGI handler
+            raise ImproperlyConfigured(ASGI_HANDLER_REQUIRED)
+        if resume:
+            kwargs["last_event_id"] = get_last_event_id(request)
+        return EventStreamResponse(
+            view(request, *args, **kwargs),
+            heartbeat=heartbeat,
+            retry=retry,
+            thread_pool=thread_pool,
+        )
+
+    wrapped: Callable
+    if inspect.isasyncgenfunction(view):
+
+        @wraps(view)
+        async def async_stream_view(request: HttpRequest, *args, **kwargs) -> Any:
+            return make_response(request, *args, **kwargs)
+
+        wrapped = async_stream_view
+    else:
+
+        @wraps(view)
+        def sync_stream_view(request: HttpRequest, *args, **kwargs) -> Any:
+            return make_response(request, *args, **kwargs)
+
+        wrapped = sync_stream_view
+
+    if resume:
+        # `last_event_id` isn't a query parameter of typed views
+        wrapped.__signature__ = signature.replace(  # type: ignore
+            parameters=[
+                parameter
+                for name, parameter in signature.parameters.items()
+                if name != "last_event_id"
+            ]
+        )
+    return wrapped
@@ -1,6 +1,12 @@
-from typing import Optional
+import asyncio
+import inspect
+from functools import wraps
+from typing import Any, Callable, Optional, Type, Union
 
-from django.http import HttpResponse
+from asgiref.sync import async_to_sync
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest, HttpResponse
+from django.views import View
 
 
 def removeprefix(string: str, *, prefix: str):
@@ -16,3 +22,66 @@ def set_response_headers(
     if headers:
         for name, value in headers.items():
             response[name] = value
+
+
+def is_asgi_request(request: HttpRequest) -> bool:
+    """
+    Check whether request, or request wrapped by `Request`, is served by ASGI.
+    """
+    return isinstance(getattr(request, "_request", request), ASGIRequest)
+
+
+def is_async_view(view: Union[Type[View], Callable]) -> bool:
+    """
+    Check whether view function or class-based view handlers are coroutines.
+    """
+    view_class: Optional[Type[View]] = (
+        view if inspect.isclass(view) else getattr(view, "view_class", None)
+    )
+    if view_class is None:
+        return asyncio.iscoroutinefunction(view)
+    handlers = [
+        getattr(view_class, method)
+        for method in view_class.http_method_names
+        if method != "options" and hasattr(view_class, method)
+    ]
+    return bool(handlers) and all(
+        asyncio.iscoroutinefunction(handler) for handler in handlers
+    )
+
+
+def check_request(
+    view: Callable,
+    check: Callable[[HttpRequest], Optional[Exception]],
+    exception_handler: Callable,
+) -> Callable:
+    """
+    Wrap view with cheap request check, run on the raw request before the view.
+
+    Exception returned by `check` is rendered with exception handler.
+    """
+    if asyncio.iscoroutinefunction(view):
+
+        @wraps(view)
+        async def async_checked_view(request: HttpRequest, *args, **kwargs) -> Any:
+            exc = check(request)
+            if exc is None:
+                return await view(request, *args, **kwargs)
+            response = exception_handler(request, exc)
+            if inspect.isawaitable(response):
+                response = await response
+            return response
+
+        return async_checked_view
+
+    if asyncio.iscoroutinefunction(exception_handler):
+        exception_handler = async_to_sync(exception_handler)
+
+    @wraps(view)
+    def checked_view(request: HttpRequest, *args, **kwargs) -> Any:
+        exc = check(request)
+        if exc is None:
+            return view(request, *args, **kwargs)
+        return exception_handler(request, exc)
+
+    return checked_view
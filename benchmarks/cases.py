@@ -0,0 +1,245 @@
+from typing import Any, Callable, Dict, List
+
+import attr
+from django.http import Http404, HttpResponse, JsonResponse as DjangoJsonResponse
+from django.test import RequestFactory
+from django.urls.resolvers import RoutePattern, URLResolver
+
+from apirouter import APIRouter, JsonResponse, Request
+from apirouter.exception_handler import error_response
+from apirouter.exceptions import APIException
+
+PAYLOAD_SIZES = (1, 100, 10000)
+
+ROUTER_SIZES = (10, 100, 1000)
+
+NESTING_DEPTHS = (1, 3, 5)
+
+
+@attr.dataclass(frozen=True)
+class Case:
+    """
+    Benchmark case, `setup()` returns the measured callable.
+    """
+
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], Any]]
+    params: Dict[str, Any] = attr.Factory(dict)
+
+
+CASES: List[Case] = []
+
+
+def case(group: str, **params: Any) -> Callable:
+    def decorator(setup: Callable[[], Callable[[], Any]]) -> Callable:
+        suffix = ",".join(f"{name}={value}" for name, value in params.items())
+        name = f"{group}.{setup.__name__}" + (f"[{suffix}]" if suffix else "")
+        CASES.append(Case(name=name, group=group, setup=setup, params=params))
+        return setup
+
+    return decorator
+
+
+def make_payload(size: int) -> List[dict]:
+    return [
+        {"id": index, "name": f"Item {index}", "price": index * 1.5, "tags": ["a"]}
+        for index in range(size)
+    ]
+
+
+def view_callback(router: APIRouter) -> Callable:
+    (pattern,) = router.urls
+    return pattern.callback
+
+
+# View overhead
+
+
+@case("view")
+def django_view() -> Callable:
+    request = RequestFactory().get("/")
+
+    def view(request):
+        return HttpResponse("OK")
+
+    return lambda: view(request)
+
+
+@case("view")
+def wrapped_view() -> Callable:
+    router = APIRouter()
+    request = RequestFactory().get("/")
+
+    @router.route("/")
+    def view(request):
+        return HttpResponse("OK")
+
+    callback = view_callback(router)
+    return lambda: callback(request)
+
+
+@case("view")
+def wrapped_view_dict() -> Callable:
+    router = APIRouter()
+    request = RequestFactory().get("/")
+
+    @router.route("/")
+    def view(request):
+        return {"ok": True}
+
+    callback = view_callback(router)
+    return lambda: callback(request)
+
+
+# Request
+
+
+class LegacyRequest:
+    """
+    Dictionary based request wrapper, used as `Request` baseline.
+    """
+
+    def __init__(self, request):
+        self._request = request
+        self._json = None
+
+    def __getattr__(self, attr: str):
+        try:
+            return getattr(self._request, attr)
+        except AttributeError:
+            return self.__getattribute__(attr)
+
+
+@case("request")
+def legacy_construction() -> Callable:
+    http_request = RequestFactory().get("/")
+    return lambda: LegacyRequest(http_request)
+
+
+@case("request")
+def construction() -> Callable:
+    http_request = RequestFactory().get("/")
+    return lambda: Request(http_request)
+
+
+@case("request")
+def legacy_attribute_access() -> Callable:
+    request = LegacyRequest(RequestFactory().get("/"))
+    return lambda: request.META
+
+
+@case("request")
+def attribute_access() -> Callable:
+    request = Request(RequestFactory().get("/"))
+    return lambda: request.META
+
+
+for size in PAYLOAD_SIZES:
+
+    @case("request", size=size)
+    def json_parse(size: int = size) -> Callable:
+        http_request = RequestFactory().post(
+            "/", make_payload(size), content_type="application/json"
+        )
+        return lambda: Request(http_request).json()
+
+
+# Response
+
+
+for size in PAYLOAD_SIZES:
+
+    @case("response", size=size)
+    def django_json_encode(size: int = size) -> Callable:
+        payload = make_payload(size)
+        return lambda: DjangoJsonResponse(payload, safe=False)
+
+    @case("response", size=size)
+    def json_encode(size: int = size) -> Callable:
+        payload = make_payload(size)
+        return lambda: JsonResponse(payload)
+
+
+# URL resolution
+
+
+def make_router(routes: int, compiled: bool = False) -> APIRouter:
+    router = APIRouter(compiled=compiled)
+
+    def view(request, pk: int):
+        return HttpResponse("OK")
+
+    for index in range(routes):
+        router.add_route(f"/resource{index}/<int:pk>", view)
+    return router
+
+
+for routes in ROUTER_SIZES:
+
+    @case("resolve", routes=routes)
+    def last_route(routes: int = routes) -> Callable:
+        resolver = URLResolver(RoutePattern(""), make_router(routes).urls)
+        path = f"resource{routes - 1}/1"
+        return lambda: resolver.resolve(path)
+
+    @case("resolve", routes=routes)
+    def last_route_compiled(routes: int = routes) -> Callable:
+        resolver = URLResolver(RoutePattern(""), make_router(routes, True).urls)
+        path = f"resource{routes - 1}/1"
+        return lambda: resolver.resolve(path)
+
+
+for depth in NESTING_DEPTHS:
+
+    @case("resolve", depth=depth)
+    def nested(depth: int = depth) -> Callable:
+        router = make_router(10)
+        for level in range(depth - 1):
+            parent = APIRouter(name=f"level{level}")
+            parent.include_router(router, prefix=f"/level{level}/")
+            router = parent
+        resolver = URLResolver(RoutePattern(""), router.urls)
+        path = "".join(f"level{level}/" for level in reversed(range(depth - 1)))
+        path += "resource9/1"
+        return lambda: resolver.resolve(path)
+
+
+# Exceptions
+
+
+@case("exception")
+def api_exception() -> Callable:
+    router = APIRouter()
+    request = RequestFactory().get("/")
+
+    @router.route("/")
+    def view(request):
+        raise APIException(status_code=400, detail="Invalid")
+
+    callback = view_callback(router)
+    return lambda: callback(request)
+
+
+@case("exception")
+def not_found() -> Callable:
+    router = APIRouter()
+    request = RequestFactory().get("/")
+
+    @router.route("/")
+    def view(request):
+        raise Http404
+
+    callback = view_callback(router)
+    return lambda: callback(request)
+
+
+@case("exception")
+def error_body_encode() -> Callable:
+    detail = APIException(status_code=404).detail
+    return lambda: JsonResponse({"detail": detail}, status=404)
+
+
+@case("exception")
+def error_response_cached() -> Callable:
+    return lambda: error_response(404)
@@ -0,0 +1,175 @@
+"""
+Benchmark runner.
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --filter resolve --compare baseline.json
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Any, Dict, List, Optional, Sequence
+
+FORMAT_VERSION = 1
+
+
+def measure(func: Any, repeat: int, min_time: float) -> Dict[str, Any]:
+    """
+    Time `func` calls, loops number is calibrated so a round takes `min_time`.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 2
+    timings = [elapsed / number for elapsed in timer.repeat(repeat, number)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    import django
+
+    import apirouter
+    from apirouter.json_backends import get_json_backend
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "django": django.get_version(),
+        "apirouter": getattr(apirouter, "__version__", None),
+        "json_backend": type(get_json_backend()).__name__,
+    }
+
+
+def run(
+    patterns: Sequence[str] = ("*",), repeat: int = 5, min_time: float = 0.1
+) -> Dict[str, Any]:
+    from benchmarks.cases import CASES
+
+    results = []
+    for case in CASES:
+        if not any(fnmatch.fnmatchcase(case.name, pattern) for pattern in patterns):
+            continue
+        result = measure(case.setup(), repeat=repeat, min_time=min_time)
+        results.append(
+            {"name": case.name, "group": case.group, "params": case.params, **result}
+        )
+    return {
+        "version": FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": environment(),
+        "benchmarks": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """
+    Compare best timings with baseline results, returning per benchmark ratios.
+    """
+    baseline_timings = {item["name"]: item["min"] for item in baseline["benchmarks"]}
+    comparison = []
+    for item in current["benchmarks"]:
+        base = baseline_timings.get(item["name"])
+        if not base:
+            continue
+        ratio = item["min"] / base
+        comparison.append(
+            {"name": item["name"], "ratio": ratio, "regression": ratio > threshold}
+        )
+    return comparison
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1:
+            return f"{seconds * scale:.2f}{unit}"
+    return f"{seconds * 1e9:.0f}ns"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "-f",
+        "--filter",
+        action="append",
+        dest="patterns",
+        help="benchmark name glob pattern, e.g. 'resolve.*', may be repeated",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time", type=float, default=0.1, help="minimal round time, seconds"
+    )
+    parser.add_argument("-o", "--output", help="write JSON results to file")
+    parser.add_argument("-c", "--compare", help="baseline JSON results file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="slowdown ratio reported as regression (default: 1.2)",
+    )
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    import django
+
+    django.setup()
+
+    results = run(
+        patterns=(
+            [pattern if "*" in pattern else f"*{pattern}*" for pattern in args.patterns]
+            if args.patterns
+            else ["*"]
+        ),
+        repeat=args.repeat,
+        min_time=args.min_time,
+    )
+
+    comparison: Dict[str, Dict[str, Any]] = {}
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        comparison = {
+            item["name"]: item
+            for item in compare(baseline, results, threshold=args.threshold)
+        }
+        results["baseline"] = {"file": args.compare, "threshold": args.threshold}
+        for item in results["benchmarks"]:
+            if item["name"] in comparison:
+                item["ratio"] = comparison[item["name"]]["ratio"]
+
+    for item in results["benchmarks"]:
+        line = f"{item['name']:<50} {format_time(item['min']):>10}"
+        if item["name"] in comparison:
+            ratio = comparison[item["name"]]
+            line += f" {ratio['ratio']:>6.2f}x"
+            if ratio["regression"]:
+                line += " REGRESSION"
+        print(line, file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    if any(item["regression"] for item in comparison.values()):
+        return 1
+    return 0
@@ -0,0 +1,4 @@
+DEBUG = False
+SECRET_KEY = "benchmarks"
+ALLOWED_HOSTS = ["*"]
+USE_I18N = False
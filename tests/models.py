@@ -0,0 +1,20 @@
+from django.db import models
+
+
+class Author(models.Model):
+    name = models.CharField(max_length=100)
+    email = models.CharField(max_length=100)
+
+
+class Item(models.Model):
+    name = models.CharField(max_length=100)
+    price = models.IntegerField(db_index=True)
+    description = models.TextField(default="")
+    author = models.ForeignKey(Author, null=True, on_delete=models.SET_NULL)
+
+    class Meta:
+        ordering = ["id"]
+
+
+class Entry(models.Model):
+    created = models.DateTimeField()
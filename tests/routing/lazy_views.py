@@ -0,0 +1,15 @@
+from django.http import HttpResponse
+from django.views import View
+
+
+def index(request):
+    return {"lazy": True}
+
+
+async def async_index(request):
+    return {"async": True}
+
+
+class ItemView(View):
+    def get(self, request, item_id: int):
+        return HttpResponse(f"item {item_id}")
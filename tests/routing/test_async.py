@@ -0,0 +1,115 @@
+import asyncio
+from typing import Callable
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import AsyncClient
+from django.views import View
+
+from apirouter import APIRouter
+from apirouter.exceptions import APIException
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+
+def async_decorator(view_func: Callable):
+    async def wrapped(request, *args, **kwargs):
+        response = view_func(request, *args, **kwargs)
+        if asyncio.iscoroutine(response):
+            response = await response
+        response["x-decorator"] = "async"
+        return response
+
+    return wrapped
+
+
+async def exception_handler(request, exc):
+    await asyncio.sleep(0)
+    return HttpResponse(str(exc), status=400)
+
+
+router = APIRouter(exception_handler=exception_handler)
+
+
+@router.route("/async")
+async def async_route(request):
+    await asyncio.sleep(0)
+    return {"async": True}
+
+
+@router.route("/async/methods", methods=["GET"])
+async def async_methods_route(request):
+    return HttpResponse("GET /async/methods")
+
+
+@router.route("/async/error")
+async def async_error_route(request):
+    raise APIException(status_code=400, detail="Async error")
+
+
+@router.route("/sync")
+def sync_route(request):
+    return {"async": False}
+
+
+@router.route("/sync/error")
+def sync_error_route(request):
+    raise APIException(status_code=400, detail="Sync error")
+
+
+@router.view("/view", decorators=[async_decorator])
+class AsyncView(View):
+    async def get(self, request):
+        return HttpResponse("GET /view")
+
+
+urlpatterns = router.urls
+
+
+@pytest.fixture()
+def async_client() -> AsyncClient:
+    return AsyncClient()
+
+
+def test_async_route_is_coroutine():
+    callbacks = {str(pattern.pattern): pattern.callback for pattern in urlpatterns}
+
+    assert asyncio.iscoroutinefunction(callbacks["async"])
+    assert asyncio.iscoroutinefunction(callbacks["view"])
+    assert not asyncio.iscoroutinefunction(callbacks["sync"])
+
+
+@pytest.mark.parametrize(
+    "path,expected", [("/async", {"async": True}), ("/sync", {"async": False})]
+)
+def test_mixed_routes(async_client: AsyncClient, path: str, expected: dict):
+    response = async_to_sync(async_client.get)(path)
+
+    assert response.status_code == 200
+    assert response.json() == expected
+
+
+def test_async_route_methods(async_client: AsyncClient):
+    response = async_to_sync(async_client.get)("/async/methods")
+
+    assert response.status_code == 200
+    assert response.content == b"GET /async/methods"
+
+
+@pytest.mark.parametrize(
+    "path,content", [("/async/error", b"Async error"), ("/sync/error", b"Sync error")]
+)
+def test_async_exception_handler(async_client: AsyncClient, path: str, content: bytes):
+    response = async_to_sync(async_client.get)(path)
+
+    assert response.status_code == 400
+    assert response.content == content
+
+
+def test_async_view(async_client: AsyncClient):
+    response = async_to_sync(async_client.get)("/view")
+
+    assert response.status_code == 200
+    assert response.content == b"GET /view"
+    assert response["x-decorator"] == "async"
@@ -0,0 +1,222 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import AsyncClient, Client
+
+from apirouter import APIRouter
+from apirouter.compression import Compression
+from apirouter.exceptions import APIException
+from apirouter.negotiation import Negotiation, Renderer
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+router = APIRouter()
+
+
+@router.get("/items/<int:item_id>")
+def get_item(request, item_id: int):
+    if item_id == 0:
+        raise APIException(status_code=404, detail="Item not found.")
+    return {"id": item_id, "q": request.query_params.get("q")}
+
+
+@router.post("/items")
+def create_item(request):
+    return {"created": request.json()}
+
+
+@router.post("/echo")
+def echo(request):
+    return {"data": request.data}
+
+
+@router.route("/text")
+def text(request):
+    return HttpResponse("plain", content_type="text/plain")
+
+
+@router.route("/slow")
+async def slow(request):
+    await asyncio.sleep(0.01)
+    return {"slow": True}
+
+
+@router.route("/error")
+def error(request):
+    raise RuntimeError("boom")
+
+
+@router.stream("/events")
+def events(request):
+    while True:
+        yield "event"
+
+
+@router.stream("/async-events")
+async def async_events(request):
+    while True:
+        yield "event"
+        await asyncio.sleep(0)
+
+
+router.add_batch_route("/batch", max_requests=5)
+
+async_router = APIRouter()
+async_router.include_router(router)
+async_router.add_batch_route("/async-batch", concurrent=True)
+
+compressed_router = APIRouter(compression=Compression(encodings=("gzip",)))
+
+
+@compressed_router.route("/compressed/<int:item_id>")
+def compressed_item(request, item_id: int):
+    return {"id": item_id, "text": "x" * 1000}
+
+
+compressed_router.add_batch_route("/compressed-batch")
+async_router.include_router(compressed_router)
+
+
+class ReprRenderer(Renderer):
+    media_type = "application/x-repr"
+
+    def render(self, data):
+        return repr(data).encode()
+
+
+negotiated_router = APIRouter(
+    negotiation=Negotiation(renderers=("json", ReprRenderer()))
+)
+
+
+@negotiated_router.route("/negotiated")
+def negotiated(request):
+    return {"ok": True}
+
+
+negotiated_router.add_batch_route("/negotiated-batch")
+async_router.include_router(negotiated_router)
+
+urlpatterns = async_router.urls
+
+
+def batch(client, requests, path="/batch"):
+    return client.post(path, requests, content_type="application/json")
+
+
+def test_batch(client):
+    response = batch(
+        client,
+        [
+            {"method": "GET", "path": "/items/1?q=x"},
+            {"method": "POST", "path": "/items", "body": {"name": "Pen"}},
+            {"path": "/text"},
+        ],
+    )
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["status"] for result in results] == [200, 200, 200]
+    assert results[0]["body"] == {"id": 1, "q": "x"}
+    assert results[1]["body"] == {"created": {"name": "Pen"}}
+    assert results[2]["body"] == "plain"
+    assert results[2]["headers"]["Content-Type"] == "text/plain"
+
+
+def test_batch_sub_request_errors(client):
+    response = batch(
+        client,
+        [
+            {"path": "/items/0"},
+            {"path": "/missing"},
+            {"method": "DELETE", "path": "/items/1"},
+            {"path": "/error"},
+            {"method": "POST", "path": "/batch", "body": []},
+        ],
+    )
+
+    results = response.json()
+    assert [result["status"] for result in results] == [404, 404, 405, 500, 404]
+    assert results[0]["body"] == {"detail": "Item not found."}
+    assert results[3]["body"] == {"detail": "Internal Server Error"}
+
+
+def test_batch_async_view_sequential(client):
+    response = batch(client, [{"path": "/slow"}])
+
+    assert response.json()[0]["body"] == {"slow": True}
+
+
+def test_batch_invalid(client):
+    assert batch(client, {"path": "/text"}).status_code == 400
+    assert batch(client, [{"path": "/text"}] * 6).status_code == 400
+    assert batch(client, [{}, "/text"]).status_code == 400
+
+
+def test_batch_concurrent():
+    response = async_to_sync(AsyncClient().post)(
+        "/async-batch",
+        [{"path": "/slow"}, {"path": "/slow"}, {"path": "/items/2"}, {"path": "/x"}],
+        content_type="application/json",
+    )
+
+    results = response.json()
+    assert [result["status"] for result in results] == [200, 200, 200, 404]
+    assert results[2]["body"] == {"id": 2, "q": None}
+
+
+def test_batch_event_stream_rejected(client):
+    response = batch(client, [{"path": "/events"}, {"path": "/items/1"}])
+
+    results = response.json()
+    assert [result["status"] for result in results] == [400, 200]
+    assert results[0]["body"] == {"detail": "Event stream routes can't be batched."}
+
+
+def test_batch_concurrent_event_stream_rejected():
+    response = async_to_sync(AsyncClient().post)(
+        "/async-batch",
+        [{"path": "/events"}, {"path": "/async-events"}],
+        content_type="application/json",
+    )
+
+    assert [result["status"] for result in response.json()] == [400, 400]
+
+
+def test_batch_compressed_router():
+    client = Client(HTTP_ACCEPT_ENCODING="gzip")
+    response = batch(client, [{"path": "/compressed/1"}] * 2, path="/compressed-batch")
+
+    assert response.status_code == 200
+    assert response["Content-Encoding"] == "gzip"
+    results = json.loads(gzip.decompress(response.content))
+    assert [result["body"] for result in results] == [{"id": 1, "text": "x" * 1000}] * 2
+
+
+def test_batch_sub_requests_render_json():
+    client = Client(HTTP_ACCEPT="application/x-repr")
+    response = batch(client, [{"path": "/negotiated"}], path="/negotiated-batch")
+
+    # Sub-responses are rendered as JSON, not with the batch response renderer
+    assert response["Content-Type"] == "application/x-repr"
+    assert "'body': {'ok': True}" in response.content.decode()
+
+
+def test_batch_sub_request_without_body(client):
+    response = client.post(
+        "/batch",
+        [
+            {"method": "POST", "path": "/echo"},
+            {"method": "POST", "path": "/echo", "body": {"name": "Pen"}},
+        ],
+        content_type="application/json",
+    )
+
+    assert [result["body"] for result in response.json()] == [
+        {"data": None},
+        {"data": {"name": "Pen"}},
+    ]
@@ -0,0 +1,58 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+
+from apirouter import APIRouter
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+router = APIRouter(max_body_size=100)
+
+
+@router.route("/small", methods=["POST"])
+def small(request):
+    return {"size": len(request.body)}
+
+
+@router.route("/bulk", methods=["POST"], max_body_size=10_000)
+def bulk(request):
+    return {"count": sum(1 for _ in request.iter_json_items(chunk_size=16))}
+
+
+@router.route("/async", methods=["POST"])
+async def async_small(request):
+    return {"size": len(request.body)}
+
+
+urlpatterns = router.urls
+
+
+def test_max_body_size(client):
+    assert client.post("/small", "x" * 100, content_type="text/plain").json() == {
+        "size": 100
+    }
+
+    response = client.post("/small", "x" * 101, content_type="text/plain")
+
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Request Entity Too Large"}
+
+
+def test_max_body_size_route(client):
+    response = client.post("/bulk", [1] * 1000, content_type="application/json")
+
+    assert response.json() == {"count": 1000}
+
+
+def test_max_body_size_async():
+    response = async_to_sync(AsyncClient().post)(
+        "/async", "x" * 101, content_type="text/plain"
+    )
+
+    assert response.status_code == 413
+
+
+def test_iter_json_items_invalid(client):
+    response = client.post("/bulk", "[1, 2", content_type="application/json")
+
+    assert response.status_code == 400
@@ -0,0 +1,260 @@
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache as default_cache
+from django.http import HttpResponse
+from django.test import Client, RequestFactory
+from django.urls import resolve
+
+from apirouter import APIRouter
+from apirouter.cache import ResponseCache
+from apirouter.compression import Compression
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+calls: Counter = Counter()
+
+router = APIRouter(name="cached", cache=ResponseCache(timeout=60))
+
+
+@router.route("/items/<int:item_id>")
+def item(request, item_id: int):
+    calls["item"] += 1
+    return {"id": item_id, "calls": calls["item"]}
+
+
+@router.route(
+    "/search",
+    cache=ResponseCache(query_params=["q"], vary_headers=["Accept-Language"]),
+)
+def search(request):
+    calls["search"] += 1
+    return {"q": request.GET.get("q"), "calls": calls["search"]}
+
+
+@router.route("/post", methods=["GET", "POST"])
+def post(request):
+    calls["post"] += 1
+    return {"calls": calls["post"]}
+
+
+@router.route("/error")
+def error(request):
+    calls["error"] += 1
+    return HttpResponse(status=500)
+
+
+@router.route("/slow")
+def slow(request):
+    calls["slow"] += 1
+    time.sleep(0.1)
+    return {"calls": calls["slow"]}
+
+
+@router.route("/profile")
+def profile(request):
+    calls["profile"] += 1
+    user = getattr(request, "user", None)
+    return {"user": user.pk if user else None}
+
+
+@router.route("/session")
+def session(request):
+    calls["session"] += 1
+    return HttpResponse("session", headers={"Vary": "Cookie"})
+
+
+@router.route("/shared", cache=ResponseCache(shared=True))
+def shared(request):
+    calls["shared"] += 1
+    return {"calls": calls["shared"]}
+
+
+@router.route("/etag", etag=True)
+def etag(request):
+    calls["etag"] += 1
+    return {"calls": calls["etag"]}
+
+
+@router.route(
+    "/compressed-etag",
+    etag=True,
+    compression=Compression(encodings=("gzip",), min_size=0),
+)
+def compressed_etag(request):
+    calls["compressed_etag"] += 1
+    return {"calls": calls["compressed_etag"]}
+
+
+urlpatterns = router.urls
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    calls.clear()
+    default_cache.clear()
+
+
+def test_cache_hit(client):
+    first = client.get("/items/1")
+    second = client.get("/items/1")
+
+    assert first.json() == second.json() == {"id": 1, "calls": 1}
+    assert second["Content-Type"] == "application/json"
+    assert calls["item"] == 1
+
+
+def test_cache_kwargs(client):
+    client.get("/items/1")
+    client.get("/items/2")
+
+    assert calls["item"] == 2
+
+
+def test_cache_query_params(client):
+    assert client.get("/search", {"q": "a", "ignored": 1}).json()["calls"] == 1
+    assert client.get("/search", {"q": "a", "ignored": 2}).json()["calls"] == 1
+    assert client.get("/search", {"q": "b"}).json()["calls"] == 2
+
+
+def test_cache_vary_headers(client):
+    client.get("/search", HTTP_ACCEPT_LANGUAGE="en")
+    client.get("/search", HTTP_ACCEPT_LANGUAGE="en")
+    client.get("/search", HTTP_ACCEPT_LANGUAGE="de")
+
+    assert calls["search"] == 2
+
+
+def test_cache_unsafe_methods(client):
+    client.post("/post")
+    client.post("/post")
+
+    assert calls["post"] == 2
+
+
+def test_cache_not_ok_response(client):
+    client.get("/error")
+    client.get("/error")
+
+    assert calls["error"] == 2
+
+
+def test_cache_evict(client):
+    client.get("/items/1")
+    router.evict_cache("/items/<int:item_id>")
+    client.get("/items/1")
+
+    assert calls["item"] == 2
+
+
+def test_cache_single_flight():
+    responses = []
+
+    def fetch():
+        responses.append(Client().get("/slow").json())
+
+    threads = [threading.Thread(target=fetch) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls["slow"] == 1
+    assert responses == [{"calls": 1}] * 5
+
+
+class User:
+    is_authenticated = True
+
+    def __init__(self, pk):
+        self.pk = pk
+
+
+def test_cache_per_user():
+    factory = RequestFactory()
+    view = resolve("/profile").func
+
+    def get(user):
+        request = factory.get("/profile")
+        request.user = user
+        return json.loads(view(request).content)
+
+    assert get(User(1)) == {"user": 1}
+    assert get(User(2)) == {"user": 2}
+    assert get(User(1)) == {"user": 1}
+    assert calls["profile"] == 2
+
+
+def test_cache_per_authorization():
+    first = Client(HTTP_AUTHORIZATION="Bearer first")
+    second = Client(HTTP_AUTHORIZATION="Bearer second")
+
+    first.get("/items/1")
+    second.get("/items/1")
+    first.get("/items/1")
+
+    assert calls["item"] == 2
+
+
+def test_shared_cache():
+    Client(HTTP_AUTHORIZATION="Bearer first").get("/shared")
+    Client(HTTP_AUTHORIZATION="Bearer second").get("/shared")
+
+    assert calls["shared"] == 1
+
+
+def test_vary_cookie_not_cached(client):
+    client.get("/session")
+    client.get("/session")
+
+    assert calls["session"] == 2
+
+
+@pytest.mark.parametrize(
+    "path,headers",
+    [("/etag", {}), ("/compressed-etag", {"HTTP_ACCEPT_ENCODING": "gzip"})],
+)
+def test_cache_hit_not_modified(client, path: str, headers: dict):
+    etag = client.get(path, **headers)["ETag"]
+
+    response = client.get(path, HTTP_IF_NONE_MATCH=etag, **headers)
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    assert response.content == b""
+    assert client.get(path, HTTP_IF_NONE_MATCH='"other"', **headers).status_code == 200
+
+
+def test_async_cache_off_event_loop(monkeypatch):
+    on_loop = []
+    get = ResponseCache.get
+
+    def record_get(self, key):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            on_loop.append(False)
+        else:
+            on_loop.append(True)
+        return get(self, key)
+
+    monkeypatch.setattr(ResponseCache, "get", record_get)
+    router = APIRouter(cache=ResponseCache())
+
+    @router.route("/async")
+    async def view(request):
+        calls["async"] += 1
+        return {"calls": calls["async"]}
+
+    callback = router.urls[0].callback
+    first = async_to_sync(callback)(RequestFactory().get("/async"))
+    second = async_to_sync(callback)(RequestFactory().get("/async"))
+
+    assert first.content == second.content
+    assert calls["async"] == 1
+    assert on_loop == [False, False]
@@ -0,0 +1,129 @@
+import pytest
+from django.http import HttpResponse
+from django.test import override_settings
+from django.urls import Resolver404, resolve, reverse
+
+from apirouter import APIRouter
+from apirouter.resolvers import CompiledURLResolver
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+router = APIRouter(name="root", compiled=True)
+
+
+@router.route("/", name="index")
+def index(request):
+    return HttpResponse("index")
+
+
+@router.route("/items/<int:item_id>", name="item")
+def item(request, item_id: int):
+    return HttpResponse(f"item {item_id}")
+
+
+@router.route("/items/new", name="item_new")
+def item_new(request):
+    return HttpResponse("item new")
+
+
+@router.route("/items/<str:slug>", name="item_slug")
+def item_slug(request, slug: str):
+    return HttpResponse(f"item {slug}")
+
+
+@router.route("/kwargs", name="kwargs", view_kwargs={"value": "default"})
+def view_kwargs(request, value: str):
+    return HttpResponse(value)
+
+
+users_router = APIRouter(name="users")
+
+
+@users_router.route("/", name="list")
+def users_list(request):
+    return HttpResponse("users")
+
+
+@users_router.route("/<int:user_id>/posts/<slug:post>", name="post")
+def user_post(request, user_id: int, post: str):
+    return HttpResponse(f"user {user_id} post {post}")
+
+
+router.include_router(users_router, prefix="/users/")
+
+urlpatterns = router.urls
+
+
+def test_compiled_urls():
+    assert len(urlpatterns) == 1
+    assert isinstance(urlpatterns[0], CompiledURLResolver)
+
+
+@pytest.mark.parametrize(
+    "path,content",
+    [
+        ("/", b"index"),
+        ("/items/1", b"item 1"),
+        ("/items/new", b"item new"),
+        ("/items/other", b"item other"),
+        ("/kwargs", b"default"),
+        ("/users/", b"users"),
+        ("/users/10/posts/hello-world", b"user 10 post hello-world"),
+    ],
+)
+def test_compiled_resolve(client, path: str, content: bytes):
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert response.content == content
+
+
+def test_compiled_resolve_not_found(client):
+    response = client.get("/users/abc/posts/1")
+
+    assert response.status_code == 404
+
+
+def test_compiled_resolver_match():
+    match = resolve("/users/10/posts/hello", urlconf=__name__)
+
+    assert match.url_name == "post"
+    assert match.namespaces == ["root", "users"]
+    assert match.view_name == "root:users:post"
+    assert match.kwargs == {"user_id": 10, "post": "hello"}
+    assert match.route == "users/<int:user_id>/posts/<slug:post>"
+
+
+def test_compiled_resolver_not_found():
+    with pytest.raises(Resolver404):
+        urlpatterns[0].resolve("missing")
+
+
+def test_compiled_resolve_order():
+    ordered_router = APIRouter()
+
+    @ordered_router.route("/<str:name>")
+    def dynamic(request, name: str):
+        return HttpResponse(name)
+
+    @ordered_router.route("/static")
+    def static(request):
+        return HttpResponse("static")
+
+    resolver = CompiledURLResolver(ordered_router.urls)
+
+    assert resolver.resolve("static").func.__name__ == "dynamic"
+
+
+@override_settings(ROOT_URLCONF=__name__)
+@pytest.mark.parametrize(
+    "viewname,kwargs,expected",
+    [
+        ("root:index", {}, "/"),
+        ("root:item", {"item_id": 5}, "/items/5"),
+        ("root:users:list", {}, "/users/"),
+        ("root:users:post", {"user_id": 1, "post": "a"}, "/users/1/posts/a"),
+    ],
+)
+def test_compiled_reverse(viewname: str, kwargs: dict, expected: str):
+    assert reverse(viewname, kwargs=kwargs) == expected
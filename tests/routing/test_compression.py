@@ -0,0 +1,149 @@
+import gzip
+from collections import Counter
+
+import pytest
+from django.core.cache import cache as default_cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import Client
+
+from apirouter import APIRouter
+from apirouter.cache import ResponseCache
+from apirouter.compression import Compression, negotiate_encoding
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+calls: Counter = Counter()
+
+router = APIRouter(compression=Compression(encodings=("gzip",)))
+
+ITEMS = [{"id": index, "name": f"Item {index}"} for index in range(100)]
+
+
+@router.route("/items")
+def items(request):
+    return ITEMS
+
+
+@router.route("/small")
+def small(request):
+    return {"ok": True}
+
+
+@router.route("/stream")
+def stream(request):
+    return StreamingHttpResponse(b"chunk %d\n" % index for index in range(100))
+
+
+@router.route("/events")
+def events(request):
+    return HttpResponse(b"data: x\n\n" * 100, content_type="text/event-stream")
+
+
+@router.route("/etag", etag=True)
+def etag(request):
+    return ITEMS
+
+
+@router.route("/cached", cache=ResponseCache())
+def cached(request):
+    calls["cached"] += 1
+    return ITEMS
+
+
+urlpatterns = router.urls
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    default_cache.clear()
+    calls.clear()
+
+
+@pytest.fixture
+def client():
+    return Client(HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+
+def test_compress(client):
+    response = client.get("/items")
+
+    assert response.status_code == 200
+    assert response["Content-Encoding"] == "gzip"
+    assert response["Vary"] == "Accept-Encoding"
+    assert int(response["Content-Length"]) == len(response.content)
+    assert gzip.decompress(response.content) == Client().get("/items").content
+
+
+def test_not_accepted():
+    response = Client().get("/items")
+
+    assert not response.has_header("Content-Encoding")
+    assert response["Vary"] == "Accept-Encoding"
+    assert response.json() == ITEMS
+
+
+def test_not_accepted_zero_quality():
+    response = Client(HTTP_ACCEPT_ENCODING="gzip;q=0, identity").get("/items")
+
+    assert not response.has_header("Content-Encoding")
+
+
+def test_small_response_not_compressed(client):
+    response = client.get("/small")
+
+    assert not response.has_header("Content-Encoding")
+    assert response.json() == {"ok": True}
+
+
+def test_streaming_response(client):
+    response = client.get("/stream")
+
+    assert response["Content-Encoding"] == "gzip"
+    assert gzip.decompress(b"".join(response.streaming_content)) == b"".join(
+        b"chunk %d\n" % index for index in range(100)
+    )
+
+
+def test_excluded_content_type(client):
+    response = client.get("/events")
+
+    assert not response.has_header("Content-Encoding")
+
+
+def test_weak_etag(client):
+    etag = Client().get("/etag")["ETag"]
+    response = client.get("/etag")
+
+    assert response["Content-Encoding"] == "gzip"
+    assert response["ETag"] == f"W/{etag}"
+
+
+def test_cache_variants(client):
+    compressed = client.get("/cached")
+    plain = Client().get("/cached")
+
+    assert compressed["Content-Encoding"] == "gzip"
+    assert not plain.has_header("Content-Encoding")
+    assert client.get("/cached").content == compressed.content
+    assert Client().get("/cached").content == plain.content
+    assert calls["cached"] == 2
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        ("gzip", "gzip"),
+        ("br, gzip", "br"),
+        ("gzip;q=1.0, br;q=0", "gzip"),
+        ("*", "br"),
+        ("*;q=0", None),
+        ("identity", None),
+        ("gzip;q=invalid", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding, ("br", "gzip")) == expected
+
+
+def test_unavailable_encodings_skipped():
+    assert Compression(encodings=("unknown", "gzip")).encodings == ("gzip",)
@@ -1,3 +1,4 @@
+import time
 from typing import Callable, List
 
 import pytest
@@ -63,3 +64,51 @@ def test_view_decorators(client):
     assert response.status_code == 200
     assert response.content == b"GET /view"
     assert response["x-after"] == "view2 view1 router2 router1"
+
+
+def test_router_decorators_composed_once(rf):
+    applied = []
+
+    def counting_decorator(view_func: Callable):
+        applied.append(view_func)
+        return view_func
+
+    counting_router = APIRouter(decorators=[counting_decorator])
+
+    @counting_router.route("/")
+    def index(request):
+        return HttpResponse("OK")
+
+    (pattern,) = counting_router.urls
+
+    for _ in range(10):
+        pattern.callback(rf.get("/"))
+
+    assert len(applied) == 1
+
+
+@pytest.mark.benchmark
+def test_router_decorators_overhead_flat(rf):
+    def noop_decorator(view_func: Callable):
+        return view_func
+
+    def measure(decorators_count: int) -> float:
+        bench_router = APIRouter(decorators=[noop_decorator] * decorators_count)
+
+        @bench_router.route("/")
+        def index(request):
+            return HttpResponse("OK")
+
+        (pattern,) = bench_router.urls
+        request = rf.get("/")
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(200):
+                pattern.callback(request)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    baseline = measure(1)
+
+    assert measure(500) < baseline * 2
@@ -0,0 +1,155 @@
+from collections import Counter
+
+import pytest
+from django.http import HttpResponse
+
+from apirouter import APIRouter
+from apirouter.compression import Compression
+from apirouter.conditional import make_etag
+from apirouter.negotiation import Negotiation, Renderer
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+calls: Counter = Counter()
+
+router = APIRouter(etag=True)
+
+
+@router.route("/data")
+def data(request):
+    return {"value": 1}
+
+
+@router.route("/raw")
+def raw(request):
+    return HttpResponse("raw")
+
+
+@router.route("/disabled", etag=False)
+def disabled(request):
+    return {"value": 1}
+
+
+def item_version(request, item_id: int) -> str:
+    return f"item-{item_id}-v1"
+
+
+@router.route("/items/<int:item_id>", etag_key=item_version)
+def item(request, item_id: int):
+    calls["item"] += 1
+    return {"id": item_id}
+
+
+class TextRenderer(Renderer):
+    media_type = "text/plain"
+
+    def render(self, data):
+        return str(data).encode()
+
+
+@router.route(
+    "/variants/<int:item_id>",
+    etag_key=item_version,
+    negotiation=Negotiation(renderers=("json", TextRenderer())),
+    compression=Compression(encodings=("gzip",), min_size=0),
+)
+def variants(request, item_id: int):
+    return {"id": item_id}
+
+
+urlpatterns = router.urls
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+
+
+def test_etag(client):
+    response = client.get("/data")
+
+    assert response.status_code == 200
+    assert response["ETag"] == make_etag(response.content)
+
+
+def test_etag_not_modified(client):
+    etag = client.get("/data")["ETag"]
+
+    response = client.get("/data", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response["ETag"] == etag
+
+
+def test_etag_modified(client):
+    response = client.get("/data", HTTP_IF_NONE_MATCH='"other"')
+
+    assert response.status_code == 200
+
+
+def test_etag_unsafe_method(client):
+    response = client.post("/data")
+
+    assert not response.has_header("ETag")
+
+
+def test_etag_http_response_not_wrapped(client):
+    response = client.get("/raw")
+
+    assert not response.has_header("ETag")
+
+
+def test_etag_disabled_route(client):
+    response = client.get("/disabled")
+
+    assert not response.has_header("ETag")
+
+
+def test_etag_key(client):
+    response = client.get("/items/1")
+
+    assert response.status_code == 200
+    assert response["ETag"] == make_etag(b"item-1-v1")
+    assert calls["item"] == 1
+
+
+def test_etag_key_not_modified_skips_view(client):
+    response = client.get("/items/1", HTTP_IF_NONE_MATCH=make_etag(b"item-1-v1"))
+
+    assert response.status_code == 304
+    assert calls["item"] == 0
+
+
+def test_etag_key_weak_match(client):
+    etag = make_etag(b"item-1-v1")
+
+    response = client.get("/items/1", HTTP_IF_NONE_MATCH=f'W/{etag}, "other"')
+
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize(
+    "headers,version",
+    [
+        ({}, b"item-1-v1:application/json:"),
+        ({"HTTP_ACCEPT_ENCODING": "gzip"}, b"item-1-v1:application/json:gzip"),
+        ({"HTTP_ACCEPT": "text/plain"}, b"item-1-v1:text/plain:"),
+    ],
+)
+def test_etag_key_variants(client, headers: dict, version: bytes):
+    etag = client.get("/variants/1", **headers)["ETag"]
+
+    response = client.get("/variants/1", HTTP_IF_NONE_MATCH=etag, **headers)
+
+    assert etag == make_etag(version)
+    assert response.status_code == 304
+
+
+def test_etag_key_other_variant_not_matched(client):
+    etag = client.get("/variants/1", HTTP_ACCEPT_ENCODING="gzip")["ETag"]
+
+    response = client.get("/variants/1", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response["ETag"] != etag
@@ -0,0 +1,182 @@
+import asyncio
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.exceptions import ImproperlyConfigured
+from django.test import AsyncClient
+
+from apirouter import APIRouter
+from apirouter.exceptions import APIException
+from apirouter.executors import ThreadPool
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+router = APIRouter(executor="thread", thread_pool=ThreadPool(max_workers=4))
+
+barrier = threading.Barrier(2, timeout=5)
+
+blocking_pool = ThreadPool(max_workers=1, max_queue=0, thread_name_prefix="blocking")
+
+release = threading.Event()
+
+
+@router.route("/thread")
+def thread_route(request):
+    return {"thread": threading.current_thread().name}
+
+
+@router.route("/thread-sensitive", executor="thread_sensitive")
+def thread_sensitive_route(request):
+    return {"thread": threading.current_thread().name}
+
+
+@router.route("/async")
+async def async_route(request):
+    return {"thread": threading.current_thread().name}
+
+
+@router.route("/parallel")
+def parallel_route(request):
+    barrier.wait()
+    return {"ok": True}
+
+
+@router.route("/error", methods=["GET"])
+def error_route(request):
+    raise APIException(status_code=400, detail="Error")
+
+
+@router.route("/blocking", executor=blocking_pool)
+def blocking_route(request):
+    release.wait(timeout=5)
+    return {"ok": True}
+
+
+urlpatterns = router.urls
+
+
+@pytest.fixture()
+def async_client() -> AsyncClient:
+    return AsyncClient()
+
+
+def test_routes_are_coroutines():
+    callbacks = {str(pattern.pattern): pattern.callback for pattern in urlpatterns}
+
+    assert asyncio.iscoroutinefunction(callbacks["thread"])
+    assert asyncio.iscoroutinefunction(callbacks["thread-sensitive"])
+    assert asyncio.iscoroutinefunction(callbacks["error"])
+
+
+def test_thread_executor(async_client: AsyncClient):
+    completed = router.thread_pool.stats().completed
+
+    response = async_to_sync(async_client.get)("/thread")
+
+    assert response.status_code == 200
+    assert response.json()["thread"].startswith("apirouter")
+    assert router.thread_pool.stats().completed == completed + 1
+
+
+def test_thread_sensitive_executor(async_client: AsyncClient):
+    response = async_to_sync(async_client.get)("/thread-sensitive")
+
+    assert response.status_code == 200
+    assert not response.json()["thread"].startswith("apirouter")
+
+
+def test_async_route_not_offloaded(async_client: AsyncClient):
+    response = async_to_sync(async_client.get)("/async")
+
+    assert not response.json()["thread"].startswith("apirouter")
+
+
+def test_sync_views_run_in_parallel(async_client: AsyncClient):
+    async def requests():
+        return await asyncio.gather(
+            async_client.get("/parallel"), async_client.get("/parallel")
+        )
+
+    responses = async_to_sync(requests)()
+
+    assert [response.status_code for response in responses] == [200, 200]
+
+
+def test_exception_handled(async_client: AsyncClient):
+    response = async_to_sync(async_client.get)("/error")
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Error"}
+
+
+def test_queue_full(async_client: AsyncClient):
+    async def requests():
+        first = asyncio.ensure_future(async_client.get("/blocking"))
+        while not blocking_pool.stats().active:
+            await asyncio.sleep(0.01)
+        rejected = await async_client.get("/blocking")
+        release.set()
+        return await first, rejected
+
+    first, rejected = async_to_sync(requests)()
+
+    assert first.status_code == 200
+    assert rejected.status_code == 503
+    assert rejected["Retry-After"] == "1"
+    stats = blocking_pool.stats()
+    assert (stats.active, stats.queued, stats.rejected) == (0, 0, 1)
+    assert stats.completed == 1
+
+
+def test_stats_max_queued():
+    pool = ThreadPool(max_workers=1)
+    started = threading.Event()
+    release_queued = threading.Event()
+
+    def block():
+        started.set()
+        release_queued.wait(timeout=5)
+
+    async def run():
+        tasks = [asyncio.ensure_future(pool.run(block)) for _ in range(3)]
+        while pool.stats().queued != 2:
+            await asyncio.sleep(0.01)
+        release_queued.set()
+        await asyncio.gather(*tasks)
+
+    async_to_sync(run)()
+    pool.shutdown()
+
+    stats = pool.stats()
+    assert started.is_set()
+    assert (stats.queued, stats.max_queued, stats.completed) == (0, 2, 3)
+
+
+@pytest.mark.parametrize("executor", ["process", "unknown"])
+def test_invalid_executor(executor: str):
+    invalid_router = APIRouter()
+
+    @invalid_router.route("/", executor=executor)
+    def index(request):
+        return {}
+
+    with pytest.raises(ImproperlyConfigured):
+        invalid_router.urls
+
+
+def test_close_old_connections(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        "apirouter.executors.close_old_connections",
+        lambda: calls.append(threading.current_thread().name),
+    )
+    pool = ThreadPool(max_workers=1, thread_name_prefix="db")
+
+    async def run():
+        return await pool.run(lambda: calls.append("func"))
+
+    async_to_sync(run)()
+    pool.shutdown()
+
+    assert [name.split("_")[0] for name in calls] == ["db", "func", "db"]
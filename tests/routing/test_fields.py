@@ -0,0 +1,173 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext
+
+from apirouter import APIRouter
+from apirouter.fields import FieldSelection, parse_fields, select_data
+from apirouter.pagination import CursorPagination
+from tests.models import Author, Item
+
+pytestmark = [pytest.mark.urls(__name__), pytest.mark.django_db]
+
+router = APIRouter(fields=FieldSelection())
+
+ARTICLE = {
+    "id": 1,
+    "title": "Title",
+    "body": "Body",
+    "author": {"name": "Anton", "email": "anton@example.com", "bio": "Bio"},
+    "tags": [{"name": "django", "slug": "django"}],
+}
+
+
+@router.route("/article")
+def article(request):
+    return ARTICLE
+
+
+@router.route("/articles")
+async def articles(request):
+    return [ARTICLE, ARTICLE]
+
+
+@router.route("/articles/stream")
+def articles_stream(request):
+    return (dict(ARTICLE, id=index) for index in range(2))
+
+
+@router.route("/items")
+def items(request):
+    return Item.objects.values("id", "name", "price", "author__name")
+
+
+@router.route("/items/all")
+def items_all(request):
+    return Item.objects.values()
+
+
+@router.route("/items/page", paginate=CursorPagination(ordering=["-price"]))
+def items_page(request):
+    return Item.objects.values("id", "name", "price")
+
+
+urlpatterns = router.urls
+
+
+@pytest.fixture(autouse=True)
+def objects():
+    author = Author.objects.create(name="Anton", email="anton@example.com")
+    Item.objects.bulk_create(
+        Item(name=f"Item {index}", price=index, description="Long", author=author)
+        for index in range(3)
+    )
+
+
+def test_no_selection(client: Client):
+    assert client.get("/article").json() == ARTICLE
+
+
+def test_select_fields(client: Client):
+    response = client.get("/article?fields=id,author.name,tags.slug")
+
+    assert response.json() == {
+        "id": 1,
+        "author": {"name": "Anton"},
+        "tags": [{"slug": "django"}],
+    }
+
+
+def test_exclude_fields(client: Client):
+    response = client.get("/article?exclude=body,author.bio,author.email,tags")
+
+    assert response.json() == {"id": 1, "title": "Title", "author": {"name": "Anton"}}
+
+
+def test_select_and_exclude_fields(client: Client):
+    response = client.get("/article?fields=title,author&exclude=author.bio")
+
+    assert response.json() == {
+        "title": "Title",
+        "author": {"name": "Anton", "email": "anton@example.com"},
+    }
+
+
+def test_async_view_list():
+    response = async_to_sync(AsyncClient().get)("/articles?fields=id,unknown")
+
+    assert response.json() == [{"id": 1}, {"id": 1}]
+
+
+def test_iterator_streamed(client: Client):
+    response = client.get("/articles/stream?fields=id")
+
+    assert response.streaming
+    assert json.loads(response.getvalue()) == [{"id": 0}, {"id": 1}]
+
+
+def test_queryset_values_push_down(client: Client):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/items?fields=name,author.name")
+        content = json.loads(b"".join(response.streaming_content))
+
+    assert content == [
+        {"name": f"Item {index}", "author__name": "Anton"} for index in range(3)
+    ]
+    (query,) = queries.captured_queries
+    assert '"price"' not in query["sql"]
+
+
+def test_queryset_values_exclude(client: Client):
+    response = client.get("/items/all?exclude=description,author_id")
+    content = json.loads(b"".join(response.streaming_content))
+
+    assert [set(item) for item in content] == [{"id", "name", "price"}] * 3
+
+
+def test_queryset_values_not_exposed(client: Client):
+    response = client.get("/items?fields=description")
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "No valid fields selected."}
+
+
+def test_queryset_paginated(client: Client):
+    response = client.get("/items/page?fields=name&page_size=2")
+
+    page = response.json()
+    assert page["results"] == [{"name": "Item 2"}, {"name": "Item 1"}]
+    page = client.get(f"/items/page?fields=name&cursor={page['next']}").json()
+    assert page["results"] == [{"name": "Item 0"}]
+
+
+def test_queryset_model_untouched():
+    selection = FieldSelection()
+    queryset = Item.objects.all()
+
+    selected = selection.select_queryset(
+        queryset, parse_fields("name,author.name"), parse_fields("description")
+    )
+
+    assert selected is queryset
+    assert selected.query.deferred_loading == (frozenset(), True)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("", {}),
+        ("id, name", {"id": {}, "name": {}}),
+        ("author.name,author.email", {"author": {"name": {}, "email": {}}}),
+        ("author,author.name", {"author": {}}),
+        ("a.b.c,,a.", {"a": {"b": {"c": {}}}}),
+    ],
+)
+def test_parse_fields(value: str, expected: dict):
+    assert parse_fields(value) == expected
+
+
+def test_select_data_scalars():
+    assert select_data([1, "a", None], {"id": {}}, {}) == [1, "a", None]
@@ -1,8 +1,17 @@
+import json
+
 import pytest
-from django.http import HttpResponse
+from asgiref.sync import async_to_sync
+from django.core.handlers.asgi import ASGIHandler
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+from django.urls import resolve
 
 from apirouter import APIRouter
 from apirouter.exceptions import APIException
+from tests.models import Item
 
 pytestmark = [pytest.mark.urls(__name__)]
 
@@ -29,11 +38,41 @@ def handle_list(request):
     return [1, 2, 3, 4, 5]
 
 
+@router.route("/generator")
+def handle_generator(request):
+    return ({"id": i} for i in range(3))
+
+
+@router.route("/stream")
+def handle_stream(request):
+    return StreamingHttpResponse([b"raw"])
+
+
 @router.route("/error")
 def handle_error(request):
     raise APIException(status_code=400, detail="Error")
 
 
+@router.route("/queryset")
+def handle_queryset(request):
+    return Item.objects.values("name")
+
+
+@router.route("/queryset-error")
+def handle_queryset_error(request):
+    return Item.objects.values("name").extra(where=["missing = 1"])
+
+
+@router.route("/async-queryset")
+async def handle_async_queryset(request):
+    return Item.objects.values("name")
+
+
+@router.route("/async-queryset-error")
+async def handle_async_queryset_error(request):
+    return Item.objects.values("name").extra(where=["missing = 1"])
+
+
 urlpatterns = router.urls
 
 
@@ -58,8 +97,103 @@ def test_handle_list(client):
     assert response.json() == [1, 2, 3, 4, 5]
 
 
+def test_handle_generator(client):
+    response = client.get("/generator")
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert json.loads(response.getvalue()) == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+def test_handle_streaming_response(client):
+    response = client.get("/stream")
+
+    assert response.status_code == 200
+    assert response.getvalue() == b"raw"
+
+
 def test_handle_error(client):
     response = client.get("/error")
 
     assert response.status_code == 400
     assert response.content == b"Error"
+
+
+def get_async(path: str):
+    return async_to_sync(resolve(path).func)(RequestFactory().get(path))
+
+
+@pytest.mark.django_db
+def test_handle_async_queryset():
+    Item.objects.bulk_create([Item(name="a", price=1), Item(name="b", price=2)])
+
+    response = get_async("/async-queryset")
+
+    assert response.status_code == 200
+    assert not response.streaming
+    assert json.loads(response.content) == [{"name": "a"}, {"name": "b"}]
+
+
+@pytest.mark.django_db
+def test_handle_async_queryset_error():
+    response = get_async("/async-queryset-error")
+
+    assert response.status_code == 400
+    assert b"missing" in response.content
+
+
+@pytest.fixture
+def keep_connections():
+    # Like Django test client, requests don't close test database connections
+    request_started.disconnect(close_old_connections)
+    request_finished.disconnect(close_old_connections)
+    yield
+    request_started.connect(close_old_connections)
+    request_finished.connect(close_old_connections)
+
+
+def asgi_get(path: str) -> list:
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [],
+    }
+    async_to_sync(ASGIHandler())(scope, receive, send)
+    return messages
+
+
+@pytest.mark.django_db
+def test_handle_queryset_asgi(keep_connections):
+    Item.objects.bulk_create([Item(name="a", price=1), Item(name="b", price=2)])
+
+    start, *body = asgi_get("/queryset")
+
+    assert start["status"] == 200
+    assert json.loads(b"".join(m.get("body", b"") for m in body)) == [
+        {"name": "a"},
+        {"name": "b"},
+    ]
+
+
+@pytest.mark.django_db
+def test_handle_queryset_error_asgi(keep_connections):
+    start, *body = asgi_get("/queryset-error")
+
+    assert start["status"] == 400
+    assert b"missing" in b"".join(m.get("body", b"") for m in body)
+
+
+def test_handle_queryset_streamed(client):
+    response = client.get("/queryset")
+
+    assert response.streaming
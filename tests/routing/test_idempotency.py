@@ -0,0 +1,252 @@
+import json
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache as default_cache
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from django.test import Client, RequestFactory
+
+from apirouter import APIRouter, Request
+from apirouter.idempotency import CacheStore, Idempotency, MemoryStore
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+calls: Counter = Counter()
+
+entered = threading.Event()
+release = threading.Event()
+
+router = APIRouter(idempotent=True, idempotency=Idempotency(key="ip"))
+
+
+@router.route("/orders", methods=["GET", "POST"])
+def orders(request: Request):
+    calls["orders"] += 1
+    return HttpResponse(
+        f'{{"order": {calls["orders"]}}}',
+        status=201 if request.method == "POST" else 200,
+        content_type="application/json",
+    )
+
+
+@router.route("/flaky", methods=["POST"])
+def flaky(request):
+    calls["flaky"] += 1
+    if calls["flaky"] == 1:
+        return HttpResponse(status=503)
+    return {"ok": True}
+
+
+@router.route("/slow", methods=["POST"])
+def slow(request):
+    calls["slow"] += 1
+    entered.set()
+    release.wait(timeout=5)
+    return {"slow": calls["slow"]}
+
+
+@router.route(
+    "/timeout",
+    methods=["POST"],
+    idempotent=Idempotency(wait_timeout=0.05, key="ip"),
+)
+def timeout(request):
+    entered.set()
+    release.wait(timeout=5)
+    return {"ok": True}
+
+
+@router.route(
+    "/required",
+    methods=["POST"],
+    idempotent=Idempotency(required=True, store=CacheStore()),
+)
+def required(request):
+    calls["required"] += 1
+    return {"required": calls["required"]}
+
+
+@router.route("/async", methods=["POST"])
+async def async_route(request):
+    calls["async"] += 1
+    return {"async": calls["async"]}
+
+
+@router.route("/not-idempotent", methods=["POST"], idempotent=False)
+def not_idempotent(request):
+    calls["not-idempotent"] += 1
+    return {"calls": calls["not-idempotent"]}
+
+
+urlpatterns = router.urls
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    calls.clear()
+    entered.clear()
+    release.clear()
+    default_cache.clear()
+    router.idempotency.store.__init__()  # type: ignore
+
+
+def post(client: Client, path: str, key: str, data: Optional[dict] = None):
+    return client.post(
+        path, data or {}, content_type="application/json", HTTP_IDEMPOTENCY_KEY=key
+    )
+
+
+def test_replay(client: Client):
+    first = post(client, "/orders", "key-1")
+    second = post(client, "/orders", "key-1")
+
+    assert first.status_code == second.status_code == 201
+    assert second.json() == first.json() == {"order": 1}
+    assert second["Idempotent-Replayed"] == "true"
+    assert not first.has_header("Idempotent-Replayed")
+    assert calls["orders"] == 1
+
+
+def test_different_keys(client: Client):
+    post(client, "/orders", "key-1")
+    response = post(client, "/orders", "key-2")
+
+    assert response.json() == {"order": 2}
+
+
+def test_keys_scoped_by_client():
+    post(Client(REMOTE_ADDR="10.0.0.1"), "/orders", "key-1")
+    response = post(Client(REMOTE_ADDR="10.0.0.2"), "/orders", "key-1")
+
+    assert response.json() == {"order": 2}
+
+
+def test_no_key(client: Client):
+    client.post("/orders")
+    client.post("/orders")
+
+    assert calls["orders"] == 2
+
+
+def test_safe_method_not_stored(client: Client):
+    client.get("/orders", HTTP_IDEMPOTENCY_KEY="key-1")
+    response = client.get("/orders", HTTP_IDEMPOTENCY_KEY="key-1")
+
+    assert response.json() == {"order": 2}
+
+
+def test_key_reused_with_different_body(client: Client):
+    post(client, "/orders", "key-1", {"item": 1})
+    response = post(client, "/orders", "key-1", {"item": 2})
+
+    assert response.status_code == 422
+    assert calls["orders"] == 1
+
+
+def test_server_error_not_stored(client: Client):
+    assert post(client, "/flaky", "key-1").status_code == 503
+    assert post(client, "/flaky", "key-1").json() == {"ok": True}
+    assert post(client, "/flaky", "key-1")["Idempotent-Replayed"] == "true"
+    assert calls["flaky"] == 2
+
+
+def test_concurrent_duplicate_waits(client: Client):
+    responses = []
+
+    def request():
+        responses.append(post(Client(), "/slow", "key-1"))
+
+    first = threading.Thread(target=request)
+    first.start()
+    assert entered.wait(timeout=5)
+    second = threading.Thread(target=request)
+    second.start()
+    time.sleep(0.05)
+    release.set()
+    first.join()
+    second.join()
+
+    assert [response.json() for response in responses] == [{"slow": 1}] * 2
+    assert calls["slow"] == 1
+
+
+def test_concurrent_duplicate_timeout(client: Client):
+    thread = threading.Thread(target=lambda: post(Client(), "/timeout", "key-1"))
+    thread.start()
+    assert entered.wait(timeout=5)
+
+    response = post(client, "/timeout", "key-1")
+    release.set()
+    thread.join()
+
+    assert response.status_code == 409
+
+
+def test_required_key_with_cache_store(client: Client):
+    response = client.post("/required")
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Idempotency-Key header is required."}
+    assert post(client, "/required", "key-1").json() == {"required": 1}
+    assert post(client, "/required", "key-1").json() == {"required": 1}
+
+
+def test_key_too_long(client: Client):
+    response = post(client, "/orders", "x" * 256)
+
+    assert response.status_code == 400
+
+
+def test_async_route(rf: RequestFactory):
+    callbacks = {str(pattern.pattern): pattern.callback for pattern in urlpatterns}
+    view = async_to_sync(callbacks["async"])
+
+    def async_post():
+        request = rf.post(
+            "/async", {}, content_type="application/json", HTTP_IDEMPOTENCY_KEY="1"
+        )
+        return json.loads(view(request).content)
+
+    assert async_post() == async_post() == {"async": 1}
+
+
+def test_route_opt_out(client: Client):
+    post(client, "/not-idempotent", "key-1")
+
+    assert post(client, "/not-idempotent", "key-1").json() == {"calls": 2}
+
+
+def test_memory_store_lru_and_ttl():
+    store = MemoryStore(max_keys=2)
+    value = ("fingerprint", 200, [], b"")
+    store.set("a", value, ttl=60)
+    store.set("b", value, ttl=60)
+    store.get("a")
+    store.set("c", value, ttl=60)
+
+    assert store.get("a") == value
+    assert store.get("b") is None
+
+    store.set("expired", value, ttl=0)
+
+    assert store.get("expired") is None
+
+
+def test_memory_store_lock():
+    store = MemoryStore()
+
+    assert store.lock("a", timeout=60)
+    assert not store.lock("a", timeout=60)
+    store.unlock("a")
+    assert store.lock("a", timeout=0)
+    assert store.lock("a", timeout=60)
+
+
+def test_invalid_key():
+    with pytest.raises(ImproperlyConfigured):
+        Idempotency(key="unknown")
@@ -0,0 +1,162 @@
+from typing import Callable, List, Tuple
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import AsyncClient
+
+from apirouter import APIRouter
+from apirouter.exceptions import APIException
+from apirouter.instrumentation import (
+    CProfileSampler,
+    Instrument,
+    PrometheusHistogram,
+    RequestTimings,
+)
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+
+class RecordingInstrument(Instrument):
+    def __init__(self):
+        self.events: List[Tuple[str, RequestTimings]] = []
+
+    def on_request_start(self, timings: RequestTimings) -> None:
+        self.events.append(("start", timings))
+
+    def on_view_done(self, timings: RequestTimings) -> None:
+        self.events.append(("view", timings))
+
+    def on_serialize_done(self, timings: RequestTimings) -> None:
+        self.events.append(("serialize", timings))
+
+    def on_exception(self, timings: RequestTimings, exc: Exception) -> None:
+        self.events.append(("exception", timings))
+
+
+def decorator(view_func: Callable):
+    def wrapped(request, *args, **kwargs):
+        return view_func(request, *args, **kwargs)
+
+    return wrapped
+
+
+recorder = RecordingInstrument()
+histogram = PrometheusHistogram()
+sampler = CProfileSampler(rate=1.0)
+
+router = APIRouter(decorators=[decorator], instruments=[recorder, histogram, sampler])
+
+
+@router.route("/items/<int:item_id>", name="item")
+def item(request, item_id: int):
+    return {"id": item_id}
+
+
+@router.route("/error")
+def error(request):
+    raise APIException(status_code=400)
+
+
+@router.route("/async")
+async def async_item(request):
+    return {"async": True}
+
+
+router.route("/metrics")(histogram.view)
+
+urlpatterns = router.urls
+
+
+@pytest.fixture(autouse=True)
+def clear_events():
+    recorder.events.clear()
+    sampler.profiles.clear()
+
+
+def test_instrumentation_hooks(client):
+    response = client.get("/items/1")
+
+    assert response.status_code == 200
+    assert [event for event, _ in recorder.events] == ["start", "view", "serialize"]
+    timings = recorder.events[-1][1]
+    assert timings.route == "items/<int:item_id>"
+    assert timings.name == "item"
+    assert timings.path == "/items/1"
+    assert timings.method == "GET"
+    assert timings.view > 0
+    assert timings.serialize > 0
+    assert timings.wrap_request > 0
+    assert timings.total >= timings.view + timings.serialize
+
+
+def test_instrumentation_exception(client):
+    response = client.get("/error")
+
+    assert response.status_code == 400
+    assert [event for event, _ in recorder.events] == ["start", "exception"]
+    assert recorder.events[-1][1].exception_handler > 0
+
+
+def test_instrumentation_async():
+    response = async_to_sync(AsyncClient().get)("/async")
+
+    assert response.json() == {"async": True}
+    assert [event for event, _ in recorder.events] == ["start", "view", "serialize"]
+
+
+def test_instrumentation_disabled():
+    plain_router = APIRouter()
+
+    @plain_router.route("/")
+    def index(request):
+        return HttpResponse()
+
+    (pattern,) = plain_router.urls
+
+    assert pattern.callback.__closure__ is not None
+    assert not any(
+        "timed" in getattr(cell.cell_contents, "__name__", "")
+        for cell in pattern.callback.__closure__
+    )
+
+
+def test_prometheus_histogram():
+    prometheus = PrometheusHistogram(name="test_seconds", buckets=[0.1, 1])
+    timings = RequestTimings(route="items", name=None, path="/items", method="GET")
+    timings.view = 0.5
+
+    prometheus.observe(timings)
+    prometheus.observe(timings)
+
+    labels = 'route="/items",method="GET",phase="view"'
+    metrics = prometheus.render().splitlines()
+    assert "# TYPE test_seconds histogram" in metrics
+    assert f'test_seconds_bucket{{{labels},le="0.1"}} 0' in metrics
+    assert f'test_seconds_bucket{{{labels},le="1"}} 2' in metrics
+    assert f'test_seconds_bucket{{{labels},le="+Inf"}} 2' in metrics
+    assert f"test_seconds_sum{{{labels}}} 1.0" in metrics
+    assert f"test_seconds_count{{{labels}}} 2" in metrics
+
+
+def test_prometheus_histogram_view(client):
+    client.get("/items/1")
+
+    response = client.get("/metrics")
+
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    labels = 'route="/items/<int:item_id>",method="GET",phase="total"'
+    assert labels in response.content.decode()
+
+
+def test_cprofile_sampler(client, tmp_path):
+    sampler.output_dir = str(tmp_path)
+
+    client.get("/items/1")
+
+    sampler.output_dir = None
+    assert len(sampler.profiles) == 1
+    timings, stats = sampler.profiles[0]
+    assert timings.path == "/items/1"
+    assert stats.total_calls > 0  # type: ignore
+    assert len(list(tmp_path.iterdir())) == 1
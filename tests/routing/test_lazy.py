@@ -0,0 +1,87 @@
+import sys
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+
+from apirouter import APIRouter
+from apirouter.lazy import format_report
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+LAZY_VIEWS = "tests.routing.lazy_views"
+
+router = APIRouter(name="lazy", lazy=True)
+router.add_route("/", f"{LAZY_VIEWS}.index", name="index")
+router.add_route("/async", f"{LAZY_VIEWS}.async_index")
+router.add_view("/items/<int:item_id>", f"{LAZY_VIEWS}.ItemView", name="item")
+
+eager_router = APIRouter(name="eager")
+eager_router.add_route("/eager", f"{LAZY_VIEWS}.index")
+
+router.include_router(eager_router)
+
+urlpatterns = router.urls
+
+
+def test_lazy_routes_not_imported():
+    assert LAZY_VIEWS in sys.modules  # imported by eager router
+    assert router.stats.lazy_routes == 3
+    assert router.stats.routes == 3
+    assert eager_router.stats.imports == 1
+
+
+def test_lazy_route(client):
+    response = client.get("/")
+
+    assert response.json() == {"lazy": True}
+    assert reverse("lazy:index") == "/"
+
+
+def test_lazy_route_replaces_callback(client):
+    client.get("/")
+
+    pattern = next(
+        pattern
+        for pattern in router.urls[0].url_patterns
+        if getattr(pattern, "name", None) == "index"
+    )
+    assert pattern.callback.__name__ == "index"
+
+
+def test_lazy_async_route():
+    response = async_to_sync(AsyncClient().get)("/async")
+
+    assert response.json() == {"async": True}
+
+
+def test_lazy_class_route(client):
+    response = client.get("/items/1")
+
+    assert response.content == b"item 1"
+
+
+def test_eager_dotted_route(client):
+    response = client.get("/eager")
+
+    assert response.json() == {"lazy": True}
+
+
+def test_build_report(client):
+    client.get("/items/2")
+
+    report = router.build_report()
+
+    assert [stats.name for stats in report] == ["lazy", "eager"]
+    assert report[0].build_time >= report[1].build_time > 0
+    assert report[0].imports >= 1
+    assert "lazy: 3 routes (3 lazy)" in format_report(report)
+
+
+def test_build_report_unnamed_routers():
+    root = APIRouter()
+    root.include_router(APIRouter(), prefix="/a/")
+    root.include_router(APIRouter(), prefix="/b/")
+
+    assert len(root.build_report()) == 3
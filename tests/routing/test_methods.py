@@ -0,0 +1,117 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import AsyncClient
+from django.urls import reverse
+
+from apirouter import APIRouter
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+router = APIRouter()
+
+
+@router.get("/items", name="items")
+def items_list(request):
+    return HttpResponse("GET /items")
+
+
+@router.post("/items")
+def items_create(request):
+    return HttpResponse("POST /items")
+
+
+@router.get("/items/<int:item_id>")
+def item_detail(request, item_id: int):
+    return {"id": item_id}
+
+
+@router.put("/items/<int:item_id>")
+def item_update(request, item_id: int):
+    return {"id": item_id, "updated": True}
+
+
+@router.patch("/items/<int:item_id>")
+def item_patch(request, item_id: int):
+    return {"id": item_id, "patched": True}
+
+
+@router.delete("/items/<int:item_id>")
+async def item_delete(request, item_id: int):
+    return {"id": item_id, "deleted": True}
+
+
+@router.get("/async")
+async def async_get(request):
+    return HttpResponse("GET /async")
+
+
+@router.post("/async")
+async def async_post(request):
+    return HttpResponse("POST /async")
+
+
+urlpatterns = router.urls
+
+
+def test_methods_merged():
+    assert [str(pattern.pattern) for pattern in urlpatterns] == [
+        "items",
+        "items/<int:item_id>",
+        "async",
+    ]
+
+
+@pytest.mark.parametrize(
+    "method,content", [("get", b"GET /items"), ("post", b"POST /items")]
+)
+def test_methods_dispatch(client, method: str, content: bytes):
+    response = getattr(client, method)("/items")
+
+    assert response.status_code == 200
+    assert response.content == content
+
+
+@pytest.mark.parametrize(
+    "method,expected",
+    [
+        ("get", {"id": 1}),
+        ("put", {"id": 1, "updated": True}),
+        ("patch", {"id": 1, "patched": True}),
+        ("delete", {"id": 1, "deleted": True}),
+    ],
+)
+def test_methods_dispatch_kwargs(client, method: str, expected: dict):
+    response = getattr(client, method)("/items/1")
+
+    assert response.status_code == 200
+    assert response.json() == expected
+
+
+def test_methods_not_allowed(client):
+    response = client.delete("/items")
+
+    assert response.status_code == 405
+    assert response["Allow"] == "GET, POST"
+
+
+def test_methods_async_dispatch():
+    async_client = AsyncClient()
+
+    get_response = async_to_sync(async_client.get)("/async")
+    post_response = async_to_sync(async_client.post)("/async")
+
+    assert get_response.content == b"GET /async"
+    assert post_response.content == b"POST /async"
+
+
+def test_methods_reverse():
+    assert reverse("items") == "/items"
+
+
+def test_methods_conflicting_name():
+    conflicting_router = APIRouter()
+    conflicting_router.get("/", name="first")(items_list)
+
+    with pytest.raises(ValueError):
+        conflicting_router.post("/", name="second")(items_create)
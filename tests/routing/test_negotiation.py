@@ -0,0 +1,322 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache as default_cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client, RequestFactory
+from django.urls import resolve
+
+from apirouter import APIRouter, JsonResponse
+from apirouter.cache import ResponseCache
+from apirouter.negotiation import (
+    RENDERERS,
+    Negotiation,
+    Parser,
+    Renderer,
+    parse_accept,
+    register_parser,
+    register_renderer,
+)
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+
+class TextParser(Parser):
+    media_type = "text/plain"
+
+    def parse(self, request):
+        return request.body.decode()
+
+
+class TextRenderer(Renderer):
+    media_type = "text/plain"
+
+    def render(self, data):
+        return str(data).encode()
+
+
+register_parser("text", TextParser())
+register_renderer("text", TextRenderer())
+
+router = APIRouter(
+    negotiation=Negotiation(renderers=("json", "text"), parsers=("json", "form"))
+)
+
+ITEM = {"id": 1, "name": "Item"}
+
+
+@router.route("/item")
+def item(request):
+    return ITEM
+
+
+@router.route("/items")
+def items(request):
+    return (dict(ITEM, id=index) for index in range(3))
+
+
+@router.route("/echo", methods=["POST", "PUT", "PATCH"])
+def echo(request):
+    return {"data": request.data}
+
+
+@router.route(
+    "/text",
+    methods=["POST"],
+    negotiation=Negotiation(renderers=("text",), parsers=("text",)),
+)
+def text(request):
+    return request.data.upper()
+
+
+@router.route("/async-echo", methods=["POST"])
+async def async_echo(request):
+    return {"data": request.data}
+
+
+@router.route("/cached", cache=ResponseCache())
+def cached(request):
+    return ITEM
+
+
+urlpatterns = router.urls
+
+
+def test_default_renderer():
+    response = Client().get("/item")
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert response["Vary"] == "Accept"
+    assert response.json() == ITEM
+
+
+@pytest.mark.parametrize(
+    "accept,content_type",
+    [
+        ("application/json", "application/json"),
+        ("text/plain", "text/plain"),
+        ("text/*", "text/plain"),
+        ("*/*", "application/json"),
+        ("application/json;q=0.5, text/plain", "text/plain"),
+        ("application/msgpack, text/plain;q=0.1", "text/plain"),
+    ],
+)
+def test_select_renderer(accept, content_type):
+    response = Client().get("/item", HTTP_ACCEPT=accept)
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == content_type
+
+
+def test_text_renderer():
+    response = Client().get("/item", HTTP_ACCEPT="text/plain")
+
+    assert response.content == str(ITEM).encode()
+
+
+def test_not_acceptable():
+    response = Client().get("/item", HTTP_ACCEPT="application/xml")
+
+    assert response.status_code == 406
+    assert response["Content-Type"] == "application/json"
+
+
+def test_streamable_result():
+    json_response = Client().get("/items")
+    text_response = Client().get("/items", HTTP_ACCEPT="text/plain")
+
+    assert json_response.streaming
+    assert json.loads(b"".join(json_response.streaming_content)) == [
+        dict(ITEM, id=index) for index in range(3)
+    ]
+    assert (
+        text_response.content
+        == str([dict(ITEM, id=index) for index in range(3)]).encode()
+    )
+
+
+def test_parse_json():
+    response = Client().post(
+        "/echo", data={"name": "Item"}, content_type="application/json"
+    )
+
+    assert response.json() == {"data": {"name": "Item"}}
+
+
+def test_parse_form():
+    response = Client().post(
+        "/echo",
+        data="name=Item",
+        content_type="application/x-www-form-urlencoded",
+    )
+
+    assert response.json() == {"data": {"name": "Item"}}
+
+
+@pytest.mark.parametrize("method", ["put", "patch"])
+def test_parse_form_not_post(method):
+    response = getattr(Client(), method)(
+        "/echo", data="a=1&b=2", content_type="application/x-www-form-urlencoded"
+    )
+
+    assert response.json() == {"data": {"a": "1", "b": "2"}}
+
+
+def test_parse_multipart_put():
+    router = APIRouter(negotiation=Negotiation())
+
+    @router.route("/upload", methods=["PUT"])
+    def upload(request):
+        return {"data": request.data, "file": request.FILES["file"].read().decode()}
+
+    post = RequestFactory().post(
+        "/upload", data={"name": "Item", "file": SimpleUploadedFile("a.txt", b"x")}
+    )
+    request = RequestFactory().put(
+        "/upload", data=post.body, content_type=post.META["CONTENT_TYPE"]
+    )
+    response = router.urls[0].callback(request)
+
+    assert json.loads(response.content) == {"data": {"name": "Item"}, "file": "x"}
+
+
+def test_parse_empty_body():
+    response = Client().post("/echo", data="", content_type="application/json")
+
+    assert response.json() == {"data": None}
+
+
+def test_parse_invalid_body():
+    response = Client().post("/echo", data="{", content_type="application/json")
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid request body."}
+
+
+def test_unsupported_media_type():
+    response = Client().post("/echo", data="Item", content_type="text/plain")
+
+    assert response.status_code == 415
+
+
+def test_route_negotiation():
+    response = Client().post(
+        "/text", data="item", content_type="text/plain", HTTP_ACCEPT="text/*"
+    )
+
+    assert response["Content-Type"] == "text/plain"
+    assert response.content == b"ITEM"
+
+
+def test_async_view():
+    request = RequestFactory().post(
+        "/async-echo",
+        data={"name": "Item"},
+        content_type="application/json",
+        HTTP_ACCEPT="text/plain",
+    )
+    response = async_to_sync(resolve("/async-echo").func)(request)
+
+    assert response["Content-Type"] == "text/plain"
+    assert response.content == str({"data": {"name": "Item"}}).encode()
+
+
+def test_cache_variants():
+    default_cache.clear()
+    json_response = Client().get("/cached")
+    text_response = Client().get("/cached", HTTP_ACCEPT="text/plain")
+
+    assert json_response["Content-Type"] == "application/json"
+    assert text_response["Content-Type"] == "text/plain"
+    assert Client().get("/cached").content == json_response.content
+
+
+def test_msgpack():
+    msgpack = pytest.importorskip("msgpack")
+    negotiation = Negotiation()
+    router = APIRouter(negotiation=negotiation)
+
+    @router.route("/msgpack", methods=["POST"])
+    def view(request):
+        return request.data
+
+    request = RequestFactory().post(
+        "/msgpack",
+        data=msgpack.packb({"name": "Item"}),
+        content_type="application/msgpack",
+        HTTP_ACCEPT="application/msgpack",
+    )
+    response = router.urls[0].callback(request)
+
+    assert response["Content-Type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == {"name": "Item"}
+
+
+def test_request_data_without_negotiation():
+    router = APIRouter()
+
+    @router.route("/data", methods=["POST"])
+    def view(request):
+        return {"data": request.data}
+
+    request = RequestFactory().post(
+        "/data", data="name=Item", content_type="application/x-www-form-urlencoded"
+    )
+    response = router.urls[0].callback(request)
+
+    assert json.loads(response.content) == {"data": {"name": "Item"}}
+
+
+def test_unknown_format():
+    with pytest.raises(ImproperlyConfigured):
+        Negotiation(renderers=("xml",))
+
+
+def test_no_available_formats():
+    if "msgpack" in RENDERERS:
+        pytest.skip("msgpack is installed")
+    with pytest.raises(ImproperlyConfigured):
+        Negotiation(renderers=("msgpack",))
+
+
+def test_router_response_class():
+    class CustomResponse(JsonResponse):
+        def __init__(self, data, **kwargs):
+            super().__init__(data, headers={"X-Custom": "1"}, **kwargs)
+
+    router = APIRouter(negotiation=Negotiation(), response_class=CustomResponse)
+
+    @router.route("/custom")
+    def custom(request):
+        return ITEM
+
+    response = router.urls[0].callback(RequestFactory().get("/custom"))
+
+    assert response["X-Custom"] == "1"
+    assert response["Vary"] == "Accept"
+
+
+def test_optional_formats_skipped():
+    negotiation = Negotiation(renderers=("json", "msgpack", "cbor"))
+
+    assert negotiation.renderers[0].media_type == "application/json"
+
+
+@pytest.mark.parametrize(
+    "accept,expected",
+    [
+        ("application/json", (("application/json", 1.0),)),
+        (
+            "text/*;q=0.5, application/json",
+            (("application/json", 1.0), ("text/*", 0.5)),
+        ),
+        ("*/*, text/plain", (("text/plain", 1.0), ("*/*", 1.0))),
+        ("text/plain;q=invalid", (("text/plain", 0.0),)),
+        ("", ()),
+    ],
+)
+def test_parse_accept(accept, expected):
+    assert parse_accept(accept) == expected
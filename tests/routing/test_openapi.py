@@ -0,0 +1,171 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+from django.http import HttpResponse
+from django.views import View
+
+from apirouter import APIRouter
+from apirouter.openapi import exclude_from_schema
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+
+@dataclass
+class Item:
+    name: str
+    tags: List[str]
+    price: Optional[float] = None
+
+
+router = APIRouter(openapi_info={"title": "Shop", "version": "1.0.0"})
+items_router = APIRouter(typed=True)
+
+
+@items_router.get("/items", name="items")
+def list_items(request, limit: int = 10, q: Optional[str] = None) -> List[Item]:
+    """
+    List items.
+
+    Items are ordered by name.
+    """
+    return []  # pragma: no cover
+
+
+@items_router.post("/items", name="items")
+def create_item(request, item: Item) -> Item:
+    return item  # pragma: no cover
+
+
+@items_router.route("/items/<int:item_id>", methods=["PUT"])
+def update_item(request, item_id: int, item: Item) -> HttpResponse:
+    return HttpResponse()  # pragma: no cover
+
+
+@router.view("/ping")
+class PingView(View):
+    def get(self, request):
+        """
+        Ping.
+        """
+        return HttpResponse("pong")  # pragma: no cover
+
+
+@router.route("/internal")
+@exclude_from_schema
+def internal(request):
+    return HttpResponse()  # pragma: no cover
+
+
+router.include_router(items_router, prefix="/v1/")
+router.add_openapi_route()
+
+urlpatterns = router.urls
+
+
+def test_openapi_document():
+    document = router.openapi()
+
+    assert document["openapi"] == "3.0.3"
+    assert document["info"] == {"title": "Shop", "version": "1.0.0"}
+    assert list(document["paths"]) == ["/ping", "/v1/items", "/v1/items/{item_id}"]
+    assert document["paths"]["/ping"] == {
+        "get": {
+            "operationId": "get_ping",
+            "summary": "Ping.",
+            "responses": {"200": {"description": "Successful response"}},
+        }
+    }
+
+
+def test_openapi_typed_operations():
+    paths = router.openapi()["paths"]
+
+    assert paths["/v1/items"]["get"] == {
+        "operationId": "items_get",
+        "summary": "List items.",
+        "description": "Items are ordered by name.",
+        "parameters": [
+            {
+                "name": "limit",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "integer", "default": 10},
+            },
+            {
+                "name": "q",
+                "in": "query",
+                "required": False,
+                "schema": {"type": "string", "nullable": True},
+            },
+        ],
+        "responses": {
+            "200": {
+                "description": "Successful response",
+                "content": {
+                    "application/json": {
+                        "schema": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Item"},
+                        }
+                    }
+                },
+            },
+            "422": {"description": "Validation error"},
+        },
+    }
+    assert paths["/v1/items"]["post"]["requestBody"] == {
+        "required": True,
+        "content": {
+            "application/json": {"schema": {"$ref": "#/components/schemas/Item"}}
+        },
+    }
+    update = paths["/v1/items/{item_id}"]["put"]
+    assert update["operationId"] == "put_v1_items_item_id"
+    assert update["parameters"] == [
+        {
+            "name": "item_id",
+            "in": "path",
+            "required": True,
+            "schema": {"type": "integer"},
+        }
+    ]
+    assert "content" not in update["responses"]["200"]
+
+
+def test_openapi_components():
+    schemas = router.openapi()["components"]["schemas"]
+
+    assert schemas == {
+        "Item": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "price": {"type": "number", "nullable": True},
+            },
+            "required": ["name", "tags"],
+        }
+    }
+
+
+def test_openapi_memoized():
+    assert router.openapi() is router.openapi()
+    assert router.openapi_schema.content is router.openapi_schema.content
+
+
+def test_openapi_route(client):
+    response = client.get("/openapi.json")
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert response.content == router.openapi_schema.content
+    assert response.json()["info"]["title"] == "Shop"
+
+
+def test_openapi_route_not_modified(client):
+    etag = client.get("/openapi.json")["ETag"]
+
+    response = client.get("/openapi.json", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
@@ -0,0 +1,235 @@
+from datetime import datetime
+from typing import List
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models import F
+from django.test import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext
+
+from apirouter import APIRouter
+from apirouter.pagination import CursorPagination, estimate_count
+from tests.models import Entry, Item
+
+pytestmark = [pytest.mark.urls(__name__), pytest.mark.django_db]
+
+router = APIRouter(paginate=CursorPagination(page_size=10, max_page_size=20))
+
+
+@router.route("/items")
+def items(request):
+    return Item.objects.values("id", "name", "price")
+
+
+@router.route(
+    "/items/by-price",
+    paginate=CursorPagination(ordering=["-price"], page_size=4, count="exact"),
+)
+def items_by_price(request):
+    return Item.objects.values("id", "price")
+
+
+@router.route("/items/estimate", paginate=CursorPagination(count="estimate"))
+def items_estimate(request):
+    return Item.objects.values("id")
+
+
+@router.route("/items/instances", paginate=CursorPagination(page_size=10))
+def items_instances(request):
+    return [{"id": item.id} for item in Item.objects.all()]
+
+
+@router.route("/items/async")
+async def items_async(request):
+    return Item.objects.values("id")
+
+
+@router.route(
+    "/items/unselected", paginate=CursorPagination(ordering=["price"], page_size=10)
+)
+def items_unselected(request):
+    return Item.objects.values("id")
+
+
+@router.route("/items/expression")
+def items_expression(request):
+    return Item.objects.order_by(F("price").desc()).values("id")
+
+
+@router.route(
+    "/entries",
+    paginate=CursorPagination(ordering=["-created"], page_size=3),
+)
+def entries(request):
+    return Entry.objects.values("id")
+
+
+@router.route("/detail")
+def detail(request):
+    return {"id": 1}
+
+
+urlpatterns = router.urls
+
+
+@pytest.fixture(autouse=True)
+def objects():
+    Item.objects.bulk_create(
+        Item(name=f"Item {index}", price=index % 5) for index in range(25)
+    )
+    return list(Item.objects.order_by("id").values_list("id", flat=True))
+
+
+def fetch_all(client, path: str, **params):
+    ids: List[int] = []
+    query = "&".join(f"{name}={value}" for name, value in params.items())
+    page = client.get(f"{path}?{query}").json()
+    pages = [page]
+    while page["next"]:
+        page = client.get(f"{path}?cursor={page['next']}&{query}").json()
+        pages.append(page)
+    for page in pages:
+        ids.extend(item["id"] for item in page["results"])
+    return ids, pages
+
+
+def test_first_page(client: Client, objects):
+    page = client.get("/items").json()
+
+    assert [item["id"] for item in page["results"]] == objects[:10]
+    assert page["next"]
+    assert page["previous"] is None
+    assert "count" not in page
+
+
+def test_all_pages(client: Client, objects):
+    ids, pages = fetch_all(client, "/items")
+
+    assert ids == objects
+    assert len(pages) == 3
+    assert pages[-1]["next"] is None
+
+
+def test_previous_page(client: Client, objects):
+    first = client.get("/items").json()
+    second = client.get(f"/items?cursor={first['next']}").json()
+    previous = client.get(f"/items?cursor={second['previous']}").json()
+
+    assert previous["results"] == first["results"]
+    assert previous["previous"] is None
+    assert previous["next"]
+
+
+def test_page_size(client: Client, objects):
+    assert len(client.get("/items?page_size=5").json()["results"]) == 5
+    assert len(client.get("/items?page_size=100").json()["results"]) == 20
+    assert len(client.get("/items?page_size=invalid").json()["results"]) == 10
+
+
+def test_ordering_with_ties(client: Client):
+    ids, pages = fetch_all(client, "/items/by-price")
+
+    expected = list(Item.objects.order_by("-price", "-id").values_list("id", flat=True))
+    assert ids == expected
+    assert {page["count"] for page in pages} == {25}
+
+
+def test_ordering_with_ties_backwards(client: Client):
+    _, pages = fetch_all(client, "/items/by-price")
+    page = pages[-1]
+    results = []
+    while page["previous"]:
+        page = client.get(f"/items/by-price?cursor={page['previous']}").json()
+        results.append(page["results"])
+
+    assert results == [page["results"] for page in reversed(pages[:-1])]
+
+
+def test_page_query_is_keyset(client: Client):
+    page = client.get("/items").json()
+    with CaptureQueriesContext(connection) as queries:
+        client.get(f"/items?cursor={page['next']}")
+
+    (query,) = queries.captured_queries
+    assert "OFFSET" not in query["sql"]
+    assert "LIMIT 11" in query["sql"]
+
+
+def test_count_estimate(client: Client):
+    page = client.get("/items/estimate").json()
+
+    assert page["count"] == 25
+    assert estimate_count(Item.objects.all(), limit=10) == 10
+
+
+def test_sequence(client: Client, objects):
+    ids, pages = fetch_all(client, "/items/instances")
+
+    assert ids == objects
+    second = client.get(f"/items/instances?cursor={pages[1]['next']}").json()
+    previous = client.get(f"/items/instances?cursor={second['previous']}").json()
+    assert previous == pages[1]
+
+
+def test_async_view(objects):
+    response = async_to_sync(AsyncClient().get)("/items/async")
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["results"]] == objects[:10]
+
+
+@pytest.mark.parametrize("cursor", ["invalid", "e30:1kxxxx:invalid"])
+def test_invalid_cursor(client: Client, cursor: str):
+    response = client.get(f"/items?cursor={cursor}")
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor."}
+
+
+def test_cursor_of_other_ordering(client: Client):
+    page = client.get("/items/by-price").json()
+
+    response = client.get(f"/items?cursor={page['next']}")
+
+    assert response.status_code == 400
+
+
+def test_not_paginated_result(client: Client):
+    assert client.get("/detail").json() == {"id": 1}
+
+
+def test_ordering_fields_not_selected(client: Client):
+    ids, pages = fetch_all(client, "/items/unselected")
+
+    assert ids == list(
+        Item.objects.order_by("price", "id").values_list("id", flat=True)
+    )
+    assert all(item.keys() == {"id"} for page in pages for item in page["results"])
+
+
+def test_invalid_ordering(client: Client):
+    with pytest.raises(ImproperlyConfigured):
+        client.get("/items/expression")
+
+
+def test_invalid_count():
+    with pytest.raises(ImproperlyConfigured):
+        CursorPagination(count="invalid")
+
+
+def test_datetime_ordering_sub_millisecond(client: Client):
+    # Rows share milliseconds, differing by microseconds
+    Entry.objects.bulk_create(
+        Entry(created=datetime(2020, 1, 1, 12, 0, 0, 123000 + index % 8))
+        for index in range(25)
+    )
+
+    ids, pages = fetch_all(client, "/entries")
+
+    expected = list(
+        Entry.objects.order_by("-created", "-id").values_list("id", flat=True)
+    )
+    assert ids == expected
+    assert len(pages) == 9
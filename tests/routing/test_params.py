@@ -0,0 +1,208 @@
+import enum
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import attr
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.exceptions import ImproperlyConfigured
+from django.test import AsyncClient
+
+from apirouter import APIRouter
+from apirouter.params import ParamsParser
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+router = APIRouter(typed=True)
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+@dataclass
+class Item:
+    name: str
+    price: float
+    tags: List[Tag] = field(default_factory=list)
+    color: Optional[Color] = None
+
+
+@attr.dataclass
+class Owner:
+    email: str
+    active: bool = True
+
+
+@router.route("/items")
+def items(request, limit: int = 10, active: bool = False, q: Optional[str] = None):
+    return {"limit": limit, "active": active, "q": q}
+
+
+@router.route("/ids")
+def ids(request, id: List[int]):
+    return {"id": id}
+
+
+@router.route("/items/<int:item_id>", methods=["POST"])
+def update_item(request, item_id: int, item: Item):
+    return {
+        "id": item_id,
+        "name": item.name,
+        "price": item.price,
+        "tags": [tag.name for tag in item.tags],
+        "color": item.color.value if item.color else None,
+    }
+
+
+@router.post("/owners", view_kwargs={"source": "api"})
+def create_owner(request, source: str, owner: Owner):
+    return {"source": source, "email": owner.email, "active": owner.active}
+
+
+@router.post("/transfer")
+def transfer(request, item: Item, owner: Owner):
+    return {"item": item.name, "owner": owner.email}
+
+
+@router.route("/async")
+async def async_items(request, limit: int):
+    return {"limit": limit}
+
+
+@router.route("/untyped", typed=False)
+def untyped(request, limit="10"):
+    return {"limit": limit}
+
+
+urlpatterns = router.urls
+
+
+def test_query_params(client):
+    response = client.get("/items", {"limit": "5", "active": "true", "q": "x"})
+
+    assert response.json() == {"limit": 5, "active": True, "q": "x"}
+
+
+def test_query_params_defaults(client):
+    response = client.get("/items")
+
+    assert response.json() == {"limit": 10, "active": False, "q": None}
+
+
+def test_query_params_invalid(client):
+    response = client.get("/items", {"limit": "many", "active": "maybe"})
+
+    assert response.status_code == 422
+    assert response.json() == {
+        "detail": [
+            {"loc": ["query", "limit"], "msg": "Value is not a valid integer."},
+            {"loc": ["query", "active"], "msg": "Value is not a valid boolean."},
+        ]
+    }
+
+
+def test_query_params_list(client):
+    response = client.get("/ids?id=1&id=2")
+
+    assert response.json() == {"id": [1, 2]}
+
+
+def test_query_params_required(client):
+    response = client.get("/ids")
+
+    assert response.status_code == 422
+    assert response.json() == {
+        "detail": [{"loc": ["query", "id"], "msg": "Field required."}]
+    }
+
+
+def test_body_dataclass(client):
+    response = client.post(
+        "/items/1",
+        {"name": "Pen", "price": 2, "tags": [{"name": "office"}], "color": "red"},
+        content_type="application/json",
+    )
+
+    assert response.json() == {
+        "id": 1,
+        "name": "Pen",
+        "price": 2.0,
+        "tags": ["office"],
+        "color": "red",
+    }
+
+
+def test_body_dataclass_invalid(client):
+    response = client.post(
+        "/items/1",
+        {"price": "free", "tags": [{}], "color": "blue"},
+        content_type="application/json",
+    )
+
+    assert response.status_code == 422
+    assert response.json() == {
+        "detail": [
+            {"loc": ["body", "name"], "msg": "Field required."},
+            {"loc": ["body", "price"], "msg": "Value is not a valid float."},
+            {"loc": ["body", "tags", 0, "name"], "msg": "Field required."},
+            {
+                "loc": ["body", "color"],
+                "msg": "Value is not a valid choice ('red', 'green').",
+            },
+        ]
+    }
+
+
+def test_body_invalid_json(client):
+    response = client.post("/items/1", "{", content_type="application/json")
+
+    assert response.status_code == 400
+
+
+def test_body_attrs_with_view_kwargs(client):
+    response = client.post(
+        "/owners", {"email": "a@example.com"}, content_type="application/json"
+    )
+
+    assert response.json() == {
+        "source": "api",
+        "email": "a@example.com",
+        "active": True,
+    }
+
+
+def test_body_embedded_models(client):
+    response = client.post(
+        "/transfer",
+        {"item": {"name": "Pen", "price": 1}, "owner": {"email": "a@example.com"}},
+        content_type="application/json",
+    )
+
+    assert response.json() == {"item": "Pen", "owner": "a@example.com"}
+
+
+def test_async_view():
+    response = async_to_sync(AsyncClient().get)("/async?limit=3")
+
+    assert response.json() == {"limit": 3}
+
+
+def test_typed_disabled(client):
+    response = client.get("/untyped")
+
+    assert response.json() == {"limit": "10"}
+
+
+def test_unsupported_annotation():
+    def view(request, value: object):
+        pass  # pragma: no cover
+
+    with pytest.raises(ImproperlyConfigured):
+        ParamsParser(view, path="")
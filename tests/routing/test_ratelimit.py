@@ -0,0 +1,219 @@
+from collections import Counter
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache as default_cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import AsyncClient
+
+from apirouter import APIRouter, Request
+from apirouter.ratelimit import CacheStore, MemoryStore, RateLimit, parse_rate
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+calls: Counter = Counter()
+
+
+class CountingRequest(Request):
+    __slots__ = ()
+
+    def __init__(self, request):
+        calls["request"] += 1
+        super().__init__(request)
+
+
+router = APIRouter(
+    rate_limit=RateLimit("2/m", scope="router"), request_class=CountingRequest
+)
+
+
+@router.route("/token")
+def token(request):
+    calls["token"] += 1
+    return {"ok": True}
+
+
+@router.route("/shared")
+def shared(request):
+    return {"ok": True}
+
+
+@router.route("/window", rate_limit=RateLimit("1/m", algorithm="sliding_window"))
+def window(request):
+    return {"ok": True}
+
+
+@router.route(
+    "/cached",
+    rate_limit=RateLimit("1/m", store=CacheStore(), algorithm="sliding_window"),
+)
+def cached(request):
+    return {"ok": True}
+
+
+@router.route(
+    "/cached-bucket", rate_limit=RateLimit("1/m", store=CacheStore(), key="user")
+)
+def cached_bucket(request):
+    return {"ok": True}
+
+
+@router.route(
+    "/custom",
+    rate_limit=RateLimit("1/m", key=lambda request: request.GET.get("token", "")),
+)
+def custom(request):
+    return {"ok": True}
+
+
+@router.route("/async", rate_limit=RateLimit("1/m"))
+async def async_view(request):
+    return {"ok": True}
+
+
+@router.route("/posts", rate_limit=RateLimit("1/m", methods=["POST"]))
+def posts(request):
+    return {"ok": True}
+
+
+urlpatterns = router.urls
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    calls.clear()
+    default_cache.clear()
+    for rate_limit in [router.rate_limit] + [
+        route.rate_limit for route in router.routes if route.rate_limit
+    ]:
+        if isinstance(rate_limit.store, MemoryStore):
+            rate_limit.store.__init__()
+
+
+def test_rate_limit_token_bucket(client):
+    assert client.get("/token").status_code == 200
+    assert client.get("/token").status_code == 200
+
+    response = client.get("/token")
+
+    assert response.status_code == 429
+    assert response.json() == {"detail": "Too Many Requests"}
+    assert response["Retry-After"] == "30"
+
+
+def test_rate_limit_rejects_before_request_wrapping(client):
+    for _ in range(5):
+        client.get("/token")
+
+    assert calls["token"] == 2
+    assert calls["request"] == 2
+
+
+def test_rate_limit_scope(client):
+    client.get("/token")
+    client.get("/token")
+
+    assert client.get("/shared").status_code == 429
+
+
+def test_rate_limit_sliding_window(client):
+    assert client.get("/window").status_code == 200
+
+    response = client.get("/window")
+
+    assert response.status_code == 429
+    assert 0 < int(response["Retry-After"]) <= 60
+
+
+def test_rate_limit_cache_store(client):
+    assert client.get("/cached").status_code == 200
+    assert client.get("/cached").status_code == 429
+    assert client.get("/cached", REMOTE_ADDR="10.0.0.1").status_code == 200
+
+
+def test_rate_limit_cache_store_token_bucket(client):
+    assert client.get("/cached-bucket").status_code == 200
+    assert client.get("/cached-bucket").status_code == 429
+
+
+def test_rate_limit_custom_key(client):
+    assert client.get("/custom?token=a").status_code == 200
+    assert client.get("/custom?token=b").status_code == 200
+    assert client.get("/custom?token=a").status_code == 429
+
+
+def test_rate_limit_async():
+    client = AsyncClient()
+
+    assert async_to_sync(client.get)("/async").status_code == 200
+    assert async_to_sync(client.get)("/async").status_code == 429
+
+
+def test_rate_limit_methods(client):
+    assert client.get("/posts").status_code == 200
+    assert client.get("/posts").status_code == 200
+    assert client.post("/posts").status_code == 200
+    assert client.post("/posts").status_code == 429
+
+
+@pytest.mark.parametrize(
+    "rate,expected",
+    [("10/s", (10, 1.0)), ("100/m", (100, 60.0)), ("5/10m", (5, 600.0))],
+)
+def test_parse_rate(rate, expected):
+    assert parse_rate(rate) == expected
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"rate": "10"},
+        {"rate": "1/m", "algorithm": "leaky"},
+        {"rate": "1/m", "key": "x"},
+    ],
+)
+def test_rate_limit_invalid(kwargs):
+    with pytest.raises(ImproperlyConfigured):
+        RateLimit(**kwargs)
+
+
+def test_memory_store_sliding_window_weighted(monkeypatch):
+    store = MemoryStore()
+    now = [120.0]
+    monkeypatch.setattr("apirouter.ratelimit.time.monotonic", lambda: now[0])
+
+    assert store.sliding_window("key", 2, 60) == 0
+    assert store.sliding_window("key", 2, 60) == 0
+    assert store.sliding_window("key", 2, 60) == 60
+
+    now[0] = 195.0  # quarter of the next window, previous weight 0.75
+
+    assert store.sliding_window("key", 2, 60) == 0
+    assert store.sliding_window("key", 2, 60) == pytest.approx(45.0)
+
+
+@pytest.mark.parametrize("algorithm", ["token_bucket", "sliding_window"])
+def test_memory_store_max_keys(algorithm):
+    store = MemoryStore(max_keys=100)
+    hit = getattr(store, algorithm)
+    for index in range(150):
+        assert hit(f"key-{index}", 5, 3600) == 0
+    keys = store._buckets if algorithm == "token_bucket" else store._windows
+
+    # Live keys are evicted in LRU order
+    assert len(keys) == 100
+    assert "key-49" not in keys
+    assert "key-149" in keys
+
+
+@pytest.mark.parametrize(
+    "now,limit,period", [(468.5834670870026, 1, 60), (140957.04086280413, 3, 1)]
+)
+def test_token_bucket_rounding(monkeypatch, now: float, limit: int, period: float):
+    monkeypatch.setattr("apirouter.ratelimit.time.monotonic", lambda: now)
+    store = MemoryStore()
+
+    retries = [store.token_bucket("key", limit, period) for _ in range(limit)]
+
+    assert retries == [0.0] * limit
+    assert store.token_bucket("key", limit, period) > 0
@@ -0,0 +1,267 @@
+import asyncio
+import time
+from typing import Set
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.exceptions import ImproperlyConfigured
+from django.core.handlers.asgi import ASGIHandler as DjangoASGIHandler
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections
+from django.test import Client
+
+from apirouter import APIRouter
+from apirouter.json_backends import get_json_backend
+from apirouter.sse import ASGIHandler, Event, EventStreamResponse, encode_event
+
+pytestmark = [pytest.mark.urls(__name__)]
+
+dumps = get_json_backend().dumps
+
+HEARTBEAT = b": heartbeat\n\n"
+
+closed: Set[str] = set()
+
+router = APIRouter()
+
+
+@router.stream("/events")
+def events(request):
+    try:
+        yield "first"
+        yield Event(data="second", event="update", id="2")
+    finally:
+        closed.add("events")
+
+
+@router.stream("/resume")
+def resume(request, last_event_id):
+    start = int(last_event_id or 0) + 1
+    for index in range(start, start + 2):
+        yield Event(data=index, id=str(index))
+
+
+@router.stream("/retry", retry=5000)
+def retry(request):
+    yield "data"
+
+
+@router.stream("/idle", heartbeat=0.01)
+def idle(request):
+    yield None
+    time.sleep(0.02)
+    yield None
+    yield "data"
+
+
+@router.stream("/items/<int:item_id>")
+async def item_events(request, item_id: int):
+    yield Event(data=item_id, id="1")
+    await asyncio.sleep(0)
+    yield {"item_id": item_id}
+
+
+@router.stream("/async-idle", heartbeat=0.01)
+async def async_idle(request):
+    try:
+        while True:
+            await asyncio.sleep(1)
+            yield "data"
+    finally:
+        closed.add("async-idle")
+
+
+@router.route("/plain")
+def plain(request):
+    return {"ok": True}
+
+
+urlpatterns = router.urls
+
+
+@pytest.fixture(autouse=True)
+def clear_closed():
+    closed.clear()
+
+
+@pytest.fixture(autouse=True)
+def keep_connections():
+    # Like Django test client, requests don't close test database connections
+    request_started.disconnect(close_old_connections)
+    request_finished.disconnect(close_old_connections)
+    yield
+    request_started.connect(close_old_connections)
+    request_finished.connect(close_old_connections)
+
+
+def read(response) -> bytes:
+    return b"".join(response.streaming_content)
+
+
+def test_stream():
+    response = Client().get("/events")
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/event-stream"
+    assert response["Cache-Control"] == "no-cache"
+    assert read(response) == b"data: first\n\nevent: update\nid: 2\ndata: second\n\n"
+    assert "events" in closed
+
+
+def test_method_not_allowed():
+    assert Client().post("/events").status_code == 405
+
+
+def test_last_event_id():
+    assert read(Client().get("/resume")) == b"id: 1\ndata: 1\n\nid: 2\ndata: 2\n\n"
+    assert read(Client().get("/resume", HTTP_LAST_EVENT_ID="5")) == (
+        b"id: 6\ndata: 6\n\nid: 7\ndata: 7\n\n"
+    )
+    assert read(Client().get("/resume?lastEventId=1")).startswith(b"id: 2\n")
+
+
+def test_retry():
+    assert read(Client().get("/retry")) == b"retry: 5000\n\ndata: data\n\n"
+
+
+def test_sync_heartbeat():
+    assert read(Client().get("/idle")) == b": heartbeat\n\ndata: data\n\n"
+
+
+def test_async_generator():
+    response = Client().get("/items/1")
+
+    assert read(response) == (
+        b"id: 1\ndata: 1\n\ndata: " + dumps({"item_id": 1}) + b"\n\n"
+    )
+
+
+@pytest.mark.django_db
+def test_close():
+    response = Client().get("/async-idle")
+    chunks = iter(response.streaming_content)
+
+    assert next(chunks) == b": heartbeat\n\n"
+    response.close()
+    assert "async-idle" in closed
+
+
+@pytest.mark.parametrize(
+    "event,expected",
+    [
+        ("text", b"data: text\n\n"),
+        ("line 1\nline 2", b"data: line 1\ndata: line 2\n\n"),
+        (b"bytes", b"data: bytes\n\n"),
+        ([1, 2], b"data: " + dumps([1, 2]) + b"\n\n"),
+        ("", b"data: \n\n"),
+        (Event(comment="ping"), b": ping\n\n"),
+        (
+            Event(data="x", event="e", id="1", retry=10),
+            b"event: e\nid: 1\nretry: 10\ndata: x\n\n",
+        ),
+    ],
+)
+def test_encode_event(event, expected):
+    assert encode_event(event) == expected
+
+
+@pytest.mark.parametrize(
+    "event", [Event(event="a\nb"), Event(id="1\r"), Event(id="1\0")]
+)
+def test_encode_invalid_event(event):
+    with pytest.raises(ValueError):
+        encode_event(event)
+
+
+def asgi_request(path, disconnect_after=None, handler_class=ASGIHandler):
+    """
+    Run ASGI request, the client disconnects after receiving
+    `disconnect_after` body chunks.
+    """
+    messages = []
+
+    async def run():
+        disconnected = asyncio.Event()
+        request_sent = False
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            messages.append(message)
+            chunks = [m for m in messages if m.get("body")]
+            if disconnect_after is not None and len(chunks) >= disconnect_after:
+                disconnected.set()
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": b"",
+            "headers": [],
+        }
+        await asyncio.wait_for(handler_class()(scope, receive, send), timeout=5)
+
+    async_to_sync(run)()
+    return messages
+
+
+def test_asgi_stream():
+    messages = asgi_request("/items/2")
+
+    assert messages[0]["status"] == 200
+    assert b"".join(m.get("body", b"") for m in messages) == (
+        b"id: 1\ndata: 2\n\ndata: " + dumps({"item_id": 2}) + b"\n\n"
+    )
+    assert messages[-1] == {"type": "http.response.body"}
+
+
+def test_asgi_sync_stream():
+    messages = asgi_request("/idle")
+    body = b"".join(m.get("body", b"") for m in messages)
+
+    # Heartbeats are sent while the sync step blocks in a worker thread
+    assert body.startswith(HEARTBEAT)
+    assert body.endswith(HEARTBEAT + b"data: data\n\n")
+
+
+def test_asgi_disconnect():
+    messages = asgi_request("/async-idle", disconnect_after=2)
+
+    assert [m["body"] for m in messages[1:]] == [HEARTBEAT, HEARTBEAT]
+    assert "async-idle" in closed
+
+
+def test_asgi_sync_stream_closed():
+    messages = asgi_request("/events")
+
+    assert messages[-1] == {"type": "http.response.body"}
+    assert "events" in closed
+
+
+def test_asgi_plain_response():
+    messages = asgi_request("/plain")
+
+    assert messages[0]["status"] == 200
+    assert messages[1]["body"] == dumps({"ok": True})
+
+
+def test_django_asgi_handler():
+    messages = asgi_request("/items/2", handler_class=DjangoASGIHandler)
+
+    assert messages[0]["status"] == 500
+
+
+def test_iterate_on_event_loop():
+    response = EventStreamResponse(iter(["data"]))
+
+    async def iterate():
+        return list(response)
+
+    with pytest.raises(ImproperlyConfigured):
+        async_to_sync(iterate)()
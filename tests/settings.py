@@ -1,3 +1,9 @@
 DEBUG = True
 SECRET_KEY = "test"
 ROOT_URLCONF = "tests.urls"
+
+INSTALLED_APPS = ["tests"]
+
+DATABASES = {"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}}
+
+DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
@@ -0,0 +1,55 @@
+import json
+
+from benchmarks.cases import CASES
+from benchmarks.runner import compare, main, measure
+
+
+def test_case_names_unique():
+    names = [case.name for case in CASES]
+
+    assert len(names) == len(set(names))
+
+
+def test_measure():
+    result = measure(lambda: None, repeat=2, min_time=0.001)
+
+    assert result["repeat"] == 2
+    assert result["number"] >= 1
+    assert 0 < result["min"] <= result["mean"]
+
+
+def test_compare():
+    baseline = {"benchmarks": [{"name": "a", "min": 1.0}, {"name": "b", "min": 1.0}]}
+    current = {
+        "benchmarks": [
+            {"name": "a", "min": 1.5},
+            {"name": "b", "min": 0.9},
+            {"name": "c", "min": 1.0},
+        ]
+    }
+
+    assert compare(baseline, current, threshold=1.2) == [
+        {"name": "a", "ratio": 1.5, "regression": True},
+        {"name": "b", "ratio": 0.9, "regression": False},
+    ]
+
+
+def test_main(tmp_path):
+    output = tmp_path / "results.json"
+    args = ["--filter", "view.*", "--repeat", "1", "--min-time", "0.001"]
+
+    assert main([*args, "--output", str(output)]) == 0
+
+    results = json.loads(output.read_text())
+    assert results["environment"]["django"]
+    assert [item["name"] for item in results["benchmarks"]] == [
+        "view.django_view",
+        "view.wrapped_view",
+        "view.wrapped_view_dict",
+    ]
+
+    for item in results["benchmarks"]:
+        item["min"] /= 100
+    output.write_text(json.dumps(results))
+
+    assert main([*args, "--compare", str(output)]) == 1
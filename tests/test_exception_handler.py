@@ -6,7 +6,7 @@ from django.http import Http404
 from django.test import RequestFactory
 
 from apirouter import Request
-from apirouter.exception_handler import exception_handler
+from apirouter.exception_handler import encode_error, error_response, exception_handler
 from apirouter.exceptions import APIException
 
 
@@ -35,3 +35,39 @@ def test_exception_handler_unhandled(rf: RequestFactory):
         exception_handler(request, Exception("unknown error"))
 
     assert str(exc_info.value) == "unknown error"
+
+
+def test_exception_handler_headers(rf: RequestFactory):
+    request = Request(rf.get("/"))
+    exc = APIException(status_code=429, headers={"Retry-After": "1"})
+
+    response = exception_handler(request, exc)
+
+    assert response.status_code == 429
+    assert response["Retry-After"] == "1"
+    assert response["Content-Type"] == "application/json"
+    assert response.content == b'{"detail": "Too Many Requests"}'
+
+
+def test_exception_handler_structured_detail(rf: RequestFactory):
+    request = Request(rf.get("/"))
+    exc = APIException(status_code=422, detail=[{"loc": ["body"]}])
+
+    response = exception_handler(request, exc)
+
+    assert response.content == b'{"detail": [{"loc": ["body"]}]}'
+
+
+def test_error_response_body_cached():
+    first = error_response(404)
+    second = error_response(404, "Not Found")
+
+    assert first.content is second.content
+
+
+def test_error_body_reset_on_json_backend_change(settings):
+    encode_error(400, "Bad Request")
+
+    settings.APIROUTER_JSON_BACKEND = "apirouter.json_backends.StdlibJSONBackend"
+
+    assert encode_error.cache_info().currsize == 0
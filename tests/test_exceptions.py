@@ -1,3 +1,5 @@
+import pytest
+
 from apirouter.exceptions import APIException
 
 
@@ -5,3 +7,8 @@ def test_api_exception_detail():
     exc = APIException(400)
 
     assert exc.detail == "Bad Request"
+
+
+def test_api_exception_unknown_status():
+    with pytest.raises(ValueError):
+        APIException(999)
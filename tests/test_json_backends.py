@@ -0,0 +1,91 @@
+import datetime
+import uuid
+
+import pytest
+from django.test import RequestFactory, override_settings
+
+from apirouter.exceptions import APIException
+from apirouter.json_backends import (
+    MsgspecBackend,
+    OrjsonBackend,
+    StdlibJSONBackend,
+    UjsonBackend,
+    get_json_backend,
+)
+from apirouter.request import Request
+from apirouter.response import JsonResponse
+
+BACKENDS = [
+    ("json", "apirouter.json_backends.StdlibJSONBackend"),
+    ("orjson", "apirouter.json_backends.OrjsonBackend"),
+    ("ujson", "apirouter.json_backends.UjsonBackend"),
+    ("msgspec", "apirouter.json_backends.MsgspecBackend"),
+]
+
+
+@pytest.fixture(params=BACKENDS, ids=[module for module, _ in BACKENDS])
+def json_backend(request):
+    module, backend_path = request.param
+    pytest.importorskip(module)
+    with override_settings(APIROUTER_JSON_BACKEND=backend_path):
+        yield get_json_backend()
+
+
+def test_default_json_backend():
+    assert isinstance(get_json_backend(), StdlibJSONBackend)
+
+
+@pytest.mark.parametrize(
+    "module,setting,backend_class",
+    [
+        ("orjson", "apirouter.json_backends.OrjsonBackend", OrjsonBackend),
+        ("ujson", "apirouter.json_backends.UjsonBackend", UjsonBackend),
+        ("msgspec", "apirouter.json_backends.MsgspecBackend", MsgspecBackend),
+    ],
+)
+def test_json_backend_setting(module: str, setting: str, backend_class: type):
+    pytest.importorskip(module)
+
+    with override_settings(APIROUTER_JSON_BACKEND=setting):
+        assert isinstance(get_json_backend(), backend_class)
+
+    assert isinstance(get_json_backend(), StdlibJSONBackend)
+
+
+def test_json_backend_dumps_bytes(json_backend):
+    value = uuid.uuid4()
+
+    content = json_backend.dumps({"uuid": value, "date": datetime.date(2020, 1, 1)})
+
+    assert isinstance(content, bytes)
+    assert json_backend.loads(content) == {"uuid": str(value), "date": "2020-01-01"}
+
+
+def test_json_backend_loads_invalid(json_backend):
+    with pytest.raises(ValueError):
+        json_backend.loads(b"{")
+
+
+def test_json_backend_request_json(json_backend, rf: RequestFactory):
+    request = Request(
+        rf.post("/", data='{"a": [1, 2]}', content_type="application/json")
+    )
+
+    assert request.json() == {"a": [1, 2]}
+
+
+def test_json_backend_request_json_invalid(json_backend, rf: RequestFactory):
+    request = Request(rf.post("/", data="{", content_type="application/json"))
+
+    with pytest.raises(APIException) as exc_info:
+        request.json()
+
+    assert exc_info.value.status_code == 400
+
+
+def test_json_backend_response(json_backend):
+    response = JsonResponse({"a": [1, 2]}, status=201)
+
+    assert response.status_code == 201
+    assert response["Content-Type"] == "application/json"
+    assert json_backend.loads(response.content) == {"a": [1, 2]}
@@ -29,6 +29,29 @@ def test_request_getattr_missing(dummy_request: Request):
     )
 
 
+def test_request_slots(dummy_request: Request):
+    assert "_request" in Request.__slots__
+    assert vars(dummy_request) == {}
+
+
+def test_request_setattr(dummy_request: Request):
+    setattr(dummy_request, "csrf_processing_done", True)
+
+    assert getattr(dummy_request, "csrf_processing_done") is True
+
+
+@pytest.mark.parametrize("attr", ["META", "GET", "POST", "COOKIES"])
+def test_request_attributes_delegates(attr: str, rf: RequestFactory):
+    http_request = rf.get("/")
+    request = Request(http_request)
+    value = object()
+
+    setattr(request, attr, value)
+
+    assert getattr(request, attr) is value
+    assert getattr(http_request, attr) is value
+
+
 def test_request_method(rf: RequestFactory):
     request = Request(rf.post("/"))
 
@@ -160,6 +183,12 @@ def test_request_json(rf):
     assert request.json() == {}
 
 
+def test_request_json_cached(rf):
+    request = Request(rf.post("/", data="[]", content_type="application/json"))
+
+    assert request.json() is request.json()
+
+
 def test_request_json_invalid(rf):
     request = Request(rf.post("/", data="{", content_type="application/json"))
 
@@ -204,3 +233,36 @@ def test_request_session_not_available(dummy_request: Request):
         "To use session, please add `django.contrib.sessions` to INSTALLED_APPS "
         "and add `django.contrib.sessions.middleware.SessionMiddleware`"
     )
+
+
+@pytest.mark.parametrize(
+    "body,expected",
+    [
+        (b"[]", []),
+        (b" [ 1 , 2.5, -3e2 ] ", [1, 2.5, -300.0]),
+        (
+            '["café", {"a": [1, {"b": null}]}, true]'.encode(),
+            ["café", {"a": [1, {"b": None}]}, True],
+        ),
+        (
+            b'[12345678901234567890, "x' + b"y" * 100 + b'"]',
+            [12345678901234567890, "x" + "y" * 100],
+        ),
+    ],
+)
+def test_request_iter_json_items(rf: RequestFactory, body: bytes, expected: list):
+    request = Request(rf.post("/", body, content_type="application/json"))
+
+    assert list(request.iter_json_items(chunk_size=3)) == expected
+
+
+@pytest.mark.parametrize(
+    "body", [b"", b"{}", b"[1,]", b"[1 2]", b"[1", b"[1] x", b"[\xff]"]
+)
+def test_request_iter_json_items_invalid(rf: RequestFactory, body: bytes):
+    request = Request(rf.post("/", body, content_type="application/json"))
+
+    with pytest.raises(APIException) as exc_info:
+        list(request.iter_json_items(chunk_size=3))
+
+    assert exc_info.value.status_code == 400
@@ -1,4 +1,14 @@
-from apirouter.response import JsonResponse, Response
+from typing import Any, Iterable
+
+import pytest
+from django.db.models import QuerySet
+
+from apirouter.response import (
+    JsonResponse,
+    Response,
+    StreamingJsonResponse,
+    is_streamable,
+)
 
 
 def test_response_headers():
@@ -11,3 +21,40 @@ def test_json_response_headers():
     response = JsonResponse(None, headers={"x-header": "test"})
 
     assert response["x-header"] == "test"
+
+
+@pytest.mark.parametrize(
+    "data,chunk_size,chunks",
+    [
+        ([], 2, [b"[]"]),
+        ([1, 2], 2, [b"[1,2", b"]"]),
+        ([1, 2, 3], 2, [b"[1,2", b",3]"]),
+        (iter([{"a": 1}]), 10, [b'[{"a": 1}]']),
+    ],
+)
+def test_streaming_json_response(data: Iterable, chunk_size: int, chunks: list):
+    response = StreamingJsonResponse(data, chunk_size=chunk_size)
+
+    assert response["Content-Type"] == "application/json"
+    assert list(response.streaming_content) == chunks
+
+
+def test_streaming_json_response_headers():
+    response = StreamingJsonResponse([], headers={"x-header": "test"})
+
+    assert response["x-header"] == "test"
+
+
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        ((item for item in range(1)), True),
+        (iter([]), True),
+        (QuerySet(), True),
+        ([], False),
+        ({}, False),
+        ("string", False),
+    ],
+)
+def test_is_streamable(content: Any, expected: bool):
+    assert is_streamable(content) is expected